@@ -0,0 +1,80 @@
+import os
+import time
+import tempfile
+import plac
+import pandas as pd
+from loguru import logger
+from src.utils import load_parameters
+from src.synthetic_data import SyntheticDataGenerator
+from src.preprocessing_pipeline import create_preprocessing_pipeline
+from src.model_pipeline import (
+    save_data_artifact,
+    load_data_artifact
+)
+
+
+FORMATS = [
+    ("csv", None),
+    ("parquet", "snappy"),
+    ("parquet", "zstd"),
+    ("feather", None),
+    ("feather", "lz4"),
+]
+
+
+@plac.opt(arg="data_path", help="Path to a raw train_test csv file")
+@plac.opt(arg="parameters_path", help="Path to the parameters.yaml file")
+@plac.opt(arg="n_records", help="Number of synthetic records", type=int)
+def benchmark_artifact_formats(
+    data_path: str = "./titanic-files/dev-data/train_test_raw.csv",
+    parameters_path: str = "./parameters.yaml",
+    n_records: int = 1000000
+):
+    """
+    Compare the size, write time and load time of the train features when
+    saved in each artifact format
+    """
+
+    logger.remove()
+    parameters = load_parameters(parameters_path=parameters_path)
+    uid = parameters["uid"]
+
+    # Generate synthetic data with the distributions of the raw data
+    df = (
+        SyntheticDataGenerator(uid=uid, random_state=0)
+        .fit(pd.read_csv(data_path).drop(parameters["target"], axis=1))
+        .sample(n_records=n_records)
+    )
+    X_features = create_preprocessing_pipeline(
+        pipeline_parameters=parameters["pipeline_parameters"]
+    ).fit_transform(df)
+
+    print(f"{len(X_features)} records x {X_features.shape[1]} features")
+    print(f"{'format':<20}{'size MB':>10}{'write s':>10}{'load s':>10}")
+
+    with tempfile.TemporaryDirectory() as tmp_path:
+        for artifact_format, compression in FORMATS:
+            start = time.perf_counter()
+            outpath = save_data_artifact(
+                df=X_features,
+                artifact_path=tmp_path,
+                name=f"X_train_{compression}",
+                artifact_format=artifact_format,
+                compression=compression
+            )
+            write_seconds = time.perf_counter() - start
+
+            start = time.perf_counter()
+            load_data_artifact(outpath)
+            load_seconds = time.perf_counter() - start
+
+            size = os.path.getsize(outpath) / 1024 ** 2
+            name = f"{artifact_format} ({compression or 'none'})"
+            print(
+                f"{name:<20}{size:>10.1f}{write_seconds:>10.2f}"
+                f"{load_seconds:>10.2f}"
+            )
+
+
+if __name__ == "__main__":
+    plac.call(benchmark_artifact_formats)
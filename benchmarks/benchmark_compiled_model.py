@@ -0,0 +1,86 @@
+import time
+import plac
+import numpy as np
+import pandas as pd
+from loguru import logger
+from sklearn.pipeline import Pipeline
+from sklearn.linear_model import LogisticRegression
+from src.utils import load_parameters
+from src.preprocessing_pipeline import create_preprocessing_pipeline
+from src.serving import compile_model_pipeline
+
+
+def time_calls(func, records: list):
+    """Returns the latency of calling func on each record in microseconds"""
+
+    latencies = []
+    for record in records:
+        start = time.perf_counter()
+        func(record)
+        latencies.append((time.perf_counter() - start) * 1e6)
+
+    return np.array(latencies)
+
+
+@plac.opt(arg="data_path", help="Path to a raw train_test csv file")
+@plac.opt(arg="parameters_path", help="Path to the parameters.yaml file")
+@plac.opt(arg="n_records", help="Number of records to score", type=int)
+def benchmark_compiled_model(
+    data_path: str = "./titanic-files/dev-data/train_test_raw.csv",
+    parameters_path: str = "./parameters.yaml",
+    n_records: int = 500
+):
+    """
+    Compare the latency of scoring single records with the model pipeline and
+    with the compiled model
+    """
+
+    logger.remove()
+    parameters = load_parameters(parameters_path=parameters_path)
+    hyperparameters = parameters["logreg_hyperparameters"]
+
+    # Fit the model pipeline
+    df = pd.read_csv(data_path)
+    X = df.drop(parameters["target"], axis=1)
+    y = df[parameters["target"]]
+
+    model_pipeline = Pipeline(
+        create_preprocessing_pipeline(
+            pipeline_parameters=parameters["pipeline_parameters"]
+        ).steps
+        + [("Model", LogisticRegression(
+            penalty=hyperparameters["penalty"],
+            C=hyperparameters["C"],
+            solver=hyperparameters["solver"],
+            max_iter=hyperparameters["max_iter"]
+        ))]
+    )
+    model_pipeline.fit(X, y)
+    compiled_model = compile_model_pipeline(model_pipeline=model_pipeline)
+
+    # Score single records
+    X_sample = X.sample(n=n_records, replace=True, random_state=0)
+    results = dict(
+        pipeline=time_calls(
+            model_pipeline.predict,
+            [X_sample.iloc[[i]] for i in range(n_records)]
+        ),
+        compiled=time_calls(
+            compiled_model.predict_record,
+            X_sample.to_dict(orient="records")
+        )
+    )
+
+    print(f"Single record latency over {n_records} records (microseconds)")
+    print(f"{'mode':<10}{'p50':>12}{'p99':>12}{'mean':>12}")
+    for mode, latencies in results.items():
+        print(
+            f"{mode:<10}"
+            f"{np.percentile(latencies, 50):>12.1f}"
+            f"{np.percentile(latencies, 99):>12.1f}"
+            f"{latencies.mean():>12.1f}"
+        )
+
+
+if __name__ == "__main__":
+    plac.call(benchmark_compiled_model)
@@ -0,0 +1,74 @@
+import sys
+import statistics
+import subprocess
+import plac
+
+
+# Packages only needed to train models, which scoring shouldn't import
+TRAINING_PACKAGES = [
+    "mlflow",
+    "matplotlib",
+    "seaborn",
+    "yellowbrick",
+    "scikitplot"
+]
+
+
+def import_times(module: str):
+    """
+    Imports module in a new interpreter with python -X importtime and returns
+    the cumulative microseconds taken to import each module it imported
+    """
+
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True
+    )
+
+    times = {}
+    for line in process.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line.split("|")
+        times[name.strip()] = int(cumulative)
+
+    return times
+
+
+@plac.opt(arg="modules", help="Comma separated entry points to import")
+@plac.opt(arg="repeat", help="Number of times to import each", type=int)
+@plac.opt(arg="top", help="Number of the slowest packages to list", type=int)
+def benchmark_import_time(
+    modules: str = "score,serve,main",
+    repeat: int = 5,
+    top: int = 5
+):
+    """
+    Compare the time to import each entry point in a new interpreter and
+    list the slowest packages each imports & the training packages imported
+    """
+
+    print(f"{'module':<10}{'seconds':>10}  slowest packages (seconds)")
+    for module in modules.split(","):
+        runs = [import_times(module) for _ in range(repeat)]
+        seconds = statistics.median(run[module] for run in runs) / 1e6
+
+        # The top level packages imported, e.g. pandas but not pandas.core
+        packages = {
+            name: time for name, time in runs[-1].items()
+            if "." not in name and name != module
+        }
+        slowest = sorted(packages, key=packages.get, reverse=True)[:top]
+        training = [name for name in TRAINING_PACKAGES if name in packages]
+
+        slowest_times = ", ".join(
+            f"{name} {packages[name] / 1e6:.2f}" for name in slowest
+        )
+        print(f"{module:<10}{seconds:>10.3f}  {slowest_times}")
+        print(f"{'':<22}training packages: {training or 'none'}")
+
+
+if __name__ == "__main__":
+    plac.call(benchmark_import_time)
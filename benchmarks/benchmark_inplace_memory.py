@@ -0,0 +1,67 @@
+import gc
+import tracemalloc
+import plac
+import pandas as pd
+from loguru import logger
+from src.utils import load_parameters
+from src.synthetic_data import SyntheticDataGenerator
+from src.preprocessing_pipeline import create_preprocessing_pipeline
+
+
+def peak_memory(preprocessing_pipeline, df: pd.core.frame.DataFrame):
+    """Returns the peak memory allocated while running fit_transform in MB"""
+
+    gc.collect()
+    tracemalloc.start()
+    preprocessing_pipeline.fit_transform(df)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return peak / 1024 ** 2
+
+
+@plac.opt(arg="data_path", help="Path to a raw train_test csv file")
+@plac.opt(arg="parameters_path", help="Path to the parameters.yaml file")
+@plac.opt(arg="n_records", help="Number of synthetic records", type=int)
+def benchmark_inplace_memory(
+    data_path: str = "./titanic-files/dev-data/train_test_raw.csv",
+    parameters_path: str = "./parameters.yaml",
+    n_records: int = 100000
+):
+    """
+    Compare the peak memory of the preprocessing pipeline when copying the
+    dataframe at each step and when processing it in place
+    """
+
+    logger.remove()
+    parameters = load_parameters(parameters_path=parameters_path)
+    uid = parameters["uid"]
+
+    # Generate synthetic data with the distributions of the raw data
+    df = (
+        SyntheticDataGenerator(uid=uid, random_state=0)
+        .fit(pd.read_csv(data_path).drop(parameters["target"], axis=1))
+        .sample(n_records=n_records)
+    )
+    input_memory = df.memory_usage(deep=True).sum() / 1024 ** 2
+
+    results = {
+        mode: peak_memory(
+            create_preprocessing_pipeline(
+                pipeline_parameters=parameters["pipeline_parameters"],
+                inplace=inplace
+            ),
+            df
+        )
+        for mode, inplace in [("copy", False), ("inplace", True)]
+    }
+
+    print(f"Input: {len(df)} records, {input_memory:.1f} MB")
+    for mode, peak in results.items():
+        print(f"{mode:<10}peak {peak:>8.1f} MB")
+    saved = results["copy"] - results["inplace"]
+    print(f"Saved {saved:.1f} MB ({saved / results['copy']:.0%})")
+
+
+if __name__ == "__main__":
+    plac.call(benchmark_inplace_memory)
@@ -0,0 +1,134 @@
+import os
+import sys
+import tempfile
+import plac
+import numpy as np
+import pandas as pd
+from loguru import logger
+from sklearn.pipeline import Pipeline
+from sklearn.linear_model import LogisticRegression
+from src.utils import (
+    load_logger,
+    load_parameters
+)
+from src.preprocessing_pipeline import create_preprocessing_pipeline
+from benchmarks.benchmark_compiled_model import time_calls
+
+
+# The logger configurations to compare, DEBUG outputs a line per
+# preprocessing step per request as every request did before the steps
+# logged at DEBUG level
+CONFIGURATIONS = dict(
+    no_sinks=None,
+    debug=dict(logs_level="DEBUG"),
+    debug_sampled=dict(logs_level="DEBUG", sample_rate=0.01),
+    debug_enqueue=dict(logs_level="DEBUG", enqueue=True),
+    info=dict(logs_level="INFO"),
+    info_enqueue=dict(logs_level="INFO", enqueue=True),
+    info_enqueue_json=dict(logs_level="INFO", enqueue=True, serialize=True)
+)
+
+
+def request_messages(data_path: str, parameters_path: str):
+    """
+    The messages logged while the model pipeline scores a single record,
+    captured at DEBUG level
+    """
+
+    logger.remove()
+    parameters = load_parameters(parameters_path=parameters_path)
+    hyperparameters = parameters["logreg_hyperparameters"]
+
+    df = pd.read_csv(data_path)
+    X = df.drop(parameters["target"], axis=1)
+    y = df[parameters["target"]]
+
+    model_pipeline = Pipeline(
+        create_preprocessing_pipeline(
+            pipeline_parameters=parameters["pipeline_parameters"]
+        ).steps
+        + [("Model", LogisticRegression(
+            penalty=hyperparameters["penalty"],
+            C=hyperparameters["C"],
+            solver=hyperparameters["solver"],
+            max_iter=hyperparameters["max_iter"]
+        ))]
+    )
+    model_pipeline.fit(X, y)
+
+    messages = []
+    logger.add(
+        lambda message: messages.append(
+            (message.record["level"].name, message.record["message"])
+        ),
+        level="DEBUG"
+    )
+    model_pipeline.predict(X.iloc[[0]])
+    logger.remove()
+
+    return messages
+
+
+@plac.opt(arg="data_path", help="Path to a raw train_test csv file")
+@plac.opt(arg="parameters_path", help="Path to the parameters.yaml file")
+@plac.opt(arg="n_requests", help="Number of requests to log", type=int)
+def benchmark_logging(
+    data_path: str = "./titanic-files/dev-data/train_test_raw.csv",
+    parameters_path: str = "./parameters.yaml",
+    n_requests: int = 5000
+):
+    """
+    Compare the time spent logging per request with each logger
+    configuration. Each request logs the messages the model pipeline logs
+    while scoring a single record and the line the model server logs per
+    request. The console output is discarded.
+    """
+
+    messages = request_messages(
+        data_path=data_path,
+        parameters_path=parameters_path
+    )
+
+    def request(request_id):
+        for level, message in messages:
+            logger.log(level, message)
+        logger.bind(status=200, records=1).info(
+            f"POST /invocations request={request_id}"
+        )
+
+    stdout = sys.stdout
+    results = {}
+
+    with tempfile.TemporaryDirectory() as logs_path, \
+            open(os.devnull, "w") as devnull:
+        for name, configuration in CONFIGURATIONS.items():
+            sys.stdout = devnull
+            logger.remove()
+            if configuration is not None:
+                load_logger(
+                    app_name=name,
+                    logs_path=logs_path,
+                    **configuration
+                )
+
+            results[name] = time_calls(request, range(n_requests))
+            logger.complete()
+            logger.remove()
+            sys.stdout = stdout
+
+    print(
+        f"Logging time per request over {n_requests} requests, each logging "
+        f"{len(messages)} pipeline messages & 1 request line (microseconds)"
+    )
+    print(f"{'logger':<20}{'p50':>12}{'p99':>12}{'mean':>12}")
+    for name, latencies in results.items():
+        print(
+            f"{name:<20}"
+            f"{np.percentile(latencies, 50):>12.1f}"
+            f"{np.percentile(latencies, 99):>12.1f}"
+            f"{latencies.mean():>12.1f}"
+        )
+
+
+if __name__ == "__main__":
+    plac.call(benchmark_logging)
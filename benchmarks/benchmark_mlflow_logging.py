@@ -0,0 +1,74 @@
+import time
+import tempfile
+import plac
+import mlflow
+from loguru import logger
+from src.tracking import BatchLogger
+
+
+def log_run(log_param, log_metric, n_params: int, n_metrics: int):
+    """Logs n_params params & n_metrics metrics to the active run"""
+
+    for i in range(n_params):
+        log_param(f"param_{i}", i)
+    for i in range(n_metrics):
+        log_metric(f"metric_{i}", float(i))
+
+
+@plac.opt(arg="n_params", help="Params to log per run", type=int, abbrev="p")
+@plac.opt(arg="n_metrics", help="Metrics to log per run", type=int, abbrev="m")
+@plac.opt(arg="n_runs", help="Runs to log", type=int, abbrev="r")
+def benchmark_mlflow_logging(
+    n_params: int = 20,
+    n_metrics: int = 30,
+    n_runs: int = 5
+):
+    """
+    Compare the wall time spent logging to a sqlite tracking store by the
+    mlflow functions and by the BatchLogger
+    """
+
+    logger.remove()
+
+    with tempfile.TemporaryDirectory() as tmp_path:
+        mlflow.set_tracking_uri(f"sqlite:///{tmp_path}/benchmark.db")
+        mlflow.set_experiment("benchmark")
+        batch_logger = BatchLogger()
+        results = dict(mlflow=0.0, batch_logger=0.0, batch_logger_flush=0.0)
+
+        for _ in range(n_runs):
+            with mlflow.start_run():
+                start = time.perf_counter()
+                log_run(
+                    mlflow.log_param,
+                    mlflow.log_metric,
+                    n_params,
+                    n_metrics
+                )
+                results["mlflow"] += time.perf_counter() - start
+
+            with mlflow.start_run():
+                start = time.perf_counter()
+                log_run(
+                    batch_logger.log_param,
+                    batch_logger.log_metric,
+                    n_params,
+                    n_metrics
+                )
+                results["batch_logger"] += time.perf_counter() - start
+                batch_logger.flush()
+                results["batch_logger_flush"] += time.perf_counter() - start
+
+    calls = n_runs * (n_params + n_metrics)
+    print(f"{calls} calls over {n_runs} runs")
+    print(f"mlflow functions        {results['mlflow']:>8.3f}s")
+    print(f"BatchLogger (caller)    {results['batch_logger']:>8.3f}s")
+    print(f"BatchLogger (+ flush)   {results['batch_logger_flush']:>8.3f}s")
+    print(
+        f"Saved {results['mlflow'] - results['batch_logger']:.3f}s on the "
+        f"calling thread"
+    )
+
+
+if __name__ == "__main__":
+    plac.call(benchmark_mlflow_logging)
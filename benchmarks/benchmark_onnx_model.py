@@ -0,0 +1,95 @@
+import os
+import time
+import tempfile
+import plac
+import numpy as np
+import pandas as pd
+from loguru import logger
+from sklearn.pipeline import Pipeline
+from sklearn.linear_model import LogisticRegression
+from src.utils import load_parameters
+from src.preprocessing_pipeline import create_preprocessing_pipeline
+from src.serving import (
+    export_onnx_model,
+    OnnxModel
+)
+
+
+def time_calls(func, batches: list):
+    """Returns the latency of calling func on each batch in microseconds"""
+
+    latencies = []
+    for batch in batches:
+        start = time.perf_counter()
+        func(batch)
+        latencies.append((time.perf_counter() - start) * 1e6)
+
+    return np.array(latencies)
+
+
+@plac.opt(arg="data_path", help="Path to a raw train_test csv file")
+@plac.opt(arg="parameters_path", help="Path to the parameters.yaml file")
+@plac.opt(arg="n_calls", help="Number of calls per batch size", type=int)
+@plac.opt(arg="batch_sizes", help="Comma separated records per call")
+def benchmark_onnx_model(
+    data_path: str = "./titanic-files/dev-data/train_test_raw.csv",
+    parameters_path: str = "./parameters.yaml",
+    n_calls: int = 200,
+    batch_sizes: str = "1,100,10000"
+):
+    """
+    Compare the latency of scoring batches of records with the model pipeline
+    and with the model exported to ONNX via ONNX Runtime
+    """
+
+    logger.remove()
+    parameters = load_parameters(parameters_path=parameters_path)
+    hyperparameters = parameters["logreg_hyperparameters"]
+
+    # Fit the model pipeline & export it to ONNX
+    df = pd.read_csv(data_path)
+    X = df.drop(parameters["target"], axis=1)
+    y = df[parameters["target"]]
+
+    model_pipeline = Pipeline(
+        create_preprocessing_pipeline(
+            pipeline_parameters=parameters["pipeline_parameters"]
+        ).steps
+        + [("Model", LogisticRegression(
+            penalty=hyperparameters["penalty"],
+            C=hyperparameters["C"],
+            solver=hyperparameters["solver"],
+            max_iter=hyperparameters["max_iter"]
+        ))]
+    )
+    model_pipeline.fit(X, y)
+
+    with tempfile.TemporaryDirectory() as tmp_path:
+        path = os.path.join(tmp_path, "model.onnx")
+        export_onnx_model(model_pipeline=model_pipeline, path=path)
+        onnx_model = OnnxModel(path)
+
+    # Score batches of records, fewer of the largest
+    print(f"Latency per call (microseconds)")
+    print(f"{'mode':<10}{'records':>10}{'p50':>12}{'p99':>12}{'mean':>12}")
+    for batch_size in [int(size) for size in batch_sizes.split(",")]:
+        n_batches = max(min(n_calls, 200000 // batch_size), 5)
+        batches = [
+            X.sample(n=batch_size, replace=True, random_state=i)
+            for i in range(n_batches)
+        ]
+        results = dict(
+            pipeline=time_calls(model_pipeline.predict_proba, batches),
+            onnx=time_calls(onnx_model.predict_proba, batches)
+        )
+        for mode, latencies in results.items():
+            print(
+                f"{mode:<10}{batch_size:>10}"
+                f"{np.percentile(latencies, 50):>12.1f}"
+                f"{np.percentile(latencies, 99):>12.1f}"
+                f"{latencies.mean():>12.1f}"
+            )
+
+
+if __name__ == "__main__":
+    plac.call(benchmark_onnx_model)
@@ -0,0 +1,92 @@
+import os
+import time
+import tempfile
+import plac
+import pandas as pd
+from loguru import logger
+from pandas.testing import assert_frame_equal
+from src.utils import load_parameters
+from src.synthetic_data import SyntheticDataGenerator
+from src.preprocessing_pipeline import (
+    create_preprocessing_pipeline,
+    create_polars_pipeline
+)
+
+
+def time_call(func):
+    """Returns the result of calling func & the seconds it took"""
+
+    start = time.perf_counter()
+    result = func()
+
+    return result, time.perf_counter() - start
+
+
+@plac.opt(arg="data_path", help="Path to a raw train_test csv file")
+@plac.opt(arg="parameters_path", help="Path to the parameters.yaml file")
+@plac.opt(arg="sizes", help="Comma separated numbers of records")
+def benchmark_polars_pipeline(
+    data_path: str = "./titanic-files/dev-data/train_test_raw.csv",
+    parameters_path: str = "./parameters.yaml",
+    sizes: str = "100000,1000000"
+):
+    """
+    Compare the throughput of preprocessing a csv file of synthetic records
+    with the pandas pipeline and with the pipeline run by Polars, checking
+    both create the same features
+    """
+
+    import polars as pl
+
+    logger.remove()
+    parameters = load_parameters(parameters_path=parameters_path)
+    target = parameters["target"]
+
+    # Fit the preprocessing pipeline & translate it to polars
+    df = pd.read_csv(data_path)
+    preprocessing_pipeline = create_preprocessing_pipeline(
+        pipeline_parameters=parameters["pipeline_parameters"]
+    ).fit(df.drop(target, axis=1))
+    polars_pipeline = create_polars_pipeline(preprocessing_pipeline)
+    generator = SyntheticDataGenerator(
+        uid=parameters["uid"],
+        target=target,
+        random_state=0
+    ).fit(df)
+
+    print(f"Polars threads: {pl.thread_pool_size()}")
+    print(f"{'mode':<16}{'records':>10}{'seconds':>10}{'records/s':>12}")
+    for n_records in [int(size) for size in sizes.split(",")]:
+        with tempfile.TemporaryDirectory() as tmp_path:
+            path = os.path.join(tmp_path, "holdout_raw.csv")
+            generator.sample(n_records=n_records).drop(
+                target,
+                axis=1
+            ).to_csv(path, index=False)
+
+            X = pd.read_csv(path)
+            pandas_features, pandas_seconds = time_call(
+                lambda: preprocessing_pipeline.transform(pd.read_csv(path))
+            )
+            results = dict(
+                pandas=pandas_seconds,
+                polars=time_call(lambda: polars_pipeline.transform(X))[1],
+                polars_csv=time_call(
+                    lambda: polars_pipeline.transform_csv(path)
+                )[1]
+            )
+            assert_frame_equal(
+                polars_pipeline.transform_csv(path),
+                pandas_features
+            )
+
+        # The pandas & polars_csv modes include reading the csv file
+        for mode, seconds in results.items():
+            print(
+                f"{mode:<16}{n_records:>10}{seconds:>10.3f}"
+                f"{n_records / seconds:>12.0f}"
+            )
+
+
+if __name__ == "__main__":
+    plac.call(benchmark_polars_pipeline)
@@ -0,0 +1,63 @@
+import os
+import time
+import tempfile
+import plac
+import pandas as pd
+from loguru import logger
+from src.utils import load_parameters
+from src.synthetic_data import SyntheticDataGenerator
+from src.ingest_split import (
+    read_raw_csv,
+    memory_usage_report
+)
+
+
+@plac.opt(arg="data_path", help="Path to a raw train_test csv file")
+@plac.opt(arg="parameters_path", help="Path to the parameters.yaml file")
+@plac.opt(arg="n_records", help="Number of synthetic records", type=int)
+def benchmark_typed_ingestion(
+    data_path: str = "./titanic-files/dev-data/train_test_raw.csv",
+    parameters_path: str = "./parameters.yaml",
+    n_records: int = 1000000
+):
+    """
+    Compare the read time and memory of each column of the raw data when its
+    dtypes are inferred by the c engine and when the dtype schema is applied
+    by the c & pyarrow engines
+    """
+
+    logger.remove()
+    parameters = load_parameters(parameters_path=parameters_path)
+    dtypes = parameters["ingest_split_parameters"]["dtypes"]
+
+    with tempfile.TemporaryDirectory() as tmp_path:
+        # Generate synthetic data with the distributions of the raw data
+        scaled_path = f"{tmp_path}/train_test_raw.csv"
+        SyntheticDataGenerator(
+            uid=parameters["uid"],
+            target=parameters["target"],
+            random_state=0
+        ).fit(pd.read_csv(data_path)).write_csv(scaled_path, n_records)
+        size = os.path.getsize(scaled_path) / 1024 ** 2
+        print(f"Input: {n_records} records, {size:.1f} MB csv")
+
+        reads = dict(
+            inferred=dict(dtypes=None, engine="c"),
+            typed_c=dict(dtypes=dtypes, engine="c"),
+            typed_pyarrow=dict(dtypes=dtypes, engine="pyarrow")
+        )
+        results = {}
+        for name, kwargs in reads.items():
+            start = time.perf_counter()
+            results[name] = read_raw_csv(scaled_path, **kwargs)
+            print(f"{name:<15}read {time.perf_counter() - start:>6.2f}s")
+
+    pd.set_option("display.width", 120)
+    print(memory_usage_report(
+        df_before=results["inferred"],
+        df_after=results["typed_pyarrow"]
+    ).round(3))
+
+
+if __name__ == "__main__":
+    plac.call(benchmark_typed_ingestion)
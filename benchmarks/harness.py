@@ -0,0 +1,191 @@
+import os
+import sys
+import json
+import math
+import time
+import platform
+import statistics
+import subprocess
+from datetime import datetime
+import pandas as pd
+
+
+# The registered benchmarks, in the order they were registered
+BENCHMARKS = {}
+
+
+def benchmark(name: str, sizes: list = None, max_records: int = None):
+    """
+    Registers a benchmark. The decorated function is called with the number
+    of records & a temporary directory and returns the function to time.
+    Benchmarks with sizes are only run at those sizes, otherwise they're run
+    at each of the sizes supplied to run_benchmarks up to max_records.
+    """
+
+    def register(setup):
+        BENCHMARKS[name] = dict(
+            setup=setup,
+            sizes=sizes,
+            max_records=max_records
+        )
+        return setup
+
+    return register
+
+
+def time_callable(func, repeat: int = 5, min_round_seconds: float = 0.01):
+    """
+    Times func over repeat rounds after a warm up call. Fast functions are
+    called several times per round so each round takes at least
+    min_round_seconds. Returns the statistics of the seconds per call.
+    """
+
+    start = time.perf_counter()
+    func()
+    warm_up = time.perf_counter() - start
+    number = max(1, math.ceil(min_round_seconds / max(warm_up, 1e-9)))
+
+    rounds = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        rounds.append((time.perf_counter() - start) / number)
+
+    return dict(
+        repeat=repeat,
+        number=number,
+        min=min(rounds),
+        median=statistics.median(rounds),
+        mean=statistics.mean(rounds),
+        stdev=statistics.stdev(rounds) if repeat > 1 else 0.0
+    )
+
+
+def run_benchmarks(
+    sizes: list,
+    tmp_path: str,
+    select: str = None,
+    repeat: int = 5
+):
+    """
+    Runs each registered benchmark whose name contains select at each size
+    and returns a result per benchmark & size
+    """
+
+    results = []
+
+    for name, registered in BENCHMARKS.items():
+        if select is not None and select not in name:
+            continue
+
+        for n_records in registered["sizes"] or sizes:
+            if n_records > (registered["max_records"] or n_records):
+                continue
+
+            func = registered["setup"](n_records, tmp_path)
+            stats = time_callable(func, repeat=repeat)
+            results.append(dict(
+                name=name,
+                n_records=n_records,
+                records_per_second=n_records / stats["median"],
+                **stats
+            ))
+            print(
+                f"{name:<55}{n_records:>10}{stats['median']:>12.5f}s"
+                f"{n_records / stats['median']:>14.0f} records/s",
+                file=sys.stderr
+            )
+
+    return results
+
+
+def _git(*args):
+    """Returns the output of a git command or None outside a repository"""
+
+    try:
+        return subprocess.run(
+            ["git", *args],
+            capture_output=True,
+            text=True,
+            check=True
+        ).stdout.strip()
+
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def git_commit():
+    """Returns the current commit or None outside a repository"""
+
+    return _git("rev-parse", "HEAD")
+
+
+def save_results(results: list, path: str):
+    """Saves the results with the commit & environment they were run in"""
+
+    import numpy
+    import sklearn
+    import mlflow
+
+    document = dict(
+        commit=git_commit(),
+        dirty=bool(_git("status", "--porcelain", "--untracked-files=no")),
+        timestamp=datetime.now().isoformat(timespec="seconds"),
+        machine=dict(
+            platform=platform.platform(),
+            python=platform.python_version(),
+            processor=platform.processor(),
+            cpu_count=os.cpu_count()
+        ),
+        versions=dict(
+            pandas=pd.__version__,
+            numpy=numpy.__version__,
+            sklearn=sklearn.__version__,
+            mlflow=mlflow.__version__
+        ),
+        benchmarks=results
+    )
+
+    with open(path, "w") as stream:
+        json.dump(document, stream, indent=2)
+
+    return document
+
+
+def load_results(path: str):
+    """Loads the results saved via save_results as a dataframe"""
+
+    with open(path) as stream:
+        document = json.load(stream)
+
+    return pd.DataFrame(document["benchmarks"]).set_index(
+        ["name", "n_records"]
+    )
+
+
+def compare_results(
+    baseline: pd.core.frame.DataFrame,
+    current: pd.core.frame.DataFrame,
+    threshold: float = 0.2
+):
+    """
+    Compares the median time of each benchmark & size in both results. A
+    benchmark is a regression when it's more than threshold slower than the
+    baseline and an improvement when it's more than threshold faster.
+    """
+
+    comparison = pd.DataFrame(dict(
+        baseline=baseline["median"],
+        current=current["median"]
+    )).dropna()
+    comparison["ratio"] = comparison["current"] / comparison["baseline"]
+    comparison["change"] = "-"
+    comparison.loc[
+        comparison["ratio"] > 1 + threshold, "change"
+    ] = "regression"
+    comparison.loc[
+        comparison["ratio"] < 1 / (1 + threshold), "change"
+    ] = "improvement"
+
+    return comparison
@@ -0,0 +1,303 @@
+import sys
+import tempfile
+from pathlib import Path
+from datetime import datetime
+from functools import lru_cache
+import plac
+import mlflow
+import mlflow.sklearn
+import pandas as pd
+from loguru import logger
+from sklearn.base import clone
+from sklearn.pipeline import Pipeline
+from src.utils import load_parameters
+from src.synthetic_data import SyntheticDataGenerator
+from src.preprocessing_pipeline import (
+    TRANSFORMS,
+    create_preprocessing_pipeline,
+    impute_missing_values,
+    scaler,
+    one_hot_encoder
+)
+from src.models import create_logreg_model
+from src.model_pipeline import evaluate_model
+from src.serving import compile_model_pipeline
+from src.tracking import start_run
+from benchmarks.benchmark_import_time import import_times
+from benchmarks.harness import (
+    benchmark,
+    run_benchmarks,
+    git_commit,
+    save_results,
+    load_results,
+    compare_results
+)
+
+commands = "run", "compare"
+
+DATA_PATH = "./titanic-files/dev-data/train_test_raw.csv"
+PARAMETERS_PATH = "./parameters.yaml"
+RESULTS_PATH = "./benchmarks/results"
+
+
+@lru_cache()
+def parameters():
+    """The parameters the benchmarks are run with"""
+
+    return load_parameters(parameters_path=PARAMETERS_PATH)
+
+
+@lru_cache()
+def raw_data(n_records: int):
+    """n_records of synthetic raw data, split into features & target"""
+
+    df = (
+        SyntheticDataGenerator(
+            uid=parameters()["uid"],
+            target=parameters()["target"],
+            random_state=0
+        )
+        .fit(pd.read_csv(DATA_PATH))
+        .sample(n_records=n_records)
+    )
+    target = parameters()["target"]
+
+    return df.drop(target, axis=1), df[[target]]
+
+
+@lru_cache()
+def step_inputs(n_records: int):
+    """The data passed to each step of the preprocessing pipeline"""
+
+    X, _ = raw_data(n_records)
+    inputs = {}
+
+    for name, step in create_preprocessing_pipeline(
+        pipeline_parameters=parameters()["pipeline_parameters"]
+    ).steps:
+        inputs[name] = X
+        X = step.fit_transform(X)
+
+    return inputs
+
+
+@lru_cache()
+def saved_model(tmp_path: str):
+    """A logistic regression model pipeline saved & loaded via MLFlow"""
+
+    X, y = raw_data(10000)
+    model, _, _ = create_logreg_model(
+        logreg_hyperparameters=parameters()["logreg_hyperparameters"]
+    )
+    model_pipeline = Pipeline(
+        create_preprocessing_pipeline(
+            pipeline_parameters=parameters()["pipeline_parameters"]
+        ).steps
+        + [("Model", model)]
+    )
+    model_pipeline.fit(X, y.values.ravel())
+
+    models_path = f"{tmp_path}/model"
+    mlflow.sklearn.save_model(sk_model=model_pipeline, path=models_path)
+
+    return mlflow.sklearn.load_model(models_path)
+
+
+def transform_benchmark(func, step: str, kw_args: str):
+    """Benchmarks a transform function on the input of its pipeline step"""
+
+    def setup(n_records: int, tmp_path: str):
+        df = step_inputs(n_records)[step]
+        kwargs = parameters()["pipeline_parameters"][kw_args]
+        return lambda: func(df, **kwargs)
+
+    return setup
+
+
+# The row-wise transforms are only retained as a reference so aren't run on
+# larger data
+ROWWISE_MAX_RECORDS = 10000
+
+# The functions the estimators of the pipeline were created from, which
+# aren't registered transforms
+ESTIMATOR_FUNCTIONS = [
+    (impute_missing_values, "impute_missing_values"),
+    (scaler, "scaler"),
+    (one_hot_encoder, "one_hot_encoder")
+]
+
+# Each function implementing a registered transform, for every engine
+FUNCTIONS = [
+    (implementation, name)
+    for name, transform in TRANSFORMS.items()
+    for implementation in transform["implementations"].values()
+    if not isinstance(implementation, type)
+] + ESTIMATOR_FUNCTIONS
+
+for func, name in FUNCTIONS:
+    transform = TRANSFORMS[name]
+    benchmark(
+        f"{func.__module__.split('.')[-1]}.{func.__name__}",
+        max_records=(
+            ROWWISE_MAX_RECORDS
+            if func is transform["implementations"].get("rowwise")
+            else None
+        )
+    )(transform_benchmark(
+        func=func,
+        step=transform["description"],
+        kw_args=transform["kw_args"]
+    ))
+
+
+@benchmark("preprocessing_pipeline.fit_transform")
+def preprocessing_pipeline_fit_transform(n_records: int, tmp_path: str):
+    X, _ = raw_data(n_records)
+    preprocessing_pipeline = create_preprocessing_pipeline(
+        pipeline_parameters=parameters()["pipeline_parameters"]
+    )
+    return lambda: clone(preprocessing_pipeline).fit_transform(X)
+
+
+@benchmark("preprocessing_pipeline.transform")
+def preprocessing_pipeline_transform(n_records: int, tmp_path: str):
+    X, _ = raw_data(n_records)
+    preprocessing_pipeline = create_preprocessing_pipeline(
+        pipeline_parameters=parameters()["pipeline_parameters"]
+    ).fit(X)
+    return lambda: preprocessing_pipeline.transform(X)
+
+
+@benchmark("model_pipeline.evaluate_model")
+def model_pipeline_evaluate_model(n_records: int, tmp_path: str):
+    X, y = raw_data(n_records)
+    split = n_records // 2
+    model, _, cv = create_logreg_model(
+        logreg_hyperparameters=parameters()["logreg_hyperparameters"]
+    )
+    artifact_path = Path(tmp_path) / f"evaluate_{n_records}"
+    artifact_path.mkdir(exist_ok=True)
+
+    def run():
+        with start_run(nested=mlflow.active_run() is not None):
+            evaluate_model(
+                preprocessing_pipeline=create_preprocessing_pipeline(
+                    pipeline_parameters=parameters()["pipeline_parameters"]
+                ),
+                model=clone(model),
+                X_train=X.iloc[:split],
+                y_train=y.iloc[:split],
+                X_test=X.iloc[split:],
+                y_test=y.iloc[split:],
+                artifact_path=str(artifact_path),
+                cv=cv,
+                metrics_only=True,
+                artifact_format="parquet"
+            )
+
+    return run
+
+
+@benchmark("saved_model.predict_single_record", sizes=[1])
+def saved_model_predict_single_record(n_records: int, tmp_path: str):
+    X, _ = raw_data(1000)
+    model_pipeline = saved_model(tmp_path)
+    record = X.iloc[[0]]
+    return lambda: model_pipeline.predict(record)
+
+
+@benchmark("saved_model.predict_batch")
+def saved_model_predict_batch(n_records: int, tmp_path: str):
+    X, _ = raw_data(n_records)
+    model_pipeline = saved_model(tmp_path)
+    return lambda: model_pipeline.predict(X)
+
+
+@benchmark("compiled_model.predict_single_record", sizes=[1])
+def compiled_model_predict_single_record(n_records: int, tmp_path: str):
+    X, _ = raw_data(1000)
+    compiled_model = compile_model_pipeline(saved_model(tmp_path))
+    record = X.iloc[0].to_dict()
+    return lambda: compiled_model.predict_record(record)
+
+
+@benchmark("import.score", sizes=[1])
+def import_score(n_records: int, tmp_path: str):
+    return lambda: import_times("score")
+
+
+@benchmark("import.serve", sizes=[1])
+def import_serve(n_records: int, tmp_path: str):
+    return lambda: import_times("serve")
+
+
+@plac.opt(arg="sizes", help="Comma separated numbers of records")
+@plac.opt(
+    arg="select",
+    help="Only run benchmarks whose name contains this",
+    abbrev="k"
+)
+@plac.opt(arg="repeat", help="Number of timed rounds", type=int)
+@plac.opt(arg="output_path", help="Path to the output json file")
+def run(
+    sizes: str = "1000,10000,100000",
+    select: str = None,
+    repeat: int = 5,
+    output_path: str = None
+):
+    """
+    Run the benchmarks at each size and save the results as json, by default
+    in benchmarks/results named after the time & commit
+    """
+
+    logger.remove()
+
+    with tempfile.TemporaryDirectory() as tmp_path:
+        mlflow.set_tracking_uri(f"sqlite:///{tmp_path}/benchmark.db")
+        mlflow.set_experiment("benchmark")
+
+        with start_run():
+            results = run_benchmarks(
+                sizes=[int(size) for size in sizes.split(",")],
+                tmp_path=tmp_path,
+                select=select,
+                repeat=repeat
+            )
+
+    if output_path is None:
+        Path(RESULTS_PATH).mkdir(parents=True, exist_ok=True)
+        output_path = (
+            f"{RESULTS_PATH}/{datetime.now():%Y%m%d-%H%M%S}_"
+            f"{(git_commit() or 'unknown')[:8]}.json"
+        )
+
+    save_results(results=results, path=output_path)
+    print(f"Saved {len(results)} results to {output_path}")
+
+
+@plac.pos(arg="baseline_path", help="Path to the baseline results")
+@plac.pos(arg="current_path", help="Path to the current results")
+@plac.opt(arg="threshold", help="Slowdown which is a regression", type=float)
+def compare(baseline_path: str, current_path: str, threshold: float = 0.2):
+    """
+    Compare the median times of two sets of results and exit with an error
+    if any benchmark is more than threshold slower than the baseline
+    """
+
+    comparison = compare_results(
+        baseline=load_results(baseline_path),
+        current=load_results(current_path),
+        threshold=threshold
+    )
+
+    pd.set_option("display.width", 120)
+    print(comparison.round(5).to_string())
+
+    regressions = comparison[comparison["change"] == "regression"]
+    if len(regressions):
+        print(f"{len(regressions)} regressions over {threshold:.0%}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    plac.call(sys.modules[__name__])
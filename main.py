@@ -1,25 +1,74 @@
+import sys
+from pathlib import Path
 import plac
+import pandas as pd
 import mlflow
 from src.utils import (
     load_config,
     load_logger,
     load_parameters
 )
-from src.ingest_split import ingest_split
-from src.preprocessing_pipeline import create_preprocessing_pipeline
+from src.ingest_split import (
+    ingest_split,
+    iter_raw_csv
+)
+from src.preprocessing_pipeline import (
+    create_preprocessing_pipeline,
+    log_step_metrics
+)
+from src.feature_cache import (
+    create_cache_key,
+    FeatureCache
+)
 from src.models import (
     create_logreg_model,
-    create_svc_model
+    create_svc_model,
+    create_sgd_model
 )
 from src.model_pipeline import (
     evaluate_model,
-    create_model_pipeline
+    evaluate_model_incremental,
+    create_model_pipeline,
+    search_hyperparameters,
+    run_tournament
 )
+from src.serving import (
+    get_deployed_model,
+    set_deployed_model,
+    score_model
+)
+from src.synthetic_data import SyntheticDataGenerator
+from src.tracking import start_run
+
+commands = "run", "score", "generate"
 
 
 @plac.flg(arg="deploy", help="Stage a model for deployment", abbrev="dep")
-def run(deploy: bool = False):
-    """Run the end-to-end pipeline"""
+@plac.flg(arg="search", help="Search for the best hyperparameters")
+@plac.flg(arg="metrics_only", help="Skip the visualisations", abbrev="m")
+@plac.flg(
+    arg="incremental",
+    help="Train an SGD model on the data in chunks",
+    abbrev="inc"
+)
+@plac.flg(
+    arg="tournament",
+    help="Train each model family & pick the best",
+    abbrev="t"
+)
+def run(
+    deploy: bool = False,
+    search: bool = False,
+    metrics_only: bool = False,
+    incremental: bool = False,
+    tournament: bool = False
+):
+    """
+    Run the end-to-end pipeline. With --incremental an SGD model is trained
+    & evaluated on the raw data in chunks, so data larger than memory can be
+    used. With --tournament a model of each family in tournament_parameters
+    is trained in parallel and the best is evaluated & deployed.
+    """
 
     # Load config, logger & parameters
     config = load_config(".env.dev")
@@ -34,12 +83,20 @@ def run(deploy: bool = False):
     mlflow.set_experiment(config["mlflow_experiment"])
 
     # Start MLFlow Tracking
-    with mlflow.start_run():
+    with start_run():
 
         # Configure MLFlow
         mlflow.set_tracking_uri(config["mlflow_tracking_uri"])
         mlflow.set_experiment(config["mlflow_experiment"])
 
+        if incremental:
+            _run_incremental(
+                config=config,
+                parameters=parameters,
+                deploy=deploy
+            )
+            return
+
         # Ingest & split the data
         X_train, X_test, y_train, y_test, X_holdout = ingest_split(
             train_test_raw_path=config["train_test_raw_path"],
@@ -50,15 +107,89 @@ def run(deploy: bool = False):
 
         # Create the preprocessing pipeline
         preprocessing_pipeline = create_preprocessing_pipeline(
-            pipeline_parameters=parameters["pipeline_parameters"]
+            pipeline_parameters=parameters["pipeline_parameters"],
+            **parameters["preprocessing_parameters"]
         )
 
-        # Create a model with hyperparameters
-        model, model_name, cv = create_logreg_model(
-            logreg_hyperparameters=parameters["logreg_hyperparameters"]
+        # Load the train, test & holdout features from the cache or create &
+        # cache them
+        feature_cache = FeatureCache(
+            **parameters["feature_cache_parameters"]
         )
+        features = feature_cache.get_features(
+            key=create_cache_key(
+                data_paths=[
+                    config["train_test_raw_path"],
+                    config["holdout_raw_path"]
+                ],
+                parameters=dict(
+                    target=parameters["target"],
+                    ingest_split_parameters=(
+                        parameters["ingest_split_parameters"]
+                    ),
+                    pipeline_parameters=parameters["pipeline_parameters"],
+                    preprocessing_parameters=(
+                        parameters["preprocessing_parameters"]
+                    )
+                )
+            ),
+            preprocessing_pipeline=preprocessing_pipeline,
+            X_train=X_train,
+            X_test=X_test,
+            X_holdout=X_holdout
+        )
+        preprocessing_pipeline = features["preprocessing_pipeline"]
+
+        # Log the time, rows & memory of each preprocessing step, if the
+        # features weren't loaded from the cache
+        log_step_metrics(preprocessing_pipeline)
+
+        if tournament:
+            # Create a model of the family that scores best on the features
+            tournament_parameters = parameters["tournament_parameters"]
+            model_family, model, model_name, cv = run_tournament(
+                hyperparameters={
+                    model_family: parameters[
+                        f"{model_family}_hyperparameters"
+                    ]
+                    for model_family in tournament_parameters["model_families"]
+                },
+                X_train_features=features["X_train_features"],
+                y_train=y_train,
+                X_test_features=features["X_test_features"],
+                y_test=y_test,
+                metric=tournament_parameters["metric"],
+                n_jobs=parameters["evaluate_model_parameters"]["n_jobs"]
+            )
+
+        else:
+            # Create a model with hyperparameters
+            model_family = "logreg"
+            model, model_name, cv = create_logreg_model(
+                logreg_hyperparameters=parameters["logreg_hyperparameters"]
+            )
+
+        if search:
+            # Replace the hyperparameters with the best found by the search
+            model = search_hyperparameters(
+                preprocessing_pipeline=preprocessing_pipeline,
+                model=model,
+                model_name=model_name,
+                X_train=X_train,
+                y_train=y_train,
+                search_space=(
+                    parameters["search_parameters"][
+                        f"{model_family}_search_space"
+                    ]
+                ),
+                search_parameters=parameters["search_parameters"],
+                cv=cv,
+                n_jobs=parameters["evaluate_model_parameters"]["n_jobs"],
+                X_train_features=features["X_train_features"]
+            )
 
         # Evaluate the model
+        evaluate_model_parameters = parameters["evaluate_model_parameters"]
         model = evaluate_model(
             preprocessing_pipeline=preprocessing_pipeline,
             model=model,
@@ -67,7 +198,18 @@ def run(deploy: bool = False):
             X_test=X_test,
             y_test=y_test,
             artifact_path=config["artifact_path"],
-            cv=cv
+            cv=cv,
+            n_jobs=evaluate_model_parameters["n_jobs"],
+            X_train_features=features["X_train_features"],
+            X_test_features=features["X_test_features"],
+            metrics_only=(
+                metrics_only or evaluate_model_parameters["metrics_only"]
+            ),
+            plot_cache_path=evaluate_model_parameters["plot_cache_path"],
+            artifact_format=evaluate_model_parameters["artifact_format"],
+            artifact_compression=(
+                evaluate_model_parameters["artifact_compression"]
+            )
         )
 
         if deploy:
@@ -78,11 +220,159 @@ def run(deploy: bool = False):
                 model_name=model_name,
                 X_train=X_train,
                 artifact_path=config["artifact_path"],
-                models_path=f"{config['models_path']}/{model_name}/"
+                models_path=f"{config['models_path']}/{model_name}/",
+                **parameters["model_pipeline_parameters"]
+            )
+            set_deployed_model(
+                models_path=config["models_path"],
+                model_name=model_name
             )
 
         mlflow.end_run()
 
 
+def _run_incremental(config: dict, parameters: dict, deploy: bool):
+    """Train & evaluate an SGD model on the raw data in chunks"""
+
+    sgd_hyperparameters = parameters["sgd_hyperparameters"]
+    incremental_parameters = parameters["incremental_parameters"]
+
+    # Create the preprocessing pipeline & a model with hyperparameters
+    preprocessing_pipeline = create_preprocessing_pipeline(
+        pipeline_parameters=parameters["pipeline_parameters"],
+        **parameters["preprocessing_parameters"]
+    )
+    model, model_name, cv = create_sgd_model(
+        sgd_hyperparameters=sgd_hyperparameters
+    )
+
+    # Fit & evaluate the model over chunks of the data
+    model = evaluate_model_incremental(
+        preprocessing_pipeline=preprocessing_pipeline,
+        model=model,
+        train_test_raw_path=config["train_test_raw_path"],
+        target=parameters["target"],
+        uid=parameters["uid"],
+        ingest_split_parameters=parameters["ingest_split_parameters"],
+        chunk_size=incremental_parameters["chunk_size"],
+        n_epochs=sgd_hyperparameters["max_iter"],
+        n_bins=incremental_parameters["n_bins"]
+    )
+    log_step_metrics(preprocessing_pipeline)
+
+    if deploy:
+        # Create the end-to-end model pipeline, with a sample of the data to
+        # infer the signature from
+        X_sample = next(iter_raw_csv(
+            path=config["train_test_raw_path"],
+            chunk_size=1000,
+            dtypes=parameters["ingest_split_parameters"]["dtypes"]
+        )).drop(parameters["target"], axis=1)
+        create_model_pipeline(
+            preprocessing_pipeline=preprocessing_pipeline,
+            model=model,
+            model_name=model_name,
+            X_train=X_sample,
+            artifact_path=config["artifact_path"],
+            models_path=f"{config['models_path']}/{model_name}/"
+        )
+        set_deployed_model(
+            models_path=config["models_path"],
+            model_name=model_name
+        )
+
+
+@plac.opt(arg="input_path", help="Path to the csv file to score")
+@plac.opt(arg="output_path", help="Path to the .csv or .parquet output file")
+@plac.opt(arg="model_name", help="Name of the saved model to score with")
+@plac.opt(arg="chunk_size", help="Number of records to score at a time", type=int)
+@plac.opt(arg="backend", help="Backend to score with, sklearn, onnx or polars")
+def score(
+    input_path: str = None,
+    output_path: str = None,
+    model_name: str = None,
+    chunk_size: int = None,
+    backend: str = None
+):
+    """
+    Score a csv file with a model saved via `make run-deployment`, streaming
+    it in chunks. Defaults to scoring the holdout data with the model
+    deployed last and the batch_scoring_parameters backend.
+    """
+
+    # Load config, logger & parameters
+    config = load_config(".env.dev")
+    logger = load_logger(
+        app_name=config["app_name"],
+        logs_path=config["logs_path"]
+    )
+    parameters = load_parameters(parameters_path=config["parameters_path"])
+    batch_scoring_parameters = parameters["batch_scoring_parameters"]
+
+    if model_name is None:
+        model_name = get_deployed_model(config["models_path"])
+
+    score_model(
+        models_path=f"{config['models_path']}/{model_name}/",
+        input_path=input_path or config["holdout_raw_path"],
+        output_path=output_path or (
+            f"{config['artifact_path']}/"
+            f"{batch_scoring_parameters['output_file']}"
+        ),
+        uid=parameters["uid"],
+        prediction_column=parameters["target"],
+        chunk_size=chunk_size or batch_scoring_parameters["chunk_size"],
+        dtypes=parameters["ingest_split_parameters"]["dtypes"],
+        backend=backend or batch_scoring_parameters["backend"]
+    )
+
+
+@plac.opt(arg="n_records", help="Number of records to generate", type=int)
+@plac.opt(arg="output_path", help="Path to the output csv file")
+@plac.flg(
+    arg="holdout",
+    help="Generate holdout data without the target",
+    abbrev="ho"
+)
+def generate(
+    n_records: int = None,
+    output_path: str = None,
+    holdout: bool = False
+):
+    """
+    Generate a synthetic train_test or holdout csv file of any size with the
+    distributions of the raw train_test data, for benchmarking at scale
+    """
+
+    # Load config, logger & parameters
+    config = load_config(".env.dev")
+    logger = load_logger(
+        app_name=config["app_name"],
+        logs_path=config["logs_path"]
+    )
+    parameters = load_parameters(parameters_path=config["parameters_path"])
+    synthetic_data_parameters = parameters["synthetic_data_parameters"]
+
+    if output_path is None:
+        output_path = (
+            f"{synthetic_data_parameters['output_path']}/"
+            f"{'holdout_raw' if holdout else 'train_test_raw'}.csv"
+        )
+    Path(output_path).parent.mkdir(parents=True, exist_ok=True)
+
+    generator = SyntheticDataGenerator(
+        uid=parameters["uid"],
+        target=parameters["target"],
+        random_state=synthetic_data_parameters["random_state"]
+    )
+    generator.fit(pd.read_csv(config["train_test_raw_path"]))
+    generator.write_csv(
+        path=output_path,
+        n_records=n_records or synthetic_data_parameters["n_records"],
+        chunk_size=synthetic_data_parameters["chunk_size"],
+        include_target=not holdout
+    )
+
+
 if __name__ == "__main__":
-    plac.call(run)
+    plac.call(sys.modules[__name__])
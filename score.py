@@ -0,0 +1,67 @@
+from pathlib import Path
+import plac
+from src.utils import (
+    load_config,
+    load_logger,
+    load_parameters
+)
+from src.serving import (
+    get_deployed_model,
+    score_model
+)
+
+
+@plac.opt(arg="env_path", help="Path to .env file", type=Path)
+@plac.opt(arg="input_path", help="Path to the csv file to score")
+@plac.opt(arg="output_path", help="Path to the .csv or .parquet output file")
+@plac.opt(arg="model_name", help="Name of the saved model to score with")
+@plac.opt(
+    arg="chunk_size",
+    help="Number of records to score at a time",
+    type=int
+)
+@plac.opt(arg="backend", help="Backend to score with, sklearn, onnx or polars")
+def score(
+    env_path: str = "./.env.dev",
+    input_path: str = None,
+    output_path: str = None,
+    model_name: str = None,
+    chunk_size: int = None,
+    backend: str = None
+):
+    """
+    Score a csv file with a model saved via `make run-deployment`, streaming
+    it in chunks. Defaults to the model deployed last. Only the scoring
+    dependencies are imported, so it starts faster than
+    `python -m main score`, which it otherwise matches.
+    """
+
+    # Load config, logger & parameters
+    config = load_config(env_path)
+    logger = load_logger(
+        app_name=config["app_name"],
+        logs_path=config["logs_path"]
+    )
+    parameters = load_parameters(parameters_path=config["parameters_path"])
+    batch_scoring_parameters = parameters["batch_scoring_parameters"]
+
+    if model_name is None:
+        model_name = get_deployed_model(config["models_path"])
+
+    score_model(
+        models_path=f"{config['models_path']}/{model_name}/",
+        input_path=input_path or config["holdout_raw_path"],
+        output_path=output_path or (
+            f"{config['artifact_path']}/"
+            f"{batch_scoring_parameters['output_file']}"
+        ),
+        uid=parameters["uid"],
+        prediction_column=parameters["target"],
+        chunk_size=chunk_size or batch_scoring_parameters["chunk_size"],
+        dtypes=parameters["ingest_split_parameters"]["dtypes"],
+        backend=backend or batch_scoring_parameters["backend"]
+    )
+
+
+if __name__ == "__main__":
+    plac.call(score)
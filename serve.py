@@ -0,0 +1,57 @@
+from pathlib import Path
+import plac
+from src.utils import (
+    load_config,
+    load_logger,
+    load_parameters
+)
+from src.serving import (
+    get_deployed_model,
+    serve_model
+)
+
+
+@plac.opt(arg="env_path", help="Path to .env file", type=Path)
+@plac.opt(arg="model_name", help="Name of the saved model to serve")
+@plac.opt(arg="port", help="Port to serve the model on", type=int)
+@plac.opt(arg="backend", help="Backend to score with, sklearn, onnx or polars")
+def serve(
+    env_path: str = "./.env.dev",
+    model_name: str = None,
+    port: int = None,
+    backend: str = None
+):
+    """
+    Serve a model saved via `make run-deployment` with micro-batching. If no
+    model_name is supplied the model deployed last is served,
+    with the serving_parameters backend if no backend is supplied.
+    """
+
+    # Load config, parameters & logger
+    config = load_config(env_path)
+    parameters = load_parameters(parameters_path=config["parameters_path"])
+    serving_parameters = parameters["serving_parameters"]
+    logger = load_logger(
+        app_name=config["app_name"],
+        logs_path=config["logs_path"],
+        **serving_parameters["logger_parameters"]
+    )
+
+    if model_name is None:
+        model_name = get_deployed_model(config["models_path"])
+
+    serve_model(
+        models_path=f"{config['models_path']}/{model_name}/",
+        host=serving_parameters["host"],
+        port=port or serving_parameters["port"],
+        max_batch_size=serving_parameters["max_batch_size"],
+        max_wait_ms=serving_parameters["max_wait_ms"],
+        backend=backend or serving_parameters["backend"]
+    )
+
+    # Write any logs still queued by the background thread
+    logger.complete()
+
+
+if __name__ == "__main__":
+    plac.call(serve)
@@ -1,21 +1,21 @@
-from src.utils import (
-    load_config,
-    load_logger,
-    load_parameters
-)
-from src.ingest_split import ingest_split
-from src.preprocessing_pipeline import (
-    create_preprocessing_pipeline
-)
-from src.models import (
-    create_logreg_model,
-    create_svc_model
-)
-from src.model_pipeline import (
-    evaluate_model,
-    create_model_pipeline
-)
+from src.utils import lazy_imports
+
 
+# The module each name is imported from on first use
+__getattr__, __dir__ = lazy_imports(
+    package=__name__,
+    imports=dict(
+        load_config="src.utils",
+        load_logger="src.utils",
+        load_parameters="src.utils",
+        ingest_split="src.ingest_split",
+        create_preprocessing_pipeline="src.preprocessing_pipeline",
+        create_logreg_model="src.models",
+        create_svc_model="src.models",
+        evaluate_model="src.model_pipeline",
+        create_model_pipeline="src.model_pipeline"
+    )
+)
 
 __all__ = [
     "load_config",
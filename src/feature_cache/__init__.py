@@ -0,0 +1,17 @@
+from src.feature_cache.feature_cache import (
+    create_cache_key,
+    create_features,
+    FeatureCache
+)
+from src.feature_cache.feature_store import (
+    FeatureStore,
+    is_memory_mapped
+)
+
+__all__ = [
+    "create_cache_key",
+    "create_features",
+    "FeatureCache",
+    "FeatureStore",
+    "is_memory_mapped"
+]
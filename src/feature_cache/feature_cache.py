@@ -0,0 +1,426 @@
+import os
+import json
+import time
+import shutil
+import hashlib
+from pathlib import Path
+from loguru import logger
+import joblib
+import sklearn
+import pandas as pd
+from src.tracking import set_tag
+from src.feature_cache.feature_store import FeatureStore
+
+
+# The source of the transforms is part of the cache key so that changes to
+# the preprocessing code invalidate the cached features
+PREPROCESSING_SOURCE_PATH = (
+    Path(__file__).resolve().parents[1] / "preprocessing_pipeline"
+)
+
+
+def _hash_file(path: str, hasher):
+    """Adds the contents of a file to the hasher in 1 MB blocks"""
+
+    with open(path, "rb") as stream:
+        for block in iter(lambda: stream.read(1024 ** 2), b""):
+            hasher.update(block)
+
+
+def create_cache_key(data_paths: list, parameters: dict):
+    """
+    Description
+    -----------
+    Creates a key which identifies a set of features from the contents of the
+    data files they were created from, the parameters used to create them and
+    the source code of the preprocessing_pipeline module.
+
+    Parameters
+    ----------
+    data_paths: list
+        The locations of the data files the features are created from.
+
+    parameters: dict
+        The parameters which affect the features, e.g. the
+        ingest_split_parameters and pipeline_parameters.
+
+    Returns
+    -------
+    key: str
+        The sha256 hex digest of the data, parameters & source code
+
+    Raises
+    ------
+    None
+
+    Examples
+    --------
+    key = create_cache_key(
+        data_paths=["path/to/train_test_raw.csv"],
+        parameters=dict(
+            ingest_split_parameters=ingest_split_parameters,
+            pipeline_parameters=pipeline_parameters
+        )
+    )
+    """
+
+    hasher = hashlib.sha256()
+
+    for path in data_paths:
+        _hash_file(path, hasher)
+
+    for path in sorted(PREPROCESSING_SOURCE_PATH.glob("*.py")):
+        _hash_file(path, hasher)
+
+    hasher.update(json.dumps(parameters, sort_keys=True, default=str).encode())
+
+    return hasher.hexdigest()
+
+
+def create_features(
+    preprocessing_pipeline: sklearn.pipeline.Pipeline,
+    X_train: pd.core.frame.DataFrame,
+    X_test: pd.core.frame.DataFrame,
+    X_holdout: pd.core.frame.DataFrame = None
+):
+    """
+    Description
+    -----------
+    Fits the preprocessing_pipeline to X_train and creates the train & test
+    features, and the holdout features if X_holdout is supplied.
+
+    Parameters
+    ----------
+    preprocessing_pipeline: sklearn.pipeline.Pipeline
+        The scikit-learn pipeline used to preprocess the data
+
+    X_train: pd.core.frame.DataFrame
+        The dataframe of raw training data.
+
+    X_test: pd.core.frame.DataFrame
+        The dataframe of raw test data.
+
+    X_holdout: pd.core.frame.DataFrame
+        The dataframe of raw holdout data, or None to skip it.
+
+    Returns
+    -------
+    features: dict
+        The fitted preprocessing_pipeline, X_train_features & X_test_features
+        and X_holdout_features if X_holdout is supplied
+
+    Raises
+    ------
+    None
+
+    Examples
+    --------
+    features = create_features(
+        preprocessing_pipeline=preprocessing_pipeline,
+        X_train=X_train,
+        X_test=X_test
+    )
+    """
+
+    logger.info("Running train preprocessing")
+    X_train_features = preprocessing_pipeline.fit_transform(X_train)
+    logger.info("Running test preprocessing")
+    X_test_features = preprocessing_pipeline.transform(X_test)
+    features = dict(
+        preprocessing_pipeline=preprocessing_pipeline,
+        X_train_features=X_train_features,
+        X_test_features=X_test_features
+    )
+
+    if X_holdout is not None:
+        logger.info("Running holdout preprocessing")
+        X_holdout_features = preprocessing_pipeline.transform(X_holdout)
+        features["X_holdout_features"] = X_holdout_features
+
+    return features
+
+
+class FeatureCache:
+    """
+    Description
+    -----------
+    On-disk cache of the train, test & optionally holdout features and the
+    fitted preprocessing pipeline which created them, stored under a key
+    created by create_cache_key. The pipeline is stored via joblib and the
+    features either as parquet files, which requires pyarrow, or in a
+    FeatureStore as float32 arrays which are loaded memory mapped, so
+    they're read from disk once and shared with the worker processes of
+    evaluate_model rather than copied into each. The features are only
+    memory mapped when they're stored, i.e. while the cache is enabled.
+
+    When saving takes the cache over max_size_mb the least recently used
+    entries are evicted until it fits.
+
+    Parameters
+    ----------
+    cache_path: str
+        The directory to store the cached features in.
+
+    max_size_mb: float
+        The maximum size of the cache in megabytes.
+
+    enabled: bool
+        Whether to use the cache. When disabled get_features always creates
+        the features in memory and nothing is saved, so they aren't memory
+        mapped whatever the feature_format.
+
+    feature_format: str
+        The format the features are stored in, either parquet or mmap.
+
+    Examples
+    --------
+    feature_cache = FeatureCache(cache_path="path/to/cache", max_size_mb=1024)
+    features = feature_cache.get_features(
+        key=key,
+        preprocessing_pipeline=preprocessing_pipeline,
+        X_train=X_train,
+        X_test=X_test
+    )
+    """
+
+    FILES = dict(
+        X_train_features="X_train_features.parquet",
+        X_test_features="X_test_features.parquet",
+        X_holdout_features="X_holdout_features.parquet",
+        preprocessing_pipeline="preprocessing_pipeline.joblib"
+    )
+
+    FEATURE_FORMATS = ["parquet", "mmap"]
+
+    def __init__(
+        self,
+        cache_path: str,
+        max_size_mb: float = 1024,
+        enabled: bool = True,
+        feature_format: str = "parquet"
+    ):
+        if feature_format not in self.FEATURE_FORMATS:
+            raise ValueError(
+                f"Unknown feature_format {feature_format}, "
+                f"use one of {self.FEATURE_FORMATS}"
+            )
+
+        self.cache_path = Path(cache_path)
+        self.max_size_mb = max_size_mb
+        self.enabled = enabled
+        self.feature_format = feature_format
+
+    def _load_features(self, entry_path: Path, holdout: bool = False):
+        """
+        Loads the train, test & if holdout is set the holdout features of an
+        entry, each of which is None if it isn't stored in the
+        feature_format, e.g. when the entry was saved in another format
+        """
+
+        names = ["X_train_features", "X_test_features"]
+        if holdout:
+            names.append("X_holdout_features")
+
+        if self.feature_format == "mmap":
+            feature_store = FeatureStore(store_path=entry_path)
+            return {name: feature_store.load(name) for name in names}
+
+        return {
+            name: (
+                pd.read_parquet(entry_path / self.FILES[name])
+                if (entry_path / self.FILES[name]).exists() else None
+            )
+            for name in names
+        }
+
+    def load(self, key: str, holdout: bool = False):
+        """
+        Returns the cached features for the key, including the holdout
+        features if holdout is set, or None if they're not cached
+        """
+
+        entry_path = self.cache_path / key
+        pipeline_path = entry_path / self.FILES["preprocessing_pipeline"]
+
+        if not pipeline_path.exists():
+            return None
+
+        features = self._load_features(entry_path, holdout=holdout)
+        if any(value is None for value in features.values()):
+            return None
+        features["preprocessing_pipeline"] = joblib.load(pipeline_path)
+
+        # Record the entry as recently used for eviction
+        os.utime(entry_path)
+
+        return features
+
+    def save(
+        self,
+        key: str,
+        preprocessing_pipeline: sklearn.pipeline.Pipeline,
+        X_train_features: pd.core.frame.DataFrame,
+        X_test_features: pd.core.frame.DataFrame,
+        X_holdout_features: pd.core.frame.DataFrame = None
+    ):
+        """Saves the features under the key and evicts old entries"""
+
+        features = dict(
+            X_train_features=X_train_features,
+            X_test_features=X_test_features,
+            X_holdout_features=X_holdout_features
+        )
+
+        self.cache_path.mkdir(parents=True, exist_ok=True)
+        entry_path = self.cache_path / key
+
+        # Write to a temporary directory & rename it so that a partially
+        # written entry is never loaded
+        tmp_path = self.cache_path / f".{key}.{os.getpid()}.tmp"
+        shutil.rmtree(tmp_path, ignore_errors=True)
+        tmp_path.mkdir()
+        feature_store = FeatureStore(store_path=tmp_path)
+        for name, df in features.items():
+            if df is None:
+                continue
+            if self.feature_format == "mmap":
+                feature_store.save(name, df)
+            else:
+                df.to_parquet(tmp_path / self.FILES[name])
+        joblib.dump(
+            preprocessing_pipeline,
+            tmp_path / self.FILES["preprocessing_pipeline"]
+        )
+
+        shutil.rmtree(entry_path, ignore_errors=True)
+        os.rename(tmp_path, entry_path)
+
+        self.evict(keep=key)
+
+    def size_mb(self):
+        """Returns the size of each entry in the cache in megabytes"""
+
+        if not self.cache_path.is_dir():
+            return {}
+
+        return {
+            entry_path: sum(
+                path.stat().st_size for path in entry_path.iterdir()
+            ) / 1024 ** 2
+            for entry_path in self.cache_path.iterdir()
+            if entry_path.is_dir() and not entry_path.name.startswith(".")
+        }
+
+    def evict(self, keep: str = None):
+        """Removes the least recently used entries until the cache fits"""
+
+        sizes = self.size_mb()
+        total_size = sum(sizes.values())
+
+        for entry_path in sorted(sizes, key=lambda path: path.stat().st_mtime):
+            if total_size <= self.max_size_mb:
+                break
+            if entry_path.name == keep:
+                continue
+
+            logger.info(f"Evicting {entry_path.name} from the feature cache")
+            shutil.rmtree(entry_path, ignore_errors=True)
+            total_size -= sizes[entry_path]
+
+    def get_features(
+        self,
+        key: str,
+        preprocessing_pipeline: sklearn.pipeline.Pipeline,
+        X_train: pd.core.frame.DataFrame,
+        X_test: pd.core.frame.DataFrame,
+        X_holdout: pd.core.frame.DataFrame = None
+    ):
+        """
+        Description
+        -----------
+        Loads the features for the key from the cache or, if they aren't
+        cached, creates them via create_features and caches them. The
+        holdout features are only loaded or created if X_holdout is
+        supplied, so the key should then include the holdout data. Whether the
+        features were cached is logged to MLFlow as the feature_cache tag.
+
+        Parameters
+        ----------
+        key: str
+            The key of the features, created via create_cache_key.
+
+        preprocessing_pipeline: sklearn.pipeline.Pipeline
+            The unfitted pipeline used to create the features if they aren't
+            cached.
+
+        X_train: pd.core.frame.DataFrame
+            The dataframe of raw training data.
+
+        X_test: pd.core.frame.DataFrame
+            The dataframe of raw test data.
+
+        X_holdout: pd.core.frame.DataFrame
+            The dataframe of raw holdout data, or None to skip it.
+
+        Returns
+        -------
+        features: dict
+            The fitted preprocessing_pipeline, X_train_features &
+            X_test_features and X_holdout_features if X_holdout is supplied
+
+        Raises
+        ------
+        Exception: Exception
+            Generic exception for logging
+
+        Examples
+        --------
+        features = feature_cache.get_features(
+            key=key,
+            preprocessing_pipeline=preprocessing_pipeline,
+            X_train=X_train,
+            X_test=X_test
+        )
+        """
+
+        logger.info("Running FeatureCache.get_features()")
+
+        try:
+            start = time.perf_counter()
+            holdout = X_holdout is not None
+            features = (
+                self.load(key, holdout=holdout) if self.enabled else None
+            )
+
+            if features is not None:
+                logger.info(
+                    f"Loaded cached features {key[:12]} in "
+                    f"{time.perf_counter() - start:.2f}s"
+                )
+                set_tag("feature_cache", "hit")
+                return features
+
+            features = create_features(
+                preprocessing_pipeline=preprocessing_pipeline,
+                X_train=X_train,
+                X_test=X_test,
+                X_holdout=X_holdout
+            )
+
+            if self.enabled:
+                self.save(key=key, **features)
+                logger.info(f"Cached features {key[:12]}")
+                set_tag("feature_cache", "miss")
+
+                # Use the stored features, so memory mapped features are
+                # shared with worker processes on the first run too
+                if self.feature_format == "mmap":
+                    features.update(self._load_features(
+                        self.cache_path / key,
+                        holdout=holdout
+                    ))
+
+            return features
+
+        except Exception:
+            logger.exception("Error running FeatureCache.get_features()")
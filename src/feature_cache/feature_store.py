@@ -0,0 +1,146 @@
+import json
+from pathlib import Path
+from loguru import logger
+import numpy as np
+import pandas as pd
+
+
+class FeatureStore:
+    """
+    Description
+    -----------
+    Stores feature matrices, e.g. the train, test & holdout features created
+    by the preprocessing pipeline, on disk as .npy files of dtype with a
+    json file of their columns & index, and loads them as DataFrames backed
+    by a read-only memory map of the file rather than a copy in memory.
+
+    A loaded matrix is only read from disk as it's used, and is shared by
+    every process which loads it via the page cache. joblib passes memory
+    mapped arrays & DataFrames to its worker processes by reference rather
+    than pickling a copy into each, so the cross-validation, learning curve
+    and visualisation workers of evaluate_model share the same features.
+    Storing float32 features halves their size compared to float64.
+
+    Parameters
+    ----------
+    store_path: str
+        The directory to store the feature matrices in.
+
+    dtype: str
+        The dtype the features are stored as.
+
+    chunk_size: int
+        The number of rows converted to dtype & written at a time, which
+        limits the memory used to save a matrix.
+
+    Examples
+    --------
+    feature_store = FeatureStore(store_path="path/to/features")
+    feature_store.save("X_train_features", X_train_features)
+    X_train_features = feature_store.load("X_train_features")
+    """
+
+    def __init__(
+        self,
+        store_path: str,
+        dtype: str = "float32",
+        chunk_size: int = 100000
+    ):
+        self.store_path = Path(store_path)
+        self.dtype = dtype
+        self.chunk_size = chunk_size
+
+    def _paths(self, name: str):
+        """The files of the values, index & metadata of a feature matrix"""
+
+        return (
+            self.store_path / f"{name}.npy",
+            self.store_path / f"{name}.index.npy",
+            self.store_path / f"{name}.json"
+        )
+
+    def save(self, name: str, df: pd.core.frame.DataFrame):
+        """Saves a DataFrame of numeric features as the feature matrix name"""
+
+        logger.debug(f"Saving {name} to the feature store")
+
+        self.store_path.mkdir(parents=True, exist_ok=True)
+        values_path, index_path, metadata_path = self._paths(name)
+
+        # Write the values a chunk of rows at a time so the whole matrix is
+        # never copied in memory
+        values = np.lib.format.open_memmap(
+            values_path,
+            mode="w+",
+            dtype=self.dtype,
+            shape=df.shape
+        )
+        for start in range(0, len(df), self.chunk_size):
+            values[start:start + self.chunk_size] = (
+                df.iloc[start:start + self.chunk_size].to_numpy(
+                    dtype=self.dtype
+                )
+            )
+        values.flush()
+        del values
+
+        # Non-numeric indexes are stored as strings so no pickle is needed
+        index = df.index.to_numpy()
+        if index.dtype == object:
+            index = index.astype(str)
+        np.save(index_path, index, allow_pickle=False)
+
+        with open(metadata_path, "w") as stream:
+            json.dump(
+                dict(
+                    columns=df.columns.tolist(),
+                    index_name=df.index.name,
+                    dtype=self.dtype,
+                    shape=list(df.shape)
+                ),
+                stream
+            )
+
+    def load(self, name: str):
+        """
+        Loads the feature matrix name as a DataFrame backed by a read-only
+        memory map, or None if it isn't stored
+        """
+
+        values_path, index_path, metadata_path = self._paths(name)
+
+        if not metadata_path.exists():
+            return None
+
+        with open(metadata_path, "r") as stream:
+            metadata = json.load(stream)
+
+        # The DataFrame is a view of the memory map, which isn't copied as
+        # it's a single block of one dtype
+        return pd.DataFrame(
+            np.load(values_path, mmap_mode="r"),
+            index=pd.Index(
+                np.load(index_path, allow_pickle=False),
+                name=metadata["index_name"]
+            ),
+            columns=metadata["columns"],
+            copy=False
+        )
+
+    def names(self):
+        """The names of the stored feature matrices"""
+
+        if not self.store_path.is_dir():
+            return []
+
+        return sorted(path.stem for path in self.store_path.glob("*.json"))
+
+
+def is_memory_mapped(df: pd.core.frame.DataFrame):
+    """Whether the values of a DataFrame are a view of a memory map"""
+
+    values = df.to_numpy()
+    while values is not None and not isinstance(values, np.memmap):
+        values = getattr(values, "base", None)
+
+    return values is not None
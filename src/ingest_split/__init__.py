@@ -1,5 +1,13 @@
-from src.ingest_split.ingest_split import ingest_split
+from src.ingest_split.ingest_split import (
+    ingest_split,
+    read_raw_csv,
+    iter_raw_csv,
+    memory_usage_report
+)
 
 __all__ = [
-    "ingest_split"
+    "ingest_split",
+    "read_raw_csv",
+    "iter_raw_csv",
+    "memory_usage_report"
 ]
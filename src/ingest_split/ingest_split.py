@@ -1,8 +1,220 @@
 import pandas as pd
-import numpy as np
-import mlflow
-from sklearn.model_selection import train_test_split
 from loguru import logger
+from src.tracking import (
+    log_param,
+    log_metric
+)
+
+
+def _arrow_type(dtype: str):
+    """
+    The pyarrow type to parse a column of the dtype schema as, so the
+    conversion happens while the file is parsed rather than afterwards.
+    Categoricals are parsed as dictionary encoded strings.
+    """
+
+    import pyarrow as pa
+
+    dtype = pd.api.types.pandas_dtype(dtype)
+
+    if isinstance(dtype, pd.CategoricalDtype):
+        return pa.dictionary(pa.int32(), pa.string())
+
+    if isinstance(dtype, pd.StringDtype):
+        return pa.string()
+
+    return pa.from_numpy_dtype(getattr(dtype, "numpy_dtype", dtype))
+
+
+def _pandas_type(arrow_type):
+    """
+    Converts strings to pyarrow backed strings rather than python objects,
+    other types use the default conversion
+    """
+
+    import pyarrow as pa
+
+    if pa.types.is_string(arrow_type):
+        return pd.StringDtype("pyarrow")
+
+    return None
+
+
+def read_raw_csv(path: str, dtypes: dict = None, engine: str = "c"):
+    """
+    Description
+    -----------
+    Reads a raw csv file, applying the supplied dtype schema as the file is
+    parsed rather than converting the inferred types afterwards. Columns of
+    the schema which aren't in the file, e.g. the target in the holdout data,
+    are ignored and columns which aren't in the schema are inferred.
+
+    Parameters
+    ----------
+    path: str
+        Location of the csv file
+
+    dtypes: dict
+        The dtype of each column, e.g. category, Int8 or float32. None infers
+        the dtype of every column.
+
+    engine: str
+        The csv parser, either the pandas c parser or pyarrow, which parses
+        the file across multiple threads and requires pyarrow.
+
+    Returns
+    -------
+    df: pd.core.frame.DataFrame
+        The typed dataframe
+
+    Raises
+    ------
+    None
+
+    Examples
+    --------
+    df = read_raw_csv(
+        path="path/to/train_test_raw.csv",
+        dtypes=dict(Sex="category", Age="float32"),
+        engine="pyarrow"
+    )
+    """
+
+    columns = pd.read_csv(path, nrows=0).columns
+    dtypes = {
+        column: dtype
+        for column, dtype in (dtypes or {}).items()
+        if column in columns
+    }
+
+    if engine == "pyarrow":
+        # Read via pyarrow directly as pandas doesn't expose the option to
+        # read empty strings as missing values, as the c engine does
+        from pyarrow import csv
+
+        table = csv.read_csv(
+            path,
+            convert_options=csv.ConvertOptions(
+                column_types={
+                    column: _arrow_type(dtype)
+                    for column, dtype in dtypes.items()
+                },
+                strings_can_be_null=True
+            )
+        )
+
+        return (
+            table
+            .to_pandas(types_mapper=_pandas_type)
+            .astype(dtypes, copy=False)
+        )
+
+    return pd.read_csv(path, dtype=dtypes, engine=engine)
+
+
+def iter_raw_csv(path: str, chunk_size: int, dtypes: dict = None):
+    """
+    Description
+    -----------
+    Reads a raw csv file chunk_size records at a time with the supplied
+    dtype schema, so files larger than memory can be processed. Columns of
+    the schema which aren't in the file are ignored, as in read_raw_csv.
+    The chunks are parsed by the pandas c parser.
+
+    Parameters
+    ----------
+    path: str
+        Location of the csv file
+
+    chunk_size: int
+        The number of records in each chunk.
+
+    dtypes: dict
+        The dtype of each column, e.g. category, Int8 or float32. None infers
+        the dtype of every column.
+
+    Returns
+    -------
+    chunks: generator
+        The typed dataframe of each chunk
+
+    Raises
+    ------
+    None
+
+    Examples
+    --------
+    for df_chunk in iter_raw_csv(
+        path="path/to/train_test_raw.csv",
+        chunk_size=100000,
+        dtypes=dict(Sex="category", Age="float32")
+    ):
+        ...
+    """
+
+    columns = pd.read_csv(path, nrows=0).columns
+    dtypes = {
+        column: dtype
+        for column, dtype in (dtypes or {}).items()
+        if column in columns
+    }
+
+    with pd.read_csv(path, dtype=dtypes, chunksize=chunk_size) as reader:
+        yield from reader
+
+
+def memory_usage_report(
+    df_before: pd.core.frame.DataFrame,
+    df_after: pd.core.frame.DataFrame
+):
+    """
+    Description
+    -----------
+    Compares the memory used by each column of two versions of a dataframe,
+    e.g. before and after applying a dtype schema, including the memory used
+    by the strings of object columns.
+
+    Parameters
+    ----------
+    df_before: pd.core.frame.DataFrame
+        The original dataframe
+
+    df_after: pd.core.frame.DataFrame
+        The converted dataframe
+
+    Returns
+    -------
+    report: pd.core.frame.DataFrame
+        The dtype & memory in MB of each column before & after, the saving
+        and a Total row
+
+    Raises
+    ------
+    None
+
+    Examples
+    --------
+    report = memory_usage_report(
+        df_before=pd.read_csv("path/to/train_test_raw.csv"),
+        df_after=read_raw_csv("path/to/train_test_raw.csv", dtypes=dtypes)
+    )
+    """
+
+    report = pd.DataFrame(dict(
+        dtype_before=df_before.dtypes.astype(str),
+        dtype_after=df_after.dtypes.astype(str),
+        mb_before=df_before.memory_usage(index=False, deep=True) / 1024 ** 2,
+        mb_after=df_after.memory_usage(index=False, deep=True) / 1024 ** 2
+    ))
+    report.loc["Total"] = [
+        "",
+        "",
+        report["mb_before"].sum(),
+        report["mb_after"].sum()
+    ]
+    report["saving"] = 1 - report["mb_after"] / report["mb_before"]
+
+    return report
 
 
 def ingest_split(
@@ -32,7 +244,10 @@ def ingest_split(
         Location to export the processed test_clean.csv file to
 
     ingest_split_parameters: dict
-        Dictionary containing the parameters for the function.
+        Dictionary containing the parameters for the function. The optional
+        dtypes schema is applied as the files are read with the csv_engine,
+        see read_raw_csv. When memory_report is set the files are also read
+        with inferred dtypes and the memory of each column is compared.
 
     Returns
     -------
@@ -66,10 +281,16 @@ def ingest_split(
         ingest_split_parameters=dict(
             random_state=2,
             train_size=0.5,
-            test_size=0.5
+            test_size=0.5,
+            csv_engine="pyarrow",
+            dtypes=dict(Sex="category", Age="float32")
         )
     )
     """
+    # sklearn is imported on first use so reading the raw data to score it
+    # doesn't import it
+    from sklearn.model_selection import train_test_split
+
     try:
         logger.info("Running ingest_split()")
 
@@ -79,22 +300,36 @@ def ingest_split(
         random_state = ingest_split_parameters["random_state"]
 
         # Log MLflow parameters
-        mlflow.log_param("train_size", train_size)
-        mlflow.log_param("test_size", test_size)
-        mlflow.log_param("random_state", random_state)
-
-        # Import train & holdout datasets
-        df_train = pd.read_csv(train_test_raw_path)
-        df_holdout = pd.read_csv(holdout_raw_path)
-
-        # Convert ints to floats
-        for column in df_train.columns.tolist():
-            if isinstance(df_train[column], np.int64):
-                df_train[column] = df_train[column].astype(float)
-
-        for column in df_holdout.columns.tolist():
-            if isinstance(df_holdout[column], np.int64):
-                df_holdout[column] = df_holdout[column].astype(float)
+        log_param("train_size", train_size)
+        log_param("test_size", test_size)
+        log_param("random_state", random_state)
+
+        dtypes = ingest_split_parameters.get("dtypes")
+        csv_engine = ingest_split_parameters.get("csv_engine", "c")
+
+        # Import the train & holdout datasets with the dtype schema
+        df_train = read_raw_csv(
+            train_test_raw_path,
+            dtypes=dtypes,
+            engine=csv_engine
+        )
+        df_holdout = read_raw_csv(
+            holdout_raw_path,
+            dtypes=dtypes,
+            engine=csv_engine
+        )
+
+        log_metric(
+            "train_test_memory_mb",
+            df_train.memory_usage(deep=True).sum() / 1024 ** 2
+        )
+
+        if ingest_split_parameters.get("memory_report", False):
+            report = memory_usage_report(
+                df_before=pd.read_csv(train_test_raw_path),
+                df_after=df_train
+            )
+            logger.info(f"Memory usage by column:\n{report.to_string()}")
 
         # Split the features and target
         X = df_train.drop(target, axis=1)
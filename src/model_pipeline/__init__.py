@@ -1,8 +1,28 @@
-from src.model_pipeline.evaluate import evaluate_model
-from src.model_pipeline.model_pipeline import create_model_pipeline
+from src.utils import lazy_imports
 
 
+# The module each name is imported from on first use
+__getattr__, __dir__ = lazy_imports(
+    package=__name__,
+    imports=dict(
+        evaluate_model="src.model_pipeline.evaluate",
+        evaluate_model_incremental="src.model_pipeline.incremental",
+        IncrementalMetrics="src.model_pipeline.incremental",
+        create_model_pipeline="src.model_pipeline.model_pipeline",
+        search_hyperparameters="src.model_pipeline.search",
+        run_tournament="src.model_pipeline.tournament",
+        save_data_artifact="src.model_pipeline.artifacts",
+        load_data_artifact="src.model_pipeline.artifacts"
+    )
+)
+
 __all__ = [
     "evaluate_model",
-    "create_model_pipeline"
+    "evaluate_model_incremental",
+    "IncrementalMetrics",
+    "create_model_pipeline",
+    "search_hyperparameters",
+    "run_tournament",
+    "save_data_artifact",
+    "load_data_artifact"
 ]
@@ -0,0 +1,167 @@
+from pathlib import Path
+from loguru import logger
+import pandas as pd
+
+
+# The file extension of each artifact format
+ARTIFACT_FORMATS = dict(
+    csv=".csv",
+    parquet=".parquet",
+    feather=".feather"
+)
+
+# The file extension added to compressed csv files so pandas can infer the
+# compression when they're loaded
+CSV_COMPRESSION_EXTENSIONS = dict(
+    gzip=".gz",
+    bz2=".bz2",
+    zip=".zip",
+    xz=".xz",
+    zstd=".zst"
+)
+
+
+def save_data_artifact(
+    df: pd.core.frame.DataFrame,
+    artifact_path: str,
+    name: str,
+    artifact_format: str = "csv",
+    compression: str = None
+):
+    """
+    Description
+    -----------
+    Saves a dataframe, with its index as a column, to artifact_path as a csv,
+    parquet or feather file. The parquet & feather formats require pyarrow.
+
+    Parameters
+    ----------
+    df: pandas.core.frame.DataFrame
+        The dataframe to save.
+
+    artifact_path: str
+        The directory to save the dataframe in.
+
+    name: str
+        The name of the file, without an extension.
+
+    artifact_format: str
+        The format to save the dataframe in, one of csv, parquet or feather.
+
+    compression: str
+        The compression codec to use, e.g. zstd, lz4 or snappy for parquet,
+        zstd or lz4 for feather and gzip for csv. None saves the file
+        uncompressed, which allows feather files to be loaded straight from
+        the memory map without decompressing or copying them.
+
+    Returns
+    -------
+    outpath: str
+        The location of the saved file
+
+    Raises
+    ------
+    ValueError:
+        If the artifact_format isn't csv, parquet or feather
+
+    Examples
+    --------
+    outpath = save_data_artifact(
+        df=X_train_features,
+        artifact_path="path/to/folder",
+        name="X_train",
+        artifact_format="parquet",
+        compression="zstd"
+    )
+    """
+
+    if artifact_format not in ARTIFACT_FORMATS:
+        raise ValueError(
+            f"Unknown artifact_format {artifact_format}, "
+            f"use one of {list(ARTIFACT_FORMATS)}"
+        )
+
+    outpath = f"{artifact_path}/{name}{ARTIFACT_FORMATS[artifact_format]}"
+    df_out = df.reset_index()
+
+    if artifact_format == "csv":
+        if compression is not None:
+            outpath += CSV_COMPRESSION_EXTENSIONS[compression]
+        df_out.to_csv(outpath, index=False, compression=compression)
+
+    elif artifact_format == "parquet":
+        df_out.to_parquet(outpath, index=False, compression=compression)
+
+    else:
+        # A single record batch keeps each column contiguous in the file, so
+        # an uncompressed file can be loaded without concatenating chunks
+        df_out.to_feather(
+            outpath,
+            compression=compression or "uncompressed",
+            chunksize=max(len(df_out), 1)
+        )
+
+    return outpath
+
+
+def load_data_artifact(path: str, memory_map: bool = True):
+    """
+    Description
+    -----------
+    Loads a data artifact saved via save_data_artifact, e.g. after
+    downloading it from MLFlow, for later analysis. The format is taken from
+    the file extension.
+
+    Parquet & feather files are opened memory-mapped by default, so the
+    operating system pages the file in as it's read rather than it being
+    copied into memory up front. The numeric columns of uncompressed feather
+    files are returned as read-only views of the memory map without any
+    copy, so call .copy() on the dataframe before modifying it in place.
+    Parquet & compressed feather files, e.g. the default zstd parquet, have
+    to be decoded into new arrays, with each column's arrow buffers released
+    as it's converted so the data isn't held in memory twice.
+
+    Parameters
+    ----------
+    path: str
+        The location of the artifact.
+
+    memory_map: bool
+        Open parquet & feather files memory-mapped.
+
+    Returns
+    -------
+    df: pandas.core.frame.DataFrame
+        The loaded dataframe
+
+    Raises
+    ------
+    ValueError:
+        If the file extension isn't .csv, .parquet or .feather
+
+    Examples
+    --------
+    X_train = load_data_artifact("path/to/X_train.feather")
+    """
+
+    logger.info(f"Loading data artifact {path}")
+
+    suffix = "".join(Path(path).suffixes[:1])
+
+    if suffix == ".csv":
+        return pd.read_csv(path)
+
+    if suffix == ".parquet":
+        # pyarrow is only required for the columnar formats
+        import pyarrow.parquet as pq
+
+        table = pq.read_table(path, memory_map=memory_map)
+        return table.to_pandas(split_blocks=True, self_destruct=True)
+
+    if suffix == ".feather":
+        import pyarrow.feather as feather
+
+        table = feather.read_table(path, memory_map=memory_map)
+        return table.to_pandas(split_blocks=True, self_destruct=True)
+
+    raise ValueError(f"Unable to load {path}, unknown file extension")
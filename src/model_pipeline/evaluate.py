@@ -1,18 +1,19 @@
 from loguru import logger
 import sklearn
 import pandas as pd
-import mlflow
 from sklearn.model_selection import cross_val_score
 from sklearn.metrics import (
     average_precision_score,
     recall_score,
 )
 from statistics import mean
-import matplotlib.pyplot as plt
-from yellowbrick.features import Rank1D
-from yellowbrick.classifier import ConfusionMatrix
-from yellowbrick.model_selection import LearningCurve
-from scikitplot.metrics import plot_roc
+from src.utils import time_stage
+from src.model_pipeline.visualise import create_visualisations
+from src.model_pipeline.artifacts import save_data_artifact
+from src.tracking import (
+    log_artifact,
+    log_metric
+)
 
 
 def evaluate_model(
@@ -23,7 +24,14 @@ def evaluate_model(
     X_test: pd.core.frame.DataFrame,
     y_test: pd.core.frame.DataFrame,
     artifact_path: str,
-    cv: int
+    cv: int,
+    n_jobs: int = None,
+    X_train_features: pd.core.frame.DataFrame = None,
+    X_test_features: pd.core.frame.DataFrame = None,
+    metrics_only: bool = False,
+    plot_cache_path: str = None,
+    artifact_format: str = "csv",
+    artifact_compression: str = None
 ):
     """
     Description
@@ -32,8 +40,14 @@ def evaluate_model(
     data. Records the data, scores and visualisations produced in MLFlow as
     metrics and artifacts as appropriate.
 
+    The cross-validation fits are independent of each other so are run in
+    parallel across n_jobs processes, as are the visualisations which are
+    created via create_visualisations. The time taken by each stage is logged
+    and recorded in MLFlow as a <stage>_seconds metric.
+
     Evaluation steps:
-        1. Preprocess X_train and X_test data
+        1. Fit the preprocessing_pipeline to X_train and preprocess the
+           X_train and X_test data
         2. Fit the model
         3. Score the model
         4. Generates visualisations for the model.
@@ -66,6 +80,34 @@ def evaluate_model(
         The number of cross-validation folds to perform when evaluating the
         model
 
+    n_jobs: int
+        The number of processes to run the cross-validation fits and
+        visualisations in. None runs them in the current process and -1 uses
+        all of the available cores.
+
+    X_train_features: pd.core.frame.DataFrame
+        The precomputed training features, e.g. loaded from the FeatureCache.
+        When both X_train_features and X_test_features are supplied the
+        preprocessing_pipeline must already be fitted and step 1 is skipped.
+
+    X_test_features: pd.core.frame.DataFrame
+        The precomputed test features.
+
+    metrics_only: bool
+        Skip step 4 and only record the metrics & data, e.g. for tests and
+        hyperparameter sweeps.
+
+    plot_cache_path: str
+        The location of the cache of rendered visualisations. Visualisations
+        of the same model & data are copied from the cache rather than
+        rendered. None renders every visualisation.
+
+    artifact_format: str
+        The format to save the train & test data in, one of csv, parquet or
+        feather. See save_data_artifact.
+
+    artifact_compression: str
+        The compression codec to save the train & test data with, e.g. zstd.
 
     Returns:
     --------
@@ -87,140 +129,135 @@ def evaluate_model(
         X_test=X_test,
         y_test=y_test,
         artifact_path="path/to/folder",
-        cv=5
+        cv=5,
+        n_jobs=-1
     )
     """
 
     logger.info("Running evaluate_model()")
 
     try:
+        timings = dict()
+
         # Generate train & test features
-        logger.info("Running train preprocessing")
-        X_train_features = preprocessing_pipeline.fit_transform(X_train)
-        logger.info("Running test preprocessing")
-        X_test_features = preprocessing_pipeline.fit_transform(X_test)
-
-        logger.info("Fitting model")
-        # Fit the model & generate predictions
-        model.fit(X=X_train_features, y=y_train.values.ravel())
-
-        logger.info("Scoring model")
-        # Basic Scores
-        train_score = model.score(
-            X=X_train_features,
-            y=y_train.values.ravel()
-        )
-        test_score = model.score(
-            X=X_test_features,
-            y=y_test.values.ravel()
-        )
-
-        # CV Scores
-        train_cv_score = cross_val_score(
-            estimator=model,
-            X=X_train_features,
-            y=y_train.values.ravel(),
-            cv=cv
-        )
-        test_cv_score = cross_val_score(
-            estimator=model,
-            X=X_test_features,
-            y=y_test.values.ravel(),
-            cv=cv
-        )
-
-        # Precision
-        train_y_score = model.decision_function(X=X_train_features)
-        train_precision = average_precision_score(
-            y_true=y_train.values.ravel(),
-            y_score=train_y_score
-        )
-        test_y_score = model.decision_function(X=X_test_features)
-        test_precision = average_precision_score(
-            y_true=y_test.values.ravel(),
-            y_score=test_y_score
-        )
-
-        # Recall
-        train_predictions = model.predict(X=X_train_features)
-        train_recall = recall_score(
-            y_true=y_train,
-            y_pred=train_predictions,
-            average="macro"
-        )
-        test_predictions = model.predict(X=X_test_features)
-        test_recall = recall_score(
-            y_true=y_test,
-            y_pred=test_predictions,
-            average="macro"
-        )
-
-        logger.info("Creating visualisations")
-        # Learning Curve Visualisation
-        learning_curve = LearningCurve(
-            model,
-            scoring='accuracy',
-            size=(1080, 720)
-        )
-        learning_curve.fit(X_train_features, y_train.values.ravel())
-        outpath = f"{artifact_path}/learning_curve.png"
-        learning_curve.show(outpath=outpath)
-        plt.close()
-
-        # Feature Ranking Visualisation
-        feature_rank = Rank1D(
-            algorithm='shapiro',
-            features=X_train_features.columns.tolist(),
-            size=(1080, 720)
-        )
-        feature_rank.fit(X_train_features, y_train.values.ravel())
-        feature_rank.transform(X_train_features)
-        outpath = f"{artifact_path}/feature_importance.png"
-        feature_rank.show(outpath=outpath)
-        mlflow.log_artifact(outpath)
-        plt.close()
-
-        # Confusion Matrix Visualisation
-        confusion_matrix = ConfusionMatrix(
-            model,
-            classes=[0, 1],
-            size=(1080, 720),
-            is_fitted=True
-        )
-        confusion_matrix.score(X_test_features, y_test.values.ravel())
-        outpath = f"{artifact_path}/confusion_matrix.png"
-        confusion_matrix.show(outpath=outpath)
-        mlflow.log_artifact(outpath)
-        plt.close()
-
-        # ROCAUC Visualisation
-        y_probas = model.predict_proba(X_test_features)
-        rocauc = plot_roc(y_test.values.ravel(), y_probas)
-        outpath = f"{artifact_path}/roc_auc.png"
-        plt.savefig(fname=outpath)
-        mlflow.log_artifact(outpath)
-        plt.close()
-
-        logger.info("Saving data, artifacts & metrics")
-
-        # Save Train & Test data
-        X_train_features.reset_index().to_csv(f"{artifact_path}/X_train.csv")
-        X_test_features.reset_index().to_csv(f"{artifact_path}/X_test.csv")
-        y_train.to_csv(f"{artifact_path}/y_train.csv")
-        y_test.to_csv(f"{artifact_path}/y_test.csv")
-
-        # Log MLFlow Artifacts
-        mlflow.log_artifact(artifact_path)
+        with time_stage("preprocessing", timings):
+            if X_train_features is None or X_test_features is None:
+                logger.info("Running train preprocessing")
+                X_train_features = preprocessing_pipeline.fit_transform(
+                    X_train
+                )
+                logger.info("Running test preprocessing")
+                X_test_features = preprocessing_pipeline.transform(X_test)
+
+        with time_stage("fit_model", timings):
+            logger.info("Fitting model")
+            # Fit the model & generate predictions
+            model.fit(X=X_train_features, y=y_train.values.ravel())
+
+        with time_stage("score_model", timings):
+            logger.info("Scoring model")
+            # Basic Scores
+            train_score = model.score(
+                X=X_train_features,
+                y=y_train.values.ravel()
+            )
+            test_score = model.score(
+                X=X_test_features,
+                y=y_test.values.ravel()
+            )
+
+            # Precision
+            train_y_score = model.decision_function(X=X_train_features)
+            train_precision = average_precision_score(
+                y_true=y_train.values.ravel(),
+                y_score=train_y_score
+            )
+            test_y_score = model.decision_function(X=X_test_features)
+            test_precision = average_precision_score(
+                y_true=y_test.values.ravel(),
+                y_score=test_y_score
+            )
+
+            # Recall
+            train_predictions = model.predict(X=X_train_features)
+            train_recall = recall_score(
+                y_true=y_train,
+                y_pred=train_predictions,
+                average="macro"
+            )
+            test_predictions = model.predict(X=X_test_features)
+            test_recall = recall_score(
+                y_true=y_test,
+                y_pred=test_predictions,
+                average="macro"
+            )
+
+        with time_stage("cross_validation", timings):
+            logger.info("Cross-validating model")
+            # CV Scores
+            train_cv_score = cross_val_score(
+                estimator=model,
+                X=X_train_features,
+                y=y_train.values.ravel(),
+                cv=cv,
+                n_jobs=n_jobs
+            )
+            test_cv_score = cross_val_score(
+                estimator=model,
+                X=X_test_features,
+                y=y_test.values.ravel(),
+                cv=cv,
+                n_jobs=n_jobs
+            )
+
+        if not metrics_only:
+            with time_stage("visualisations", timings):
+                logger.info("Creating visualisations")
+                plots, rendered = create_visualisations(
+                    model=model,
+                    X_train_features=X_train_features,
+                    y_train=y_train,
+                    X_test_features=X_test_features,
+                    y_test=y_test,
+                    artifact_path=artifact_path,
+                    cache_path=plot_cache_path,
+                    n_jobs=n_jobs
+                )
+                for outpath in plots.values():
+                    log_artifact(outpath)
+
+        with time_stage("save_artifacts", timings):
+            logger.info("Saving data, artifacts & metrics")
+
+            # Save & log the Train & Test data
+            for name, df in dict(
+                X_train=X_train_features,
+                X_test=X_test_features,
+                y_train=y_train,
+                y_test=y_test
+            ).items():
+                outpath = save_data_artifact(
+                    df=df,
+                    artifact_path=artifact_path,
+                    name=name,
+                    artifact_format=artifact_format,
+                    compression=artifact_compression
+                )
+                log_artifact(outpath, artifact_path="data")
 
         # Log MLFlow Metrics
-        mlflow.log_metric("train_score", round(train_score * 100, 2))
-        mlflow.log_metric("test_score", round(test_score * 100, 2))
-        mlflow.log_metric("train_cv_score", round(mean(train_cv_score) * 100, 2))
-        mlflow.log_metric("test_cv_score", round(mean(test_cv_score) * 100, 2))
-        mlflow.log_metric("train_precision", round(train_precision * 100, 2))
-        mlflow.log_metric("test_precision", round(test_precision * 100, 2))
-        mlflow.log_metric("test_recall", round(test_recall * 100, 2))   
-        mlflow.log_metric("train_recall", round(train_recall * 100, 2))
+        log_metric("train_score", round(train_score * 100, 2))
+        log_metric("test_score", round(test_score * 100, 2))
+        log_metric("train_cv_score", round(mean(train_cv_score) * 100, 2))
+        log_metric("test_cv_score", round(mean(test_cv_score) * 100, 2))
+        log_metric("train_precision", round(train_precision * 100, 2))
+        log_metric("test_precision", round(test_precision * 100, 2))
+        log_metric("test_recall", round(test_recall * 100, 2))   
+        log_metric("train_recall", round(train_recall * 100, 2))
+
+        # Log the time taken by each stage
+        for stage, seconds in timings.items():
+            log_metric(f"{stage}_seconds", round(seconds, 3))
 
         return model
 
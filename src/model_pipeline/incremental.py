@@ -0,0 +1,374 @@
+from loguru import logger
+import sklearn
+import numpy as np
+import pandas as pd
+from sklearn.metrics import confusion_matrix
+from src.utils import time_stage
+from src.ingest_split import iter_raw_csv
+from src.tracking import (
+    log_param,
+    log_metric
+)
+
+
+class IncrementalMetrics:
+    """
+    Description
+    -----------
+    Accumulates the scores of a binary classifier over chunks of predictions
+    in constant memory, so a model can be evaluated on data larger than
+    memory. The accuracy & macro recall are computed from the accumulated
+    confusion matrix and match sklearn exactly. The average precision is
+    computed from histograms of the predicted probability of each class over
+    n_bins bins, which matches sklearn up to the ordering of scores within
+    a bin.
+
+    Parameters
+    ----------
+    classes: list
+        The negative & positive class, in that order.
+
+    n_bins: int
+        The number of bins of predicted probability used to compute the
+        average precision.
+
+    Attributes
+    ----------
+    confusion_: np.ndarray
+        The confusion matrix of the predictions so far
+
+    positive_counts_: np.ndarray
+        The number of positive records in each bin of predicted probability
+
+    negative_counts_: np.ndarray
+        The number of negative records in each bin of predicted probability
+
+    Examples
+    --------
+    metrics = IncrementalMetrics(classes=[0, 1])
+    for X, y in chunks:
+        metrics.update(
+            y_true=y,
+            y_pred=model.predict(X),
+            y_score=model.predict_proba(X)[:, 1]
+        )
+    metrics.results()
+    """
+
+    def __init__(self, classes: list, n_bins: int = 1000):
+        self.classes = list(classes)
+        self.n_bins = n_bins
+        self.confusion_ = np.zeros((2, 2), dtype=np.int64)
+        self.positive_counts_ = np.zeros(n_bins, dtype=np.int64)
+        self.negative_counts_ = np.zeros(n_bins, dtype=np.int64)
+
+    def update(self, y_true, y_pred, y_score):
+        """Add the predictions & positive class probabilities of a chunk"""
+
+        y_true = np.asarray(y_true).ravel()
+        self.confusion_ += confusion_matrix(
+            y_true,
+            np.asarray(y_pred).ravel(),
+            labels=self.classes
+        )
+
+        bins = np.clip(
+            (np.asarray(y_score) * self.n_bins).astype(int),
+            0,
+            self.n_bins - 1
+        )
+        positive = y_true == self.classes[1]
+        self.positive_counts_ += np.bincount(
+            bins[positive],
+            minlength=self.n_bins
+        )
+        self.negative_counts_ += np.bincount(
+            bins[~positive],
+            minlength=self.n_bins
+        )
+
+        return self
+
+    def results(self):
+        """
+        The number of records, accuracy (score), average precision
+        (precision) & macro recall (recall) of the predictions so far
+        """
+
+        records = self.confusion_.sum()
+        recalls = np.diag(self.confusion_) / np.maximum(
+            self.confusion_.sum(axis=1),
+            1
+        )
+
+        # Sweep the threshold from the highest bin to the lowest, summing the
+        # precision at each threshold weighted by the increase in recall
+        true_positives = np.cumsum(self.positive_counts_[::-1])
+        predicted_positives = true_positives + np.cumsum(
+            self.negative_counts_[::-1]
+        )
+        precision = true_positives / np.maximum(predicted_positives, 1)
+        recall_increase = self.positive_counts_[::-1] / max(
+            true_positives[-1],
+            1
+        )
+
+        return dict(
+            records=int(records),
+            score=np.trace(self.confusion_) / max(records, 1),
+            precision=float((precision * recall_increase).sum()),
+            recall=float(recalls.mean())
+        )
+
+
+def _split_chunk(
+    df: pd.core.frame.DataFrame,
+    uid: str,
+    train_size: float,
+    test_size: float,
+    random_state: int
+):
+    """
+    Splits a chunk into train & test records by hashing the uid of each
+    record, so every record is assigned to the same split on each pass over
+    the data regardless of the chunk size
+    """
+
+    buckets = (
+        pd.util.hash_array(
+            df[uid].to_numpy(),
+            hash_key=f"{random_state:016d}"[:16]
+        )
+        % 1000000
+    ) / 1000000
+    train = buckets < train_size
+    test = (buckets >= train_size) & (buckets < train_size + test_size)
+
+    return df[train], df[test]
+
+
+def _fit_preprocessing(
+    preprocessing_pipeline: sklearn.pipeline.Pipeline,
+    chunks,
+    df_first: pd.core.frame.DataFrame,
+    target: str
+):
+    """
+    Fits each step of the preprocessing pipeline in turn. Steps with
+    partial_fit, e.g. the imputer & scaler, are fitted to the train records
+    of every chunk, preprocessed by the steps before them, over a pass of the
+    file each so their statistics are those of all of the train records. The
+    other steps are fitted to the train records of the first chunk, df_first.
+    """
+
+    steps = preprocessing_pipeline.steps
+
+    def preprocess(df, index):
+        """Preprocess df with the fitted steps before the step at index"""
+
+        X = df.drop(target, axis=1)
+        for _, step in steps[:index]:
+            X = step.transform(X)
+
+        return X
+
+    for index, (name, step) in enumerate(steps):
+        if hasattr(step, "partial_fit"):
+            logger.info(f"Fitting {name} to every chunk")
+            for df_train, _ in chunks():
+                if len(df_train) > 0:
+                    step.partial_fit(preprocess(df_train, index))
+
+        else:
+            step.fit(preprocess(df_first, index))
+
+
+def evaluate_model_incremental(
+    preprocessing_pipeline: sklearn.pipeline.Pipeline,
+    model: sklearn,
+    train_test_raw_path: str,
+    target: str,
+    uid: str,
+    ingest_split_parameters: dict,
+    chunk_size: int,
+    n_epochs: int,
+    classes: list = None,
+    n_bins: int = 1000
+):
+    """
+    Description
+    -----------
+    Out-of-core equivalent of evaluate_model, which trains & evaluates an
+    incremental model, e.g. created via create_sgd_model, on a raw csv file
+    larger than memory. Only a chunk of chunk_size records is held in memory
+    at once.
+
+    Each chunk is split into train & test records by a hash of the uid, in
+    the train_size & test_size proportions of ingest_split_parameters, so the
+    splits are the same on every pass over the file.
+
+    Evaluation steps:
+        1. Fit the preprocessing_pipeline to the train records. The steps
+           with partial_fit, the imputer & scaler, learn their statistics
+           from every chunk over a pass of the file each, the other steps
+           from the first chunk
+        2. Preprocess each chunk & fit the model to its train records via
+           partial_fit, shuffling the records of each chunk, for n_epochs
+           passes over the file
+        3. Score the model with IncrementalMetrics over a final pass
+        4. Logs metrics with MLFLow, with the same names as evaluate_model
+
+    Cross validation & the visualisations of evaluate_model need the data
+    in memory so aren't run.
+
+    Parameters
+    ---------
+    preprocessing_pipeline: sklearn.pipeline.Pipeline
+        The scikit-learn pipeline used to preprocess the data
+
+    model: sklearn
+        The incremental model to evaluate, which implements partial_fit &
+        predict_proba
+
+    train_test_raw_path: str
+        Location of the raw train & test csv file.
+
+    target: str
+        The target column.
+
+    uid: str
+        The unique identifier column used to split the records.
+
+    ingest_split_parameters: dict
+        The train_size, test_size, random_state & dtypes used to read &
+        split the data.
+
+    chunk_size: int
+        The number of records read, preprocessed & fitted at a time.
+
+    n_epochs: int
+        The number of passes over the training records.
+
+    classes: list
+        The classes of the target. None uses the classes of the first chunk.
+
+    n_bins: int
+        The number of bins used to compute the average precision, see
+        IncrementalMetrics.
+
+    Returns:
+    --------
+    model: sklearn
+        The fitted and evaluated model.
+
+    Raises
+    ------
+    Exception: Exception
+        Generic exception for logging
+
+    Examples
+    --------
+    model = evaluate_model_incremental(
+        preprocessing_pipeline=preprocessing_pipeline,
+        model=sgd_model,
+        train_test_raw_path="path/to/train_test_raw.csv",
+        target="Survived",
+        uid="PassengerId",
+        ingest_split_parameters=ingest_split_parameters,
+        chunk_size=100000,
+        n_epochs=5
+    )
+    """
+
+    logger.info("Running evaluate_model_incremental()")
+
+    try:
+        timings = dict()
+        random_state = ingest_split_parameters["random_state"]
+        rng = np.random.default_rng(random_state)
+
+        # Log MLflow parameters
+        log_param("train_size", ingest_split_parameters["train_size"])
+        log_param("test_size", ingest_split_parameters["test_size"])
+        log_param("random_state", random_state)
+        log_param("chunk_size", chunk_size)
+        log_param("n_epochs", n_epochs)
+
+        def chunks():
+            """Yields the train & test records of each chunk of the file"""
+
+            for df_chunk in iter_raw_csv(
+                path=train_test_raw_path,
+                chunk_size=chunk_size,
+                dtypes=ingest_split_parameters.get("dtypes")
+            ):
+                yield _split_chunk(
+                    df=df_chunk,
+                    uid=uid,
+                    train_size=ingest_split_parameters["train_size"],
+                    test_size=ingest_split_parameters["test_size"],
+                    random_state=random_state
+                )
+
+        with time_stage("preprocessing", timings):
+            logger.info("Fitting preprocessing")
+            df_first, _ = next(chunks())
+            _fit_preprocessing(
+                preprocessing_pipeline=preprocessing_pipeline,
+                chunks=chunks,
+                df_first=df_first,
+                target=target
+            )
+            if classes is None:
+                classes = np.unique(df_first[target])
+
+        with time_stage("fit_model", timings):
+            for epoch in range(n_epochs):
+                logger.info(f"Fitting model, epoch {epoch + 1}/{n_epochs}")
+                for df_train, _ in chunks():
+                    df_train = df_train.iloc[rng.permutation(len(df_train))]
+                    model.partial_fit(
+                        X=preprocessing_pipeline.transform(
+                            df_train.drop(target, axis=1)
+                        ),
+                        y=df_train[target].to_numpy(),
+                        classes=classes
+                    )
+
+        with time_stage("score_model", timings):
+            logger.info("Scoring model")
+            metrics = dict(
+                train=IncrementalMetrics(classes=classes, n_bins=n_bins),
+                test=IncrementalMetrics(classes=classes, n_bins=n_bins)
+            )
+            for df_train, df_test in chunks():
+                for name, df in dict(train=df_train, test=df_test).items():
+                    if len(df) == 0:
+                        continue
+                    X_features = preprocessing_pipeline.transform(
+                        df.drop(target, axis=1)
+                    )
+                    metrics[name].update(
+                        y_true=df[target].to_numpy(),
+                        y_pred=model.predict(X_features),
+                        y_score=model.predict_proba(X_features)[:, 1]
+                    )
+
+        # Log MLFlow Metrics
+        for name, name_metrics in metrics.items():
+            results = name_metrics.results()
+            log_metric(f"{name}_records", results["records"])
+            for metric in ["score", "precision", "recall"]:
+                log_metric(
+                    f"{name}_{metric}",
+                    round(results[metric] * 100, 2)
+                )
+
+        # Log the time taken by each stage
+        for stage, seconds in timings.items():
+            log_metric(f"{stage}_seconds", round(seconds, 3))
+
+        return model
+
+    except Exception:
+        logger.exception("Error running evaluate_model_incremental()")
@@ -1,10 +1,38 @@
-from loguru import logger
 from copy import copy
+from loguru import logger
 import sklearn
 import pandas as pd
 import mlflow
 import mlflow.sklearn
 from mlflow.models.signature import infer_signature
+from sklearn.linear_model import LogisticRegression
+from src.serving import (
+    compile_model_pipeline,
+    export_onnx_model,
+    ONNX_MODEL_FILE
+)
+
+
+def _signature_input(X: pd.core.frame.DataFrame):
+    """
+    Converts the compact dtypes applied at ingestion to the types of a json
+    request, which the signature is enforced against when serving via MLFlow.
+    Categoricals are strings, floats are doubles and nullable ints are doubles
+    as they may be missing.
+    """
+
+    dtypes = {}
+
+    for column, dtype in X.dtypes.items():
+        if isinstance(dtype, pd.CategoricalDtype):
+            dtypes[column] = object
+        elif pd.api.types.is_float_dtype(dtype) or (
+            pd.api.types.is_extension_array_dtype(dtype)
+            and pd.api.types.is_integer_dtype(dtype)
+        ):
+            dtypes[column] = "float64"
+
+    return X.astype(dtypes)
 
 
 def create_model_pipeline(
@@ -13,7 +41,8 @@ def create_model_pipeline(
     model_name: str,
     X_train: pd.core.frame.DataFrame,
     artifact_path: str,
-    models_path: str
+    models_path: str,
+    export_onnx: bool = False
 ):
     """
     Description
@@ -25,6 +54,19 @@ def create_model_pipeline(
     Also create the signature (the input and output format of the data) via
     the MLFlow infer_signature funciton.
 
+    Instrumented steps, created when the preprocessing_parameters instrument
+    is set, are kept so the time, rows & memory of each step can be measured
+    when the deployed model pipeline scores records, see score_file and the
+    /steps endpoint of the model server.
+
+    Logistic Regression models are also compiled via compile_model_pipeline
+    and saved as compiled_model.json alongside the MLFlow model to enable
+    low latency scoring of single records.
+
+    With export_onnx set, Logistic Regression models are also exported via
+    export_onnx_model and saved as model.onnx alongside the MLFlow model to
+    enable scoring with ONNX Runtime, which requires the onnx package.
+
     Parameters
     ---------
     preprocessing_pipeline: sklearn.pipeline.Pipeline
@@ -48,6 +90,9 @@ def create_model_pipeline(
     models_path: str
         The location of where to save the MLFLow model pipeline.
 
+    export_onnx: bool
+        Export the model pipeline to ONNX.
+
 
     Returns:
     --------
@@ -81,13 +126,13 @@ def create_model_pipeline(
     try:
         # Append the preprocessing & model pipelines
         model_pipeline = copy(preprocessing_pipeline)
-        model_pipeline.steps.append(
+        model_pipeline.steps = preprocessing_pipeline.steps + [
             ["Model", model]
-        )
+        ]
 
         # Infer the signature for the model
         signature = infer_signature(
-            model_input=X_train,
+            model_input=_signature_input(X_train),
             model_output=model_pipeline.predict(X_train)
         )
 
@@ -108,6 +153,18 @@ def create_model_pipeline(
             signature=signature
         )
 
+        # Save the compiled model for low latency scoring
+        if isinstance(model, LogisticRegression):
+            compiled_model = compile_model_pipeline(model_pipeline)
+            compiled_model.save(f"{models_path}/compiled_model.json")
+
+            # Save the ONNX model for scoring via ONNX Runtime
+            if export_onnx:
+                export_onnx_model(
+                    model_pipeline=model_pipeline,
+                    path=f"{models_path}/{ONNX_MODEL_FILE}"
+                )
+
         return model_pipeline, model
 
     except Exception:
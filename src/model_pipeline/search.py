@@ -0,0 +1,265 @@
+from loguru import logger
+import sklearn
+import pandas as pd
+from scipy import stats
+from sklearn.base import clone
+from sklearn.experimental import enable_halving_search_cv  # noqa: F401
+from sklearn.model_selection import (
+    GridSearchCV,
+    RandomizedSearchCV,
+    HalvingGridSearchCV
+)
+from src.tracking import (
+    log_param,
+    log_metric,
+    start_run
+)
+
+
+# The scipy.stats distributions which can be used in random search spaces
+DISTRIBUTIONS = {
+    "uniform": lambda low, high: stats.uniform(loc=low, scale=high - low),
+    "loguniform": stats.loguniform,
+    "randint": stats.randint
+}
+
+
+def _parse_search_space(search_space: dict, search_type: str):
+    """
+    Converts the search space from parameters.yaml into the format expected
+    by the scikit-learn search. Hyperparameters are either a list of values
+    or, for random search only, a dictionary of a distribution with its low
+    and high values e.g. dict(distribution="loguniform", low=0.01, high=10)
+    """
+
+    parsed = {}
+
+    for hyperparameter, values in search_space.items():
+        if isinstance(values, dict):
+            if search_type != "random":
+                raise ValueError(
+                    f"The {hyperparameter} distribution can only be used by "
+                    f"random search, supply a list of values for "
+                    f"{search_type} search"
+                )
+            parsed[hyperparameter] = DISTRIBUTIONS[values["distribution"]](
+                values["low"],
+                values["high"]
+            )
+        else:
+            parsed[hyperparameter] = list(values)
+
+    return parsed
+
+
+def _create_search(
+    model: sklearn,
+    search_space: dict,
+    search_parameters: dict,
+    cv: int,
+    n_jobs: int
+):
+    """Creates the scikit-learn search for the configured search_type"""
+
+    search_type = search_parameters["search_type"]
+    search_space = _parse_search_space(search_space, search_type)
+    common = dict(
+        estimator=model,
+        scoring=search_parameters["scoring"],
+        cv=cv,
+        n_jobs=n_jobs
+    )
+
+    if search_type == "grid":
+        return GridSearchCV(param_grid=search_space, **common)
+
+    if search_type == "random":
+        return RandomizedSearchCV(
+            param_distributions=search_space,
+            n_iter=search_parameters["n_iter"],
+            random_state=search_parameters["random_state"],
+            **common
+        )
+
+    if search_type == "halving":
+        return HalvingGridSearchCV(
+            param_grid=search_space,
+            factor=search_parameters["factor"],
+            random_state=search_parameters["random_state"],
+            **common
+        )
+
+    raise ValueError(
+        f"Unknown search_type {search_type}, use grid, random or halving"
+    )
+
+
+def _log_trials(search, model_name: str):
+    """Logs each trial of a fitted search as a nested MLFlow run"""
+
+    cv_results = pd.DataFrame(search.cv_results_)
+
+    for trial, result in cv_results.iterrows():
+        with start_run(
+            run_name=f"{model_name}_trial_{trial:03d}",
+            nested=True
+        ):
+            log_param("model_name", model_name)
+            for hyperparameter, value in result["params"].items():
+                log_param(hyperparameter, value)
+
+            # Successive halving trials are scored on a subset of the data
+            if "n_resources" in result:
+                log_param("iteration", result["iter"])
+                log_param("n_resources", result["n_resources"])
+
+            log_metric(
+                "mean_cv_score",
+                round(result["mean_test_score"] * 100, 2)
+            )
+            log_metric(
+                "std_cv_score",
+                round(result["std_test_score"] * 100, 2)
+            )
+            log_metric("mean_fit_seconds", result["mean_fit_time"])
+            log_metric("rank", result["rank_test_score"])
+
+
+def search_hyperparameters(
+    preprocessing_pipeline: sklearn.pipeline.Pipeline,
+    model: sklearn,
+    model_name: str,
+    X_train: pd.core.frame.DataFrame,
+    y_train: pd.core.frame.DataFrame,
+    search_space: dict,
+    search_parameters: dict,
+    cv: int,
+    n_jobs: int = None,
+    X_train_features: pd.core.frame.DataFrame = None
+):
+    """
+    Description
+    -----------
+    Searches for the best hyperparameters of the supplied model via grid,
+    random or successive halving search and returns a copy of the model with
+    the best hyperparameters, unfitted.
+
+    The preprocessing doesn't change between trials so the training features
+    are created once and shared by every trial, which are run in parallel
+    across n_jobs processes. Each trial is logged as a nested MLFlow run under
+    the active run and the best hyperparameters and score are logged to the
+    active run with a best_ prefix.
+
+    Parameters
+    ----------
+    preprocessing_pipeline: sklearn.pipeline.Pipeline
+        The scikit-learn pipeline used to preprocess the data
+
+    model: sklearn
+        The model to search the hyperparameters of, e.g. created via
+        create_logreg_model.
+
+    model_name: str
+        The name of the model
+
+    X_train: pd.core.frame.DataFrame
+        The dataframe of features for training the model.
+
+    y_train: pd.core.frame.DataFrame
+        The dataframe containing the target for training the model.
+
+    search_space: dict
+        The values of each hyperparameter to search. Each hyperparameter is
+        either a list of values or, for random search, a dictionary containing
+        a distribution (uniform, loguniform or randint) and its low and high
+        values.
+
+    search_parameters: dict
+        The search_type (grid, random or halving) and scoring metric, as well
+        as the n_iter for random search, the factor for halving search and
+        the random_state.
+
+    cv: int
+        The number of cross-validation folds to score each trial with.
+
+    n_jobs: int
+        The number of processes to run the trials in. None runs them in the
+        current process and -1 uses all of the available cores.
+
+    X_train_features: pd.core.frame.DataFrame
+        The precomputed training features, e.g. loaded from the FeatureCache,
+        in which case the preprocessing isn't run.
+
+    Returns
+    -------
+    model: sklearn
+        The unfitted model with the best hyperparameters
+
+    Raises
+    ------
+    Exception: Exception
+        Generic exception for logging
+
+    Examples
+    --------
+    model = search_hyperparameters(
+        preprocessing_pipeline=preprocessing_pipeline,
+        model=model,
+        model_name="logreg_v000",
+        X_train=X_train,
+        y_train=y_train,
+        search_space=dict(
+            C=dict(distribution="loguniform", low=0.01, high=100)
+        ),
+        search_parameters=dict(
+            search_type="random",
+            scoring="accuracy",
+            n_iter=20,
+            factor=3,
+            random_state=43
+        ),
+        cv=5,
+        n_jobs=-1
+    )
+    """
+
+    logger.info("Running search_hyperparameters()")
+
+    try:
+        # Create the features once for every trial
+        if X_train_features is None:
+            X_train_features = (
+                clone(preprocessing_pipeline).fit_transform(X_train)
+            )
+
+        search = _create_search(
+            model=model,
+            search_space=search_space,
+            search_parameters=search_parameters,
+            cv=cv,
+            n_jobs=n_jobs
+        )
+        search.set_params(refit=False)
+        search.fit(X_train_features, y_train.values.ravel())
+
+        _log_trials(search=search, model_name=model_name)
+
+        # Log the best hyperparameters & score to the parent run
+        log_param("search_type", search_parameters["search_type"])
+        log_param("search_trials", len(search.cv_results_["params"]))
+        for hyperparameter, value in search.best_params_.items():
+            log_param(f"best_{hyperparameter}", value)
+        log_metric(
+            "best_cv_score",
+            round(search.best_score_ * 100, 2)
+        )
+
+        logger.info(
+            f"Best hyperparameters {search.best_params_} scored "
+            f"{search.best_score_:.4f}"
+        )
+
+        return clone(model).set_params(**search.best_params_)
+
+    except Exception:
+        logger.exception("Error running search_hyperparameters()")
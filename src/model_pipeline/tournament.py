@@ -0,0 +1,235 @@
+import time
+from statistics import mean
+from loguru import logger
+import numpy as np
+import pandas as pd
+from joblib import (
+    Parallel,
+    delayed
+)
+from sklearn.base import clone
+from sklearn.model_selection import cross_val_score
+from sklearn.metrics import (
+    average_precision_score,
+    recall_score,
+)
+from src.models import create_model
+from src.tracking import (
+    log_param,
+    log_metric,
+    set_tag,
+    start_run
+)
+
+
+def _to_array(df: pd.core.frame.DataFrame):
+    """
+    The values of a DataFrame of features as an array, which is a view of
+    float features, e.g. memory mapped float32 features from a FeatureStore,
+    rather than a float64 copy
+    """
+
+    if all(pd.api.types.is_float_dtype(dtype) for dtype in df.dtypes):
+        return df.to_numpy()
+
+    return df.to_numpy(dtype=np.float64)
+
+
+def _fit_score(
+    model,
+    X_train: np.ndarray,
+    y_train: np.ndarray,
+    X_test: np.ndarray,
+    y_test: np.ndarray,
+    cv: int
+):
+    """
+    Fits a model & scores it with the metrics of evaluate_model, run in a
+    worker process of run_tournament
+    """
+
+    start = time.perf_counter()
+    model.fit(X_train, y_train)
+    metrics = dict(fit_seconds=time.perf_counter() - start)
+
+    for name, X, y in [("train", X_train, y_train), ("test", X_test, y_test)]:
+        metrics[f"{name}_score"] = model.score(X, y)
+        metrics[f"{name}_precision"] = average_precision_score(
+            y_true=y,
+            y_score=model.decision_function(X)
+        )
+        metrics[f"{name}_recall"] = recall_score(
+            y_true=y,
+            y_pred=model.predict(X),
+            average="macro"
+        )
+
+    metrics["train_cv_score"] = mean(
+        cross_val_score(estimator=clone(model), X=X_train, y=y_train, cv=cv)
+    )
+
+    return metrics
+
+
+def run_tournament(
+    hyperparameters: dict,
+    X_train_features: pd.core.frame.DataFrame,
+    y_train: pd.core.frame.DataFrame,
+    X_test_features: pd.core.frame.DataFrame,
+    y_test: pd.core.frame.DataFrame,
+    metric: str = "train_cv_score",
+    n_jobs: int = None
+):
+    """
+    Description
+    -----------
+    Trains & scores a model of each of the supplied model families in
+    parallel and returns an unfitted model of the family with the best
+    metric, to be evaluated & deployed in place of a single model.
+
+    Each model is created in a nested MLFlow run under the active run, which
+    records its hyperparameters & metrics, with the same names as
+    evaluate_model. The models are fitted to the same precomputed features,
+    which are converted to arrays once and shared with the n_jobs worker
+    processes as read-only memory mapped files rather than copied to each.
+    The metric of each family and the winner are logged to the active run,
+    and the winning model is created again in the active run so its
+    hyperparameters are recorded with its evaluation.
+
+    Parameters
+    ----------
+    hyperparameters: dict
+        The hyperparameters of each model family to train, e.g. dict(
+        logreg=parameters["logreg_hyperparameters"]), see MODEL_FAMILIES.
+
+    X_train_features: pd.core.frame.DataFrame
+        The preprocessed features for training the models.
+
+    y_train: pd.core.frame.DataFrame
+        The dataframe containing the target for training the models.
+
+    X_test_features: pd.core.frame.DataFrame
+        The preprocessed features for testing the models.
+
+    y_test: pd.core.frame.DataFrame
+        The dataframe containing the target for testing the models.
+
+    metric: str
+        The metric to pick the best model by, higher is better, e.g.
+        train_cv_score or test_score.
+
+    n_jobs: int
+        The number of processes to train the models in. None trains them in
+        the current process and -1 uses all of the available cores.
+
+    Returns
+    -------
+    model_family: str
+        The family of the best model
+
+    model: sklearn
+        The unfitted best model
+
+    model_name: str
+        The name of the best model
+
+    cv: int
+        The number of cross-validation folds to perform when evaluating the
+        best model
+
+    Raises
+    ------
+    Exception: Exception
+        Generic exception for logging
+
+    Examples
+    --------
+    model_family, model, model_name, cv = run_tournament(
+        hyperparameters=dict(
+            logreg=parameters["logreg_hyperparameters"],
+            svc=parameters["svc_hyperparameters"]
+        ),
+        X_train_features=X_train_features,
+        y_train=y_train,
+        X_test_features=X_test_features,
+        y_test=y_test,
+        metric="train_cv_score",
+        n_jobs=-1
+    )
+    """
+
+    logger.info("Running run_tournament()")
+
+    try:
+        # Create each model in a nested run, which records its
+        # hyperparameters
+        entrants = {}
+        for model_family, family_hyperparameters in hyperparameters.items():
+            with start_run(run_name=model_family, nested=True) as run:
+                model, model_name, cv = create_model(
+                    model_family=model_family,
+                    hyperparameters=family_hyperparameters
+                )
+                set_tag("model_family", model_family)
+            entrants[model_family] = dict(
+                model=model,
+                cv=cv,
+                run_id=run.info.run_id
+            )
+
+        # Convert the features to arrays once, which joblib shares with the
+        # workers as read-only memory maps
+        data = dict(
+            X_train=_to_array(X_train_features),
+            y_train=y_train.values.ravel(),
+            X_test=_to_array(X_test_features),
+            y_test=y_test.values.ravel()
+        )
+
+        logger.info(f"Training {list(entrants)} across {n_jobs} processes")
+        results = dict(zip(
+            entrants,
+            Parallel(n_jobs=n_jobs)(
+                delayed(_fit_score)(
+                    model=entrant["model"],
+                    cv=entrant["cv"],
+                    **data
+                )
+                for entrant in entrants.values()
+            )
+        ))
+
+        # Log the metrics of each model to its run & the parent run
+        for model_family, metrics in results.items():
+            run_id = entrants[model_family]["run_id"]
+            log_metric(
+                "fit_seconds",
+                round(metrics.pop("fit_seconds"), 3),
+                run_id=run_id
+            )
+            for key, value in metrics.items():
+                log_metric(key, round(value * 100, 2), run_id=run_id)
+            log_metric(
+                f"{model_family}_{metric}",
+                round(metrics[metric] * 100, 2)
+            )
+
+        winner = max(results, key=lambda family: results[family][metric])
+        logger.info(
+            f"{winner} won the tournament with a {metric} of "
+            f"{results[winner][metric]:.4f}"
+        )
+        log_param("tournament_metric", metric)
+        log_param("tournament_winner", winner)
+        set_tag("tournament_winner", True, run_id=entrants[winner]["run_id"])
+
+        # Create the winning model in the parent run
+        model, model_name, cv = create_model(
+            model_family=winner,
+            hyperparameters=hyperparameters[winner]
+        )
+
+        return winner, model, model_name, cv
+
+    except Exception:
+        logger.exception("Error running run_tournament()")
@@ -0,0 +1,226 @@
+import os
+import shutil
+from pathlib import Path
+from loguru import logger
+import joblib
+from joblib import (
+    Parallel,
+    delayed
+)
+import sklearn
+import pandas as pd
+import matplotlib
+import matplotlib.pyplot as plt
+from yellowbrick.features import Rank1D
+from yellowbrick.classifier import ConfusionMatrix
+from yellowbrick.model_selection import LearningCurve
+from scikitplot.metrics import plot_roc
+
+
+def _use_agg_backend():
+    """Renders plots to files without a display in each worker process"""
+
+    matplotlib.use("Agg")
+
+
+def _render(plot, model, X, y, outpath, n_jobs):
+    """
+    Renders a plot with the Agg backend, in the current process or a worker
+    process of create_visualisations
+    """
+
+    _use_agg_backend()
+    plot(model, X, y, outpath, n_jobs)
+
+
+def plot_learning_curve(model, X_train_features, y_train, outpath, n_jobs):
+    """Learning Curve Visualisation"""
+
+    learning_curve = LearningCurve(
+        model,
+        scoring='accuracy',
+        size=(1080, 720),
+        n_jobs=n_jobs
+    )
+    learning_curve.fit(X_train_features, y_train.values.ravel())
+    learning_curve.show(outpath=outpath)
+    plt.close()
+
+
+def plot_feature_rank(model, X_train_features, y_train, outpath, n_jobs):
+    """Feature Ranking Visualisation"""
+
+    feature_rank = Rank1D(
+        algorithm='shapiro',
+        features=X_train_features.columns.tolist(),
+        size=(1080, 720)
+    )
+    feature_rank.fit(X_train_features, y_train.values.ravel())
+    feature_rank.transform(X_train_features)
+    feature_rank.show(outpath=outpath)
+    plt.close()
+
+
+def plot_confusion_matrix(model, X_test_features, y_test, outpath, n_jobs):
+    """Confusion Matrix Visualisation"""
+
+    confusion_matrix = ConfusionMatrix(
+        model,
+        classes=[0, 1],
+        size=(1080, 720),
+        is_fitted=True
+    )
+    confusion_matrix.score(X_test_features, y_test.values.ravel())
+    confusion_matrix.show(outpath=outpath)
+    plt.close()
+
+
+def plot_roc_auc(model, X_test_features, y_test, outpath, n_jobs):
+    """ROCAUC Visualisation"""
+
+    y_probas = model.predict_proba(X_test_features)
+    plot_roc(y_test.values.ravel(), y_probas)
+    plt.savefig(fname=outpath)
+    plt.close()
+
+
+# The plots created for each model & whether they use the train or test data
+PLOTS = dict(
+    learning_curve=(plot_learning_curve, "train"),
+    feature_importance=(plot_feature_rank, "train"),
+    confusion_matrix=(plot_confusion_matrix, "test"),
+    roc_auc=(plot_roc_auc, "test")
+)
+
+
+def create_visualisations(
+    model: sklearn,
+    X_train_features: pd.core.frame.DataFrame,
+    y_train: pd.core.frame.DataFrame,
+    X_test_features: pd.core.frame.DataFrame,
+    y_test: pd.core.frame.DataFrame,
+    artifact_path: str,
+    cache_path: str = None,
+    n_jobs: int = None
+):
+    """
+    Description
+    -----------
+    Creates the learning curve, feature importance, confusion matrix and
+    ROC AUC plots for a fitted model as .png files in artifact_path.
+
+    The plots are independent of each other so are rendered in parallel in a
+    pool of n_jobs joblib worker processes. They're always rendered with the
+    non-interactive Agg backend, including when they're rendered in the
+    current process. Memory mapped features, e.g. loaded from a FeatureStore, are
+    passed to the workers by reference rather than copied into each.
+
+    Each plot is identified by a hash of the plot, the fitted model and the
+    data it's drawn from. When a cache_path is supplied, rendered plots are
+    stored in it under their hash and a plot whose hash is already in the
+    cache is copied from it rather than rendered again.
+
+    Parameters
+    ----------
+    model: sklearn
+        The fitted model
+
+    X_train_features: pd.core.frame.DataFrame
+        The dataframe of features the model was trained on.
+
+    y_train: pd.core.frame.DataFrame
+        The dataframe containing the target the model was trained on.
+
+    X_test_features: pd.core.frame.DataFrame
+        The dataframe of features for testing the model.
+
+    y_test: pd.core.frame.DataFrame
+        The dataframe containing the target for testing the model.
+
+    artifact_path: str
+        The location to save the plots to.
+
+    cache_path: str
+        The location of the plot cache. None renders every plot.
+
+    n_jobs: int
+        The number of processes to render the plots in. None renders them in
+        the current process and -1 uses all of the available cores.
+
+    Returns
+    -------
+    plots: dict
+        The location of each plot
+
+    rendered: list
+        The names of the plots which were rendered rather than copied from
+        the cache
+
+    Raises
+    ------
+    None
+
+    Examples
+    --------
+    plots, rendered = create_visualisations(
+        model=model,
+        X_train_features=X_train_features,
+        y_train=y_train,
+        X_test_features=X_test_features,
+        y_test=y_test,
+        artifact_path="path/to/folder",
+        cache_path="path/to/cache",
+        n_jobs=-1
+    )
+    """
+
+    logger.info("Running create_visualisations()")
+
+    data = dict(
+        train=(X_train_features, y_train),
+        test=(X_test_features, y_test)
+    )
+    plots = {}
+    to_render = {}
+
+    if cache_path is not None:
+        Path(cache_path).mkdir(parents=True, exist_ok=True)
+
+    for name, (plot, data_name) in PLOTS.items():
+        outpath = f"{artifact_path}/{name}.png"
+        plots[name] = outpath
+        X, y = data[data_name]
+
+        if cache_path is None:
+            to_render[name] = (plot, X, y, outpath, None)
+            continue
+
+        cached_path = (
+            f"{cache_path}/{joblib.hash((name, model, X, y))}.png"
+        )
+        if os.path.exists(cached_path):
+            shutil.copyfile(cached_path, outpath)
+        else:
+            to_render[name] = (plot, X, y, outpath, cached_path)
+
+    logger.info(
+        f"Rendering {list(to_render)}, "
+        f"{len(plots) - len(to_render)} plots loaded from the cache"
+    )
+
+    if n_jobs is None or n_jobs == 1 or len(to_render) <= 1:
+        for plot, X, y, outpath, _ in to_render.values():
+            _render(plot, model, X, y, outpath, n_jobs)
+
+    else:
+        max_workers = os.cpu_count() if n_jobs < 0 else n_jobs
+        Parallel(n_jobs=min(max_workers, len(to_render)))(
+            delayed(_render)(plot, model, X, y, outpath, n_jobs)
+            for plot, X, y, outpath, _ in to_render.values()
+        )
+
+    for _, _, _, outpath, cached_path in to_render.values():
+        if cached_path is not None:
+            shutil.copyfile(outpath, cached_path)
+
+    return plots, list(to_render)
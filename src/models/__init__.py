@@ -1,7 +1,15 @@
 from src.models.logreg_model import create_logreg_model
 from src.models.svc_model import create_svc_model
+from src.models.sgd_model import create_sgd_model
+from src.models.families import (
+    MODEL_FAMILIES,
+    create_model
+)
 
 __all__ = [
     "create_logreg_model",
-    "create_svc_model"
+    "create_svc_model",
+    "create_sgd_model",
+    "MODEL_FAMILIES",
+    "create_model"
 ]
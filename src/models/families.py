@@ -0,0 +1,61 @@
+from src.models.logreg_model import create_logreg_model
+from src.models.svc_model import create_svc_model
+from src.models.sgd_model import create_sgd_model
+
+
+# The function which creates each model family, whose hyperparameters are
+# the <family>_hyperparameters section of parameters.yaml
+MODEL_FAMILIES = dict(
+    logreg=create_logreg_model,
+    svc=create_svc_model,
+    sgd=create_sgd_model
+)
+
+
+def create_model(model_family: str, hyperparameters: dict):
+    """
+    Description
+    -----------
+    Creates a model of the supplied family via its create_*_model function,
+    which also tracks the hyperparameters in MLFlow.
+
+    Parameters
+    ----------
+    model_family: str
+        The model family, one of logreg, svc or sgd.
+
+    hyperparameters: dict
+        The hyperparameters for the model
+
+    Returns
+    -------
+    model: sklearn
+        The unfitted model
+
+    model_name: str
+        The name of the model
+
+    cv: int
+        The number of cross-validation folds to perform when evaluating the
+        model
+
+    Raises
+    ------
+    ValueError:
+        If the model_family isn't one of MODEL_FAMILIES
+
+    Examples
+    --------
+    model, model_name, cv = create_model(
+        model_family="svc",
+        hyperparameters=parameters["svc_hyperparameters"]
+    )
+    """
+
+    if model_family not in MODEL_FAMILIES:
+        raise ValueError(
+            f"Unknown model_family {model_family}, use one of "
+            f"{list(MODEL_FAMILIES)}"
+        )
+
+    return MODEL_FAMILIES[model_family](hyperparameters)
@@ -1,6 +1,6 @@
 from loguru import logger
 from sklearn.linear_model import LogisticRegression
-import mlflow
+from src.tracking import log_param
 
 
 def create_logreg_model(logreg_hyperparameters: dict):
@@ -62,14 +62,14 @@ def create_logreg_model(logreg_hyperparameters: dict):
         )
 
         # Log the parameters with MLFlow
-        mlflow.log_param("model_name", logreg_hyperparameters["model_name"])
-        mlflow.log_param("model_type", logreg_hyperparameters["model_type"])
-        mlflow.log_param("penalty", logreg_hyperparameters["penalty"])
-        mlflow.log_param("C", logreg_hyperparameters["C"])
-        mlflow.log_param("solver", logreg_hyperparameters["solver"])
-        mlflow.log_param("max_iter", logreg_hyperparameters["max_iter"])
-        mlflow.log_param("n_jobs", logreg_hyperparameters["n_jobs"])
-        mlflow.log_param("cv", logreg_hyperparameters["cv"])
+        log_param("model_name", logreg_hyperparameters["model_name"])
+        log_param("model_type", logreg_hyperparameters["model_type"])
+        log_param("penalty", logreg_hyperparameters["penalty"])
+        log_param("C", logreg_hyperparameters["C"])
+        log_param("solver", logreg_hyperparameters["solver"])
+        log_param("max_iter", logreg_hyperparameters["max_iter"])
+        log_param("n_jobs", logreg_hyperparameters["n_jobs"])
+        log_param("cv", logreg_hyperparameters["cv"])
 
         model_name = logreg_hyperparameters["model_name"]
         cv = logreg_hyperparameters["cv"]
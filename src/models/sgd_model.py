@@ -0,0 +1,87 @@
+from loguru import logger
+from sklearn.linear_model import SGDClassifier
+from src.tracking import log_param
+
+
+def create_sgd_model(sgd_hyperparameters: dict):
+    """
+    Description
+    -----------
+    Creates a Stochastic Gradient Descent classifier for use in a
+    scikit-learn pipeline based upon the input sgd_hyperparameters. With the
+    log_loss loss this is a logistic regression which can be trained
+    incrementally via partial_fit, e.g. by evaluate_model_incremental on data
+    larger than memory.
+
+    The hyperparameters are also tracked as parameters in MLFlow.
+
+    Parameters
+    ---------
+    sgd_hyperparameters: dict
+        The hyperparameters for the model
+
+    Returns:
+    --------
+    model: sklearn.linear_model.SGDClassifier
+        The scikit-learn SGD classifier
+
+    model_name: str
+        The name of the model
+
+    cv: int
+        The number of cross-validation folds to perform when evaluating the
+        model
+
+    Raises
+    ------
+    Exception: Exception
+        Generic exception for logging
+
+    Examples
+    --------
+    model, model_name, cv = create_sgd_model(
+        sgd_hyperparameters=dict(
+            model_name="sgd",
+            model_type="SGD",
+            loss="log_loss",
+            penalty="l2",
+            alpha=0.0001,
+            learning_rate="optimal",
+            max_iter=5,
+            random_state=43,
+            cv=5
+        )
+    )
+    """
+
+    logger.info("Running create_sgd_model()")
+
+    try:
+        # Create the model
+        model = SGDClassifier(
+            loss=sgd_hyperparameters["loss"],
+            penalty=sgd_hyperparameters["penalty"],
+            alpha=sgd_hyperparameters["alpha"],
+            learning_rate=sgd_hyperparameters["learning_rate"],
+            max_iter=sgd_hyperparameters["max_iter"],
+            random_state=sgd_hyperparameters["random_state"]
+        )
+
+        # Log the parameters with MLFlow
+        log_param("model_name", sgd_hyperparameters["model_name"])
+        log_param("model_type", sgd_hyperparameters["model_type"])
+        log_param("loss", sgd_hyperparameters["loss"])
+        log_param("penalty", sgd_hyperparameters["penalty"])
+        log_param("alpha", sgd_hyperparameters["alpha"])
+        log_param("learning_rate", sgd_hyperparameters["learning_rate"])
+        log_param("max_iter", sgd_hyperparameters["max_iter"])
+        log_param("model_random_state", sgd_hyperparameters["random_state"])
+        log_param("cv", sgd_hyperparameters["cv"])
+
+        model_name = sgd_hyperparameters["model_name"]
+        cv = sgd_hyperparameters["cv"]
+
+        return model, model_name, cv
+
+    except Exception:
+        logger.exception("Error running create_sgd_model()")
@@ -1,6 +1,6 @@
 from loguru import logger
 from sklearn.svm import SVC
-import mlflow
+from src.tracking import log_param
 
 
 def create_svc_model(svc_hyperparameters):
@@ -61,13 +61,13 @@ def create_svc_model(svc_hyperparameters):
         )
 
         # Log the parameters with MLFlow
-        mlflow.log_param("model_name", svc_hyperparameters["model_name"])
-        mlflow.log_param("model_type", svc_hyperparameters["model_type"])
-        mlflow.log_param("C", svc_hyperparameters["C"])
-        mlflow.log_param("kernel", svc_hyperparameters["kernel"])
-        mlflow.log_param("probability", svc_hyperparameters["probability"])
-        mlflow.log_param("max_iter", svc_hyperparameters["max_iter"])
-        mlflow.log_param("cv", svc_hyperparameters["cv"])
+        log_param("model_name", svc_hyperparameters["model_name"])
+        log_param("model_type", svc_hyperparameters["model_type"])
+        log_param("C", svc_hyperparameters["C"])
+        log_param("kernel", svc_hyperparameters["kernel"])
+        log_param("probability", svc_hyperparameters["probability"])
+        log_param("max_iter", svc_hyperparameters["max_iter"])
+        log_param("cv", svc_hyperparameters["cv"])
 
         model_name = svc_hyperparameters["model_name"]
         cv = svc_hyperparameters["cv"]
@@ -1,6 +1,14 @@
 from src.preprocessing_pipeline.preprocessing import (
     create_preprocessing_pipeline
 )
+from src.preprocessing_pipeline.registry import (
+    TRANSFORMS,
+    register_transform,
+    register_implementation,
+    get_transform,
+    get_implementation,
+    find_transform
+)
 from src.preprocessing_pipeline.transforms import (
     set_df_index,
     convert_to_str,
@@ -12,9 +20,36 @@ from src.preprocessing_pipeline.transforms import (
     scaler,
     one_hot_encoder
 )
+from src.preprocessing_pipeline.vectorized_transforms import (
+    create_title_cat_vectorized,
+    impute_age_vectorized,
+    create_family_size_vectorized
+)
+from src.preprocessing_pipeline.estimators import (
+    MissingValuesImputer,
+    ColumnScaler,
+    ColumnOneHotEncoder
+)
+from src.preprocessing_pipeline.polars_pipeline import (
+    POLARS_TRANSFORMS,
+    PolarsPipeline,
+    create_polars_pipeline
+)
+from src.preprocessing_pipeline.instrumentation import (
+    InstrumentedStep,
+    get_step_records,
+    log_step_metrics,
+    remove_instrumentation
+)
 
 __all__ = [
     "create_preprocessing_pipeline",
+    "TRANSFORMS",
+    "register_transform",
+    "register_implementation",
+    "get_transform",
+    "get_implementation",
+    "find_transform",
     "set_df_index",
     "convert_to_str",
     "create_title_cat",
@@ -23,5 +58,18 @@ __all__ = [
     "create_family_size",
     "impute_missing_values",
     "scaler",
-    "one_hot_encoder"
+    "one_hot_encoder",
+    "create_title_cat_vectorized",
+    "impute_age_vectorized",
+    "create_family_size_vectorized",
+    "MissingValuesImputer",
+    "ColumnScaler",
+    "ColumnOneHotEncoder",
+    "POLARS_TRANSFORMS",
+    "PolarsPipeline",
+    "create_polars_pipeline",
+    "InstrumentedStep",
+    "get_step_records",
+    "log_step_metrics",
+    "remove_instrumentation"
 ]
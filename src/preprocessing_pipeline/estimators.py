@@ -0,0 +1,396 @@
+from loguru import logger
+import pandas as pd
+import numpy as np
+from sklearn.base import (
+    BaseEstimator,
+    TransformerMixin
+)
+from sklearn.impute import SimpleImputer
+from sklearn.preprocessing import MinMaxScaler
+
+
+def _normalise_missing_values(series: pd.core.series.Series):
+    """
+    Replaces None & empty strings with np.nan so a single imputer applies.
+    Numeric columns already use np.nan so are left as they are.
+    """
+
+    if pd.api.types.is_numeric_dtype(series):
+        return series.to_frame()
+
+    series_out = series.replace("", np.nan).astype(object)
+
+    return series_out.where(series_out.notnull(), np.nan).to_frame()
+
+
+class MissingValuesImputer(BaseEstimator, TransformerMixin):
+    """
+    Description
+    -----------
+    Stateful equivalent of impute_missing_values. The values used to fill
+    np.nan, None and "" (empty strings) are learned once per column when the
+    imputer is fitted and applied to any data passed to transform. Each column
+    is fitted separately so only one column is converted to objects at once.
+
+    The imputer can also be fitted to data larger than memory a chunk at a
+    time via partial_fit, which keeps the count of each value of each column
+    and supports the most_frequent & mean strategies.
+
+    Parameters
+    ----------
+    strategy: str
+        The strategy to use for imputation
+
+    inplace: bool
+        Modify the dataframe passed to transform rather than a copy of it.
+
+    Attributes
+    ----------
+    fill_values_: dict
+        The value used to fill the missing values of each column
+
+    value_counts_: dict
+        The count of each value of each column, set by partial_fit
+
+    Examples
+    --------
+    imputer = MissingValuesImputer(strategy="most_frequent")
+    df_train_out = imputer.fit_transform(df_train)
+    df_test_out = imputer.transform(df_test)
+    """
+
+    def __init__(self, strategy: str = "most_frequent", inplace: bool = False):
+        self.strategy = strategy
+        self.inplace = inplace
+
+    def fit(self, X: pd.core.frame.DataFrame, y=None):
+        """Learn the fill value for each column of X"""
+
+        logger.debug("Running MissingValuesImputer.fit()")
+
+        try:
+            self.fill_values_ = {}
+
+            for column in X.columns:
+                imputer = SimpleImputer(
+                    missing_values=np.nan,
+                    strategy=self.strategy
+                )
+                imputer.fit(_normalise_missing_values(X[column]))
+                self.fill_values_[column] = imputer.statistics_[0]
+
+            return self
+
+        except Exception:
+            logger.exception("Error running MissingValuesImputer.fit()")
+            raise
+
+    def partial_fit(self, X: pd.core.frame.DataFrame, y=None):
+        """
+        Update the fill value for each column of X with a chunk of the data,
+        which match those fitted to all of the chunks at once
+        """
+
+        logger.debug("Running MissingValuesImputer.partial_fit()")
+
+        if self.strategy not in ("most_frequent", "mean"):
+            raise ValueError(
+                f"partial_fit doesn't support the {self.strategy} strategy"
+            )
+
+        if not hasattr(self, "value_counts_"):
+            self.value_counts_ = {}
+
+        self.fill_values_ = {}
+        for column in X.columns:
+            counts = (
+                _normalise_missing_values(X[column])
+                .iloc[:, 0]
+                .value_counts(dropna=True)
+            )
+            if column in self.value_counts_:
+                counts = self.value_counts_[column].add(counts, fill_value=0)
+            self.value_counts_[column] = counts
+
+            if counts.empty:
+                self.fill_values_[column] = np.nan
+
+            elif self.strategy == "mean":
+                self.fill_values_[column] = (
+                    (counts.index.to_numpy(dtype=float) * counts).sum()
+                    / counts.sum()
+                )
+
+            else:
+                # Ties are broken by the smallest value, as by SimpleImputer
+                self.fill_values_[column] = min(
+                    counts.index[counts == counts.max()]
+                )
+
+        return self
+
+    def transform(self, X: pd.core.frame.DataFrame):
+        """Fill the missing values of X with the learned fill values"""
+
+        logger.debug("Running MissingValuesImputer.transform()")
+
+        try:
+            df_out = X if self.inplace else X.copy()
+
+            for column, value in self.fill_values_.items():
+                missing = df_out[column].isnull() | (df_out[column] == "")
+                if missing.any():
+                    # Categoricals can only be filled with one of their
+                    # categories, which the data passed to transform may not
+                    # include
+                    if (
+                        isinstance(df_out[column].dtype, pd.CategoricalDtype)
+                        and value not in df_out[column].cat.categories
+                    ):
+                        df_out[column] = (
+                            df_out[column].cat.add_categories([value])
+                        )
+                    df_out[column] = (
+                        df_out[column].mask(missing, value).infer_objects()
+                    )
+
+            return df_out
+
+        except Exception:
+            logger.exception("Error running MissingValuesImputer.transform()")
+            raise
+
+
+class ColumnScaler(BaseEstimator, TransformerMixin):
+    """
+    Description
+    -----------
+    Stateful equivalent of scaler. The minimum and maximum of each of the
+    scale_columns are learned when the scaler is fitted and applied to any
+    data passed to transform. partial_fit updates them with a chunk of the
+    data, to fit the scaler to data larger than memory.
+
+    Parameters
+    ----------
+    scale_columns: list
+        The columns to apply scaling to.
+
+    inplace: bool
+        Modify the dataframe passed to transform rather than a copy of it.
+
+    Attributes
+    ----------
+    scaler_: sklearn.preprocessing.MinMaxScaler
+        The fitted scaler
+
+    Examples
+    --------
+    scaler = ColumnScaler(scale_columns=["col1", "col2"])
+    df_train_out = scaler.fit_transform(df_train)
+    df_test_out = scaler.transform(df_test)
+    """
+
+    def __init__(self, scale_columns: list = None, inplace: bool = False):
+        self.scale_columns = scale_columns
+        self.inplace = inplace
+
+    def fit(self, X: pd.core.frame.DataFrame, y=None):
+        """Learn the minimum & maximum of the scale_columns of X"""
+
+        logger.debug("Running ColumnScaler.fit()")
+
+        try:
+            self.scaler_ = MinMaxScaler()
+            self.scaler_.fit(X[self.scale_columns].values.astype(float))
+
+            return self
+
+        except Exception:
+            logger.exception("Error running ColumnScaler.fit()")
+            raise
+
+    def partial_fit(self, X: pd.core.frame.DataFrame, y=None):
+        """Update the minimum & maximum of the scale_columns with X"""
+
+        logger.debug("Running ColumnScaler.partial_fit()")
+
+        if not hasattr(self, "scaler_"):
+            self.scaler_ = MinMaxScaler()
+        self.scaler_.partial_fit(X[self.scale_columns].values.astype(float))
+
+        return self
+
+    def transform(self, X: pd.core.frame.DataFrame):
+        """Scale the scale_columns of X with the learned minimum & maximum"""
+
+        logger.debug("Running ColumnScaler.transform()")
+
+        try:
+            df_out = X if self.inplace else X.copy()
+            df_out[self.scale_columns] = self.scaler_.transform(
+                df_out[self.scale_columns].values.astype(float)
+            )
+
+            return df_out
+
+        except Exception:
+            logger.exception("Error running ColumnScaler.transform()")
+            raise
+
+
+class ColumnOneHotEncoder(BaseEstimator, TransformerMixin):
+    """
+    Description
+    -----------
+    Stateful equivalent of one_hot_encoder. The categories of each of the
+    one_hot_columns are set when fitted and applied to any data passed to
+    transform. The encoded columns are appended in the order of
+    one_hot_columns and the source columns are removed.
+
+    Each column is encoded from its categorical codes one category at a time
+    so no intermediate array of all of the encoded columns is created.
+
+    Parameters
+    ----------
+    uid: str
+        The unique identifier of each record. If this is a column of the data
+        rather than the index it's set as the index.
+
+    one_hot_columns: list
+        Dictionaries containing the col_name and categories of each column to
+        apply one hot encoding to.
+
+    inplace: bool
+        Modify the dataframe passed to transform rather than creating a new
+        one. The encoded columns are added to it and the source columns are
+        dropped from it.
+
+    Attributes
+    ----------
+    categories_: dict
+        The categories of each of the one_hot_columns
+
+    feature_names_: list
+        The names of the encoded columns
+
+    Raises
+    ------
+    ValueError:
+        If a column contains a value which isn't one of its categories.
+
+    Examples
+    --------
+    encoder = ColumnOneHotEncoder(
+        uid="id",
+        one_hot_columns=[
+            dict(col_name="col1", categories=["foo", "bar"])
+        ]
+    )
+    df_train_out = encoder.fit_transform(df_train)
+    df_test_out = encoder.transform(df_test)
+    """
+
+    def __init__(
+        self,
+        uid: str = None,
+        one_hot_columns: list = None,
+        inplace: bool = False
+    ):
+        self.uid = uid
+        self.one_hot_columns = one_hot_columns
+        self.inplace = inplace
+
+    def fit(self, X: pd.core.frame.DataFrame, y=None):
+        """Set the categories of each column & check X contains no others"""
+
+        logger.debug("Running ColumnOneHotEncoder.fit()")
+
+        try:
+            self.categories_ = {
+                column["col_name"]: column["categories"]
+                for column in self.one_hot_columns
+            }
+            self.feature_names_ = [
+                f"{col_name}_{category}"
+                for col_name, categories in self.categories_.items()
+                for category in categories
+            ]
+            for col_name in self.categories_:
+                self._category_codes(X, col_name)
+
+            return self
+
+        except Exception:
+            logger.exception("Error running ColumnOneHotEncoder.fit()")
+            raise
+
+    def _category_codes(self, X: pd.core.frame.DataFrame, col_name: str):
+        """The position of each value of the column within its categories"""
+
+        codes = pd.Categorical(
+            X[col_name],
+            categories=self.categories_[col_name]
+        ).codes
+
+        if (codes == -1).any():
+            unknown = X[col_name][codes == -1].unique().tolist()
+            raise ValueError(
+                f"Found unknown categories {unknown} in column {col_name}"
+            )
+
+        return codes
+
+    def _encode(self, X: pd.core.frame.DataFrame):
+        """Yields the name & values of each encoded column"""
+
+        for col_name, categories in self.categories_.items():
+            codes = self._category_codes(X, col_name)
+            for i, category in enumerate(categories):
+                yield f"{col_name}_{category}", (codes == i).astype(float)
+
+    def transform(self, X: pd.core.frame.DataFrame):
+        """One hot encode the configured columns of X"""
+
+        logger.debug("Running ColumnOneHotEncoder.transform()")
+
+        try:
+            if self.inplace:
+                df_out = X
+                if self.uid in df_out.columns:
+                    df_out.set_index(self.uid, inplace=True)
+
+                # Delete the source columns before adding the encoded columns
+                # so they don't need to be copied when the source columns are
+                # removed
+                codes = {
+                    col_name: self._category_codes(df_out, col_name)
+                    for col_name in self.categories_
+                }
+                for col_name in self.categories_:
+                    del df_out[col_name]
+
+                for col_name, categories in self.categories_.items():
+                    for i, category in enumerate(categories):
+                        df_out[f"{col_name}_{category}"] = (
+                            (codes[col_name] == i).astype(float)
+                        )
+
+            else:
+                df_out = X
+                if self.uid in df_out.columns:
+                    df_out = df_out.set_index(self.uid)
+
+                df_oh = pd.DataFrame(
+                    dict(self._encode(df_out)),
+                    index=df_out.index
+                )
+                df_out = pd.concat(
+                    [df_out.drop(list(self.categories_), axis=1), df_oh],
+                    axis=1
+                )
+
+            return df_out
+
+        except Exception:
+            logger.exception("Error running ColumnOneHotEncoder.transform()")
+            raise
@@ -0,0 +1,354 @@
+import re
+import time
+import tracemalloc
+from copy import copy
+from collections import deque
+from loguru import logger
+import sklearn
+from sklearn.base import (
+    BaseEstimator,
+    TransformerMixin
+)
+from sklearn.utils.metaestimators import available_if
+from src.tracking import log_metric
+
+
+# Linux file used to sample the resident memory of the process
+PROC_STATUS_PATH = "/proc/self/status"
+
+
+def _read_rss_mb():
+    """The current resident memory of the process in MB"""
+
+    with open(PROC_STATUS_PATH) as stream:
+        for line in stream:
+            if line.startswith("VmRSS:"):
+                return int(line.split(":")[1].split()[0]) / 1024
+
+    raise OSError(f"VmRSS isn't reported in {PROC_STATUS_PATH}")
+
+
+class _RssTracker:
+    """
+    Measures how far the resident memory of the process grows during a step
+    by sampling it before & after the step. Sampling takes microseconds and
+    doesn't change the state of the process, but memory which is freed
+    before the step returns isn't seen and it's only available on Linux.
+    """
+
+    def start(self):
+        self.start_mb = _read_rss_mb()
+
+    def stop(self):
+        return max(_read_rss_mb() - self.start_mb, 0.0)
+
+
+class _TracemallocTracker:
+    """
+    Measures the peak memory allocated by python & numpy during a step. This
+    is exact but slows down the step while tracing.
+    """
+
+    def start(self):
+        self.started = not tracemalloc.is_tracing()
+        if self.started:
+            tracemalloc.start()
+        tracemalloc.reset_peak()
+        self.start_bytes, _ = tracemalloc.get_traced_memory()
+
+    def stop(self):
+        _, peak_bytes = tracemalloc.get_traced_memory()
+        if self.started:
+            tracemalloc.stop()
+        return (peak_bytes - self.start_bytes) / 1024 ** 2
+
+
+MEMORY_TRACKERS = dict(
+    rss=_RssTracker,
+    tracemalloc=_TracemallocTracker
+)
+
+
+def _shape(X):
+    """The number of rows & columns of a dataframe, array or series"""
+
+    shape = X.shape if hasattr(X, "shape") else (len(X),)
+
+    return shape[0], shape[1] if len(shape) > 1 else 1
+
+
+class InstrumentedStep(BaseEstimator, TransformerMixin):
+    """
+    Description
+    -----------
+    Wraps a step of the preprocessing pipeline and records the wall time,
+    the rows & columns in and out and the peak memory of each call to fit,
+    partial_fit, fit_transform and transform, without changing its output.
+
+    The records are kept in memory for the lifetime of the process, up to
+    max_records per step, and aren't saved when the step is pickled, e.g.
+    with the model or in the feature cache. They're read via
+    get_step_records and logged to MLFlow via log_step_metrics.
+
+    Parameters
+    ----------
+    name: str
+        The name of the step in the pipeline.
+
+    step: sklearn
+        The transformer or estimator to instrument.
+
+    memory: str
+        How to measure the peak memory of each call, either "rss" for the
+        growth of the resident memory of the process sampled before & after
+        the call, which is cheap but Linux only and misses memory freed
+        within the call, "tracemalloc" for the exact peak allocated by python
+        & numpy, which slows down each call, or None to skip it.
+
+    max_records: int
+        The number of records to keep for the step, the oldest are dropped.
+
+    Attributes
+    ----------
+    records_: collections.deque
+        The record of each call
+
+    Examples
+    --------
+    step = InstrumentedStep(name="Scale", step=ColumnScaler(["Age"]))
+    df_out = step.fit_transform(df)
+    step.records_[-1]["seconds"]
+    """
+
+    def __init__(
+        self,
+        name: str,
+        step: sklearn.base.BaseEstimator,
+        memory: str = "rss",
+        max_records: int = 1000
+    ):
+        self.name = name
+        self.step = step
+        self.memory = memory
+        self.max_records = max_records
+
+    def _memory_tracker(self):
+        """The memory tracker to use or None if it isn't available"""
+
+        if self.memory is None or getattr(self, "_memory_unavailable", False):
+            return None
+
+        tracker = MEMORY_TRACKERS[self.memory]()
+        try:
+            tracker.start()
+            return tracker
+
+        except OSError:
+            logger.warning(f"Unable to measure memory with {self.memory}")
+            self._memory_unavailable = True
+            return None
+
+    def _record(self, method: str, X, func):
+        """Calls func, recording its time, rows, columns & peak memory"""
+
+        if not hasattr(self, "records_"):
+            self.records_ = deque(maxlen=self.max_records)
+
+        tracker = self._memory_tracker()
+        start_time = time.time()
+        start = time.perf_counter()
+
+        # Stop the tracker even if the step fails, e.g. so tracemalloc
+        # doesn't keep tracing & slowing down the rest of the process
+        try:
+            X_out = func()
+        finally:
+            seconds = time.perf_counter() - start
+            peak_memory_mb = None if tracker is None else tracker.stop()
+
+        rows_in, columns_in = _shape(X)
+        rows_out, columns_out = _shape(
+            X if method in ("fit", "partial_fit") else X_out
+        )
+        self.records_.append(dict(
+            step=self.name,
+            method=method,
+            start_time=start_time,
+            seconds=seconds,
+            rows_in=rows_in,
+            rows_out=rows_out,
+            columns_in=columns_in,
+            columns_out=columns_out,
+            peak_memory_mb=peak_memory_mb
+        ))
+
+        return X_out
+
+    def fit(self, X, y=None):
+        """Fit the step, recording the call"""
+
+        self._record("fit", X, lambda: self.step.fit(X, y))
+
+        return self
+
+    @available_if(lambda self: hasattr(self.step, "partial_fit"))
+    def partial_fit(self, X, y=None):
+        """Update the fit of the step with X, recording the call"""
+
+        self._record("partial_fit", X, lambda: self.step.partial_fit(X, y))
+
+        return self
+
+    def fit_transform(self, X, y=None):
+        """Fit the step & transform X, recording the call"""
+
+        return self._record(
+            "fit_transform",
+            X,
+            lambda: self.step.fit_transform(X, y)
+        )
+
+    def transform(self, X):
+        """Transform X with the step, recording the call"""
+
+        return self._record("transform", X, lambda: self.step.transform(X))
+
+    def __getstate__(self):
+        """Don't save the records, which only apply to the current process"""
+
+        state = super().__getstate__()
+        state.pop("records_", None)
+
+        return state
+
+
+def remove_instrumentation(pipeline: sklearn.pipeline.Pipeline):
+    """
+    Description
+    -----------
+    Returns a copy of the pipeline with each InstrumentedStep replaced by the
+    fitted step it wraps, e.g. to compare the latency of a pipeline with &
+    without its instrumentation.
+
+    Parameters
+    ----------
+    pipeline: sklearn.pipeline.Pipeline
+        The instrumented preprocessing or model pipeline.
+
+    Returns
+    -------
+    pipeline: sklearn.pipeline.Pipeline
+        The pipeline without instrumentation
+
+    Raises
+    ------
+    None
+
+    Examples
+    --------
+    preprocessing_pipeline = remove_instrumentation(preprocessing_pipeline)
+    """
+
+    pipeline = copy(pipeline)
+    pipeline.steps = [
+        (name, step.step if isinstance(step, InstrumentedStep) else step)
+        for name, step in pipeline.steps
+    ]
+
+    return pipeline
+
+
+def get_step_records(pipeline: sklearn.pipeline.Pipeline, clear: bool = False):
+    """
+    Description
+    -----------
+    Returns the records of each call to each instrumented step of the
+    pipeline, created via create_preprocessing_pipeline with instrument set,
+    in the order they were called.
+
+    Parameters
+    ----------
+    pipeline: sklearn.pipeline.Pipeline
+        The instrumented preprocessing or model pipeline.
+
+    clear: bool
+        Remove the records from the steps once they're returned. The records
+        are removed one at a time, so calls recorded by another thread, e.g.
+        while serving, are neither lost nor break the read.
+
+    Returns
+    -------
+    records: list
+        A dictionary per call of the step name, method (fit, partial_fit,
+        fit_transform or transform), start_time, seconds, rows_in, rows_out,
+        columns_in, columns_out & peak_memory_mb, which is None if it isn't
+        measured
+
+    Raises
+    ------
+    None
+
+    Examples
+    --------
+    preprocessing_pipeline.transform(df)
+    records = get_step_records(preprocessing_pipeline)
+    """
+
+    records = []
+
+    for _, step in pipeline.steps:
+        if isinstance(step, InstrumentedStep) and hasattr(step, "records_"):
+            if clear:
+                while step.records_:
+                    records.append(step.records_.popleft())
+            else:
+                records.extend(step.records_)
+
+    return sorted(records, key=lambda record: record["start_time"])
+
+
+def log_step_metrics(pipeline: sklearn.pipeline.Pipeline):
+    """
+    Description
+    -----------
+    Logs the seconds, rows in & out and peak memory of each call to each
+    instrumented step of the pipeline to MLFlow and clears the records so
+    they're only logged once. The metrics are named after the step & method,
+    e.g. scale_numeric_data_transform_seconds, with repeated calls logged as
+    consecutive metric steps.
+
+    Parameters
+    ----------
+    pipeline: sklearn.pipeline.Pipeline
+        The instrumented preprocessing or model pipeline.
+
+    Returns
+    -------
+    records: list
+        The logged records, see get_step_records
+
+    Raises
+    ------
+    None
+
+    Examples
+    --------
+    preprocessing_pipeline.fit_transform(X_train)
+    log_step_metrics(preprocessing_pipeline)
+    """
+
+    records = get_step_records(pipeline, clear=True)
+    calls = {}
+
+    for record in records:
+        prefix = (
+            f"{re.sub(r'[^a-z0-9]+', '_', record['step'].lower())}_"
+            f"{record['method']}"
+        )
+        call = calls[prefix] = calls.get(prefix, -1) + 1
+
+        for key in ["seconds", "rows_in", "rows_out", "peak_memory_mb"]:
+            if record[key] is not None:
+                log_metric(f"{prefix}_{key}", record[key], step=call)
+
+    return records
@@ -1,40 +1,86 @@
 from loguru import logger
 from sklearn.pipeline import Pipeline
 from sklearn.preprocessing import FunctionTransformer
-from src.preprocessing_pipeline.transforms import (
-    set_df_index,
-    convert_to_str,
-    create_title_cat,
-    impute_age,
-    create_family_size,
-    drop_columns,
-    impute_missing_values,
-    scaler,
-    one_hot_encoder,
+from src.preprocessing_pipeline.registry import (
+    DEFAULT_STEPS,
+    get_transform,
+    get_implementation
 )
+from src.preprocessing_pipeline.instrumentation import InstrumentedStep
 
 
 def create_preprocessing_pipeline(
-    pipeline_parameters: dict
+    pipeline_parameters: dict,
+    engine: str = None,
+    inplace: bool = False,
+    instrument: bool = False,
+    instrument_memory: str = "rss"
 ):
     """
     Description
     -----------
     Create a scikit learn pipeline to preprocess the data ready for modelling.
-    The pipeline uses a series of functions applied to the dataframe via
+    The stateless steps use a series of functions applied to the dataframe via
     scikit-learn's FunctionTransformer class.
 
-    Each transformation step has a function assigned with the keyword arguments
-    applied through the supplied pipeline_parameters object.
+    The imputation, scaling and one hot encoding steps are estimators which
+    learn their statistics when the pipeline is fitted on the training data
+    and only apply them when transforming, so that test data and requests to
+    a deployed model are processed consistently regardless of their size.
+
+    Each transformation step has a function or estimator assigned with the
+    keyword arguments applied through the supplied pipeline_parameters object.
 
     Note that the pipeline works with pandas DataFrames over numpy arrays
     because these are more interpretable and can be logged as artifacts.
 
+    The steps of the pipeline & their order are read from the steps of the
+    pipeline_parameters, each the name of a transform registered via
+    register_transform, or the default steps if it isn't supplied. A step
+    can also be a dictionary of the transform, the engine of the step, the
+    key of its keyword arguments and its name, e.g. to swap in a faster
+    implementation of a single step or use a transform twice. Steps are named
+    after the description of their transform by default, and a name which is
+    already used by an earlier step is suffixed with the step number so the
+    names are unique.
+
+    The engine determines which implementation of each transform is used,
+    e.g. the "vectorized" engine operates on whole columns and produces the
+    same output as the "rowwise" engine, which applies a Python function to
+    each row and is retained as a reference. Transforms without an
+    implementation for the engine use their vectorized implementation.
+
+    By default every step returns a new dataframe. When inplace is set the
+    first step creates a single working dataframe, which is owned by the
+    pipeline, and every following step modifies it or adds columns to it
+    rather than copying it. The dataframe passed to the pipeline is never
+    modified in either mode.
+
+    When instrument is set each step is wrapped in an InstrumentedStep, which
+    records the time, rows and peak memory of every call to the step so slow
+    steps can be identified. See get_step_records and log_step_metrics.
+
     Parameters
     ----------
     pipeline_parameters: dict
-        Parameters containing the metadata associated with the pipeline
-        transformations.
+        Parameters containing the steps & engine of the pipeline and the
+        keyword arguments of each transformation.
+
+    engine: str
+        The implementation of the transforms to use, e.g. "vectorized" or
+        "rowwise". None uses the engine of the pipeline_parameters, which
+        defaults to "vectorized".
+
+    inplace: bool
+        Process a single working dataframe in place rather than copying the
+        dataframe at each step.
+
+    instrument: bool
+        Record the time, rows and peak memory of each call to each step.
+
+    instrument_memory: str
+        How the peak memory of instrumented steps is measured, either "rss"
+        (default), "tracemalloc" or None. See InstrumentedStep.
 
     Returns
     -------
@@ -48,55 +94,77 @@ def create_preprocessing_pipeline(
 
     Examples
     --------
-    pipeline = create_pipeline(
-        ("Step Description", FunctionTransformer(
-            func=my_func_name,
-            kw_args={"keyword_name" : "keyword_arg}
-        ))
+    preprocessing_pipeline = create_preprocessing_pipeline(
+        pipeline_parameters=dict(
+            engine="vectorized",
+            steps=[
+                "set_df_index",
+                dict(transform="create_title_cat", engine="rowwise"),
+                . . .
+                dict(
+                    transform="drop_columns",
+                    kw_args="drop_one_hot_kw_args",
+                    name="Drop one hot columns"
+                )
+            ],
+            set_df_index_kw_args=dict(df_index_col="PassengerId"),
+            . . .
+        )
     )
     """
     try:
         logger.info("Running create_preprocessing_pipeline()")
 
-        # Create the pre-processing pipeline
-        preprocessing_pipeline = Pipeline([
-            ("Set dataframe index", FunctionTransformer(
-                func=set_df_index,
-                kw_args=pipeline_parameters["set_df_index_kw_args"]
-            )),
-            ("Convert cols to string", FunctionTransformer(
-                func=convert_to_str,
-                kw_args=pipeline_parameters["convert_to_str_kw_args"]
-            )),
-            ("Create title_cat column", FunctionTransformer(
-                func=create_title_cat,
-                kw_args=pipeline_parameters["create_title_cat_kw_args"]
-            )),
-            ("Impute missing Age values", FunctionTransformer(
-                func=impute_age,
-                kw_args=pipeline_parameters["impute_age_kw_args"]
-            )),
-            ("Create family_size column", FunctionTransformer(
-                func=create_family_size,
-                kw_args=pipeline_parameters["create_family_size_kw_args"]
-            )),
-            ("Drop columns", FunctionTransformer(
-                func=drop_columns,
-                kw_args=pipeline_parameters["drop_columns_kw_args"]
-            )),
-            ("Impute missing values", FunctionTransformer(
-                func=impute_missing_values,
-                kw_args=pipeline_parameters["impute_missing_values_kw_args"]
-            )),
-            ("Scale numeric data", FunctionTransformer(
-                func=scaler,
-                kw_args=pipeline_parameters["scaler_kw_args"]
-            )),
-            ("One hot encode categorical data", FunctionTransformer(
-                func=one_hot_encoder,
-                kw_args=pipeline_parameters["one_hot_kw_args"]
-            ))
-        ])
+        if engine is None:
+            engine = pipeline_parameters.get("engine", "vectorized")
+
+        # Create the pre-processing pipeline from the registered transforms
+        steps = []
+        names = set()
+        for index, step in enumerate(
+            pipeline_parameters.get("steps", DEFAULT_STEPS)
+        ):
+            if isinstance(step, str):
+                step = dict(transform=step)
+            transform = get_transform(step["transform"])
+            implementation = get_implementation(
+                name=step["transform"],
+                engine=step.get("engine", engine)
+            )
+
+            name = step.get("name", transform["description"])
+            if name in names:
+                name = f"{name} {index + 1}"
+            names.add(name)
+
+            # The first step copies the dataframe so the later steps can
+            # modify it in place
+            kw_args = dict(
+                **pipeline_parameters[
+                    step.get("kw_args", transform["kw_args"])
+                ],
+                inplace=inplace and index > 0
+            )
+
+            if isinstance(implementation, type):
+                steps.append((name, implementation(**kw_args)))
+            else:
+                steps.append((name, FunctionTransformer(
+                    func=implementation,
+                    kw_args=kw_args
+                )))
+
+        preprocessing_pipeline = Pipeline(steps)
+
+        if instrument:
+            preprocessing_pipeline.steps = [
+                (name, InstrumentedStep(
+                    name=name,
+                    step=step,
+                    memory=instrument_memory
+                ))
+                for name, step in preprocessing_pipeline.steps
+            ]
 
         return preprocessing_pipeline
 
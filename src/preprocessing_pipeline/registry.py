@@ -0,0 +1,268 @@
+from src.preprocessing_pipeline.transforms import (
+    set_df_index,
+    convert_to_str,
+    create_title_cat,
+    impute_age,
+    create_family_size,
+    drop_columns,
+)
+from src.preprocessing_pipeline.vectorized_transforms import (
+    create_title_cat_vectorized,
+    impute_age_vectorized,
+    create_family_size_vectorized
+)
+from src.preprocessing_pipeline.estimators import (
+    MissingValuesImputer,
+    ColumnScaler,
+    ColumnOneHotEncoder
+)
+
+
+# The transforms which can be used as steps of the preprocessing pipeline,
+# see register_transform
+TRANSFORMS = {}
+
+# The engine used for a transform without an implementation for the
+# requested engine
+DEFAULT_ENGINE = "vectorized"
+
+
+def register_transform(
+    name: str,
+    description: str,
+    kw_args: str,
+    implementations: dict,
+    compiler=None
+):
+    """
+    Description
+    -----------
+    Registers a transform which can be used as a step of the preprocessing
+    pipeline, by name, in the steps of the pipeline_parameters.
+
+    Each transform has an implementation per engine, e.g. a row-wise
+    reference & a vectorized version, which must produce the same output so
+    they can be swapped & benchmarked against each other. Functions are
+    applied via a FunctionTransformer and classes are estimators, which are
+    created with the keyword arguments. The compiler translates the keyword
+    arguments of a function transform into an operation of the compiled
+    model, see compile_model_pipeline, and is optional.
+
+    Registering an existing name replaces the transform, and an extra
+    implementation can be added via register_implementation.
+
+    Parameters
+    ----------
+    name: str
+        The name the transform is referred to by in the pipeline_parameters.
+
+    description: str
+        The name of the step in the pipeline.
+
+    kw_args: str
+        The key of the keyword arguments of the transform in the
+        pipeline_parameters.
+
+    implementations: dict
+        The function or estimator class implementing the transform for each
+        engine, which must include the vectorized engine.
+
+    compiler: function
+        Creates the compiled model operation of the transform from its
+        keyword arguments, or None if it can't be compiled.
+
+    Returns
+    -------
+    transform: dict
+        The registered transform
+
+    Raises
+    ------
+    ValueError:
+        If no implementation is supplied for the default engine.
+
+    Examples
+    --------
+    register_transform(
+        name="create_family_size",
+        description="Create family_size column",
+        kw_args="create_family_size_kw_args",
+        implementations=dict(
+            rowwise=create_family_size,
+            vectorized=create_family_size_vectorized
+        )
+    )
+    """
+
+    if DEFAULT_ENGINE not in implementations:
+        raise ValueError(
+            f"The {name} transform has no {DEFAULT_ENGINE} implementation"
+        )
+
+    TRANSFORMS[name] = dict(
+        description=description,
+        kw_args=kw_args,
+        implementations=dict(implementations),
+        compiler=compiler
+    )
+
+    return TRANSFORMS[name]
+
+
+def register_implementation(name: str, engine: str, implementation):
+    """
+    Registers an implementation of an existing transform for an engine, e.g.
+    a faster version of a single step to benchmark or swap in via the engine
+    of the step in the pipeline_parameters
+    """
+
+    get_transform(name)["implementations"][engine] = implementation
+
+
+def get_transform(name: str):
+    """The registered transform of the supplied name"""
+
+    try:
+        return TRANSFORMS[name]
+
+    except KeyError:
+        raise ValueError(
+            f"Unknown transform {name}, expected one of {list(TRANSFORMS)}"
+        )
+
+
+def get_implementation(name: str, engine: str):
+    """
+    The implementation of a transform for an engine, or its vectorized
+    implementation if it has none for the engine
+    """
+
+    engines = sorted({
+        transform_engine
+        for transform in TRANSFORMS.values()
+        for transform_engine in transform["implementations"]
+    })
+    if engine not in engines:
+        raise ValueError(f"Unknown engine {engine}, expected one of {engines}")
+
+    implementations = get_transform(name)["implementations"]
+
+    return implementations.get(engine, implementations[DEFAULT_ENGINE])
+
+
+def find_transform(implementation):
+    """The name of the registered transform of an implementation or None"""
+
+    for name, transform in TRANSFORMS.items():
+        if any(
+            implementation is registered
+            for registered in transform["implementations"].values()
+        ):
+            return name
+
+    return None
+
+
+register_transform(
+    name="set_df_index",
+    description="Set dataframe index",
+    kw_args="set_df_index_kw_args",
+    implementations=dict(vectorized=set_df_index),
+    compiler=lambda kw_args: dict(op="pop_uid", uid=kw_args["df_index_col"])
+)
+
+register_transform(
+    name="convert_to_str",
+    description="Convert cols to string",
+    kw_args="convert_to_str_kw_args",
+    implementations=dict(vectorized=convert_to_str),
+    compiler=lambda kw_args: dict(
+        op="convert_to_str",
+        columns=kw_args["convert_to_str_cols"]
+    )
+)
+
+register_transform(
+    name="create_title_cat",
+    description="Create title_cat column",
+    kw_args="create_title_cat_kw_args",
+    implementations=dict(
+        rowwise=create_title_cat,
+        vectorized=create_title_cat_vectorized
+    ),
+    compiler=lambda kw_args: dict(
+        op="extract_title",
+        source_column=kw_args["source_column"],
+        dest_column=kw_args["dest_column"],
+        title_codes=kw_args["title_codes"],
+        unknown_title_code=kw_args.get("unknown_title_code", "other")
+    )
+)
+
+register_transform(
+    name="impute_age",
+    description="Impute missing Age values",
+    kw_args="impute_age_kw_args",
+    implementations=dict(
+        rowwise=impute_age,
+        vectorized=impute_age_vectorized
+    ),
+    compiler=lambda kw_args: dict(
+        op="impute_age",
+        source_column=kw_args["source_column"],
+        title_cat_column=kw_args["title_cat_column"],
+        age_codes=kw_args["age_codes"]
+    )
+)
+
+register_transform(
+    name="create_family_size",
+    description="Create family_size column",
+    kw_args="create_family_size_kw_args",
+    implementations=dict(
+        rowwise=create_family_size,
+        vectorized=create_family_size_vectorized
+    ),
+    compiler=lambda kw_args: dict(
+        op="sum_columns",
+        source_columns=kw_args["source_columns"],
+        dest_column=kw_args["dest_column"]
+    )
+)
+
+register_transform(
+    name="drop_columns",
+    description="Drop columns",
+    kw_args="drop_columns_kw_args",
+    implementations=dict(vectorized=drop_columns),
+    compiler=lambda kw_args: dict(
+        op="drop_columns",
+        columns=kw_args["drop_column_names"]
+    )
+)
+
+# The estimators learn their statistics when fitted so are compiled from
+# their fitted attributes by compile_model_pipeline
+register_transform(
+    name="impute_missing_values",
+    description="Impute missing values",
+    kw_args="impute_missing_values_kw_args",
+    implementations=dict(vectorized=MissingValuesImputer)
+)
+
+register_transform(
+    name="scaler",
+    description="Scale numeric data",
+    kw_args="scaler_kw_args",
+    implementations=dict(vectorized=ColumnScaler)
+)
+
+register_transform(
+    name="one_hot_encoder",
+    description="One hot encode categorical data",
+    kw_args="one_hot_kw_args",
+    implementations=dict(vectorized=ColumnOneHotEncoder)
+)
+
+# The steps of the pipeline when the pipeline_parameters don't supply them
+DEFAULT_STEPS = list(TRANSFORMS)
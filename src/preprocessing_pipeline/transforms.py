@@ -9,9 +9,35 @@ from sklearn.preprocessing import (
 )
 
 
+# The regex used to extract the title from a name, e.g. "Mr" from
+# "Braund, Mr. Owen Harris"
+TITLE_PATTERN = re.compile(r' ([A-Za-z]+)\.')
+
+
+def title_categories(title_codes: dict, unknown_title_code: str = "other"):
+    """
+    The categories of the title category column created from title_codes,
+    in the order of title_codes followed by the unknown_title_code
+    """
+
+    return list(dict.fromkeys([*title_codes.values(), unknown_title_code]))
+
+
+def extract_title(name: str):
+    """
+    Extracts the title from a name via TITLE_PATTERN, returning an empty
+    string if the name has no title or is missing
+    """
+
+    title_search = TITLE_PATTERN.search(name) if isinstance(name, str) else None
+
+    return title_search.group(1) if title_search else ""
+
+
 def set_df_index(
     df: pd,
     df_index_col: str,
+    inplace: bool = False
 ):
     """
     Description
@@ -26,6 +52,9 @@ def set_df_index(
     df_index: list
         The names of the column to set as the index
 
+    inplace: bool
+        Modify the supplied dataframe rather than a copy of it.
+
     Returns
     -------
     df_out: pandas.DataFrame
@@ -43,22 +72,25 @@ def set_df_index(
         df_index_col="col1"
     )
     """
-    logger.info("Running set_df_index()")
+    logger.debug("Running set_df_index()")
 
     try:
-        df_out = df.copy()
-
         # Handle single records which are passed as a series
-        if isinstance(df_out, pd.core.series.Series):
+        if isinstance(df, pd.core.series.Series):
             df_out = (
-                pd.DataFrame(df_out)
+                pd.DataFrame(df)
                 .transpose()
                 .set_index(df_index_col, drop=True)
             )
 
         # Handle multiple records which are passed as a DataFrame
+        elif inplace:
+            df_out = df
+            df_out.set_index(df_index_col, drop=True, inplace=True)
+
+        # set_index returns a new DataFrame so no copy is required
         else:
-            df_out = df_out.set_index(df_index_col, drop=True)
+            df_out = df.set_index(df_index_col, drop=True)
 
         return df_out
 
@@ -68,7 +100,8 @@ def set_df_index(
 
 def convert_to_str(
     df: pd.core.frame.DataFrame,
-    convert_to_str_cols: list
+    convert_to_str_cols: list,
+    inplace: bool = False
 ):
     """
     Description
@@ -83,6 +116,9 @@ def convert_to_str(
     convert_to_str_cols: list
         The names of the columns to convert to strings
 
+    inplace: bool
+        Modify the supplied dataframe rather than a copy of it.
+
     Returns
     -------
     df_out: pandas.DataFrame
@@ -100,10 +136,10 @@ def convert_to_str(
         convert_to_str_cols="col1"
     )
     """
-    logger.info("Running convert_to_str()")
+    logger.debug("Running convert_to_str()")
 
     try:
-        df_out = df.copy()
+        df_out = df if inplace else df.copy()
 
         for column in convert_to_str_cols:
             df_out[column] = df_out[column].astype(str)
@@ -117,6 +153,7 @@ def convert_to_str(
 def drop_columns(
     df: pd.core.frame.DataFrame,
     drop_column_names: list,
+    inplace: bool = False
 ):
     """
     Description
@@ -131,6 +168,9 @@ def drop_columns(
     drop_column_names: list
         The names of the columns to remove
 
+    inplace: bool
+        Modify the supplied dataframe rather than a copy of it.
+
     Returns
     -------
     df_out: pandas.DataFrame
@@ -149,10 +189,18 @@ def drop_columns(
     )
     """
 
-    logger.info("Running drop_columns()")
+    logger.debug("Running drop_columns()")
 
     try:
-        df_out = df.drop(labels=drop_column_names, axis=1)
+        # Delete the columns one at a time as drop(inplace=True) still
+        # copies the whole dataframe
+        if inplace:
+            df_out = df
+            for column in drop_column_names:
+                del df_out[column]
+
+        else:
+            df_out = df.drop(labels=drop_column_names, axis=1)
 
         return df_out
 
@@ -164,17 +212,19 @@ def create_title_cat(
     df: pd.core.frame.DataFrame,
     source_column: str,
     dest_column: str,
-    title_codes: dict
+    title_codes: dict,
+    unknown_title_code: str = "other",
+    inplace: bool = False
 ):
     """
     Description
     -----------
     Feature Engineers the title column of a pandas Dataframe by extracting the
     title from the source column via regex, coding the values and creating the
-    dest_column.
+    dest_column as a categorical with the categories of title_categories.
 
-    Contains the extract title sub-function which extracts the blocks of text
-    and picks the group containing the title which will always be at index 1.
+    Titles which aren't present in title_codes, names without a title and
+    missing names are coded as the unknown_title_code.
 
     Parameters
     ----------
@@ -191,6 +241,12 @@ def create_title_cat(
         Dictionary containing the title values as keys (e.g. Mr, Mrs, mme etc.)
         and the corresponding codes as values (e.g. gen_male, other_female etc.)
 
+    unknown_title_code: str
+        The code of titles which aren't present in title_codes.
+
+    inplace: bool
+        Modify the supplied dataframe rather than a copy of it.
+
     Returns
     -------
     df_out: pandas.DataFrame
@@ -214,39 +270,36 @@ def create_title_cat(
     )
     """
 
-    logger.info("Running create_title_cat()")
+    logger.debug("Running create_title_cat()")
 
-    # Define the extract_title function
-    def extract_title(
+    # Define the code_title function
+    def code_title(
         row: pd.core.series.Series,
         source_column: str
     ):
         """
         Extracts the title from the supplied specified title_source_column via
-        a regex. Applied to a pandas DataFrame
+        a regex and codes it. Applied to a pandas DataFrame
         """
 
-        title_search = re.search(r' ([A-Za-z]+)\.', row[source_column])
-
-        if title_search:
-            title = title_search.group(1)
-
-        else:
-            title = ""
-
-        return title
+        return title_codes.get(
+            extract_title(row[source_column]),
+            unknown_title_code
+        )
 
     try:
-        # Apply the extract_title function to the dataframe
-        df_out = df.copy()
+        # Apply the code_title function to the dataframe
+        df_out = df if inplace else df.copy()
 
         df_out[dest_column] = (
             df_out.apply(
-                extract_title,
+                code_title,
                 args=([source_column]),
                 axis=1
             )
-            .replace(title_codes)
+            .astype(pd.CategoricalDtype(
+                title_categories(title_codes, unknown_title_code)
+            ))
         )
 
         return df_out
@@ -259,7 +312,8 @@ def impute_age(
     df: pd.core.frame.DataFrame,
     source_column: str,
     title_cat_column: str,
-    age_codes: dict
+    age_codes: dict,
+    inplace: bool = False
 ):
     """
     If the age of a passenger is missing, infer this based upon the passenger
@@ -280,6 +334,9 @@ def impute_age(
         Dictionary containing the title category values as keys (e.g. "gen_male"
         "gen_female", and the age to infer as values.
 
+    inplace: bool
+        Modify the supplied dataframe rather than a copy of it.
+
     Returns
     -------
     df: pandas.DataFrame
@@ -304,7 +361,7 @@ def impute_age(
     )
     """
 
-    logger.info("Running impute_age()")
+    logger.debug("Running impute_age()")
 
     def infer_age(
         row: pd.core.series.Series,
@@ -330,7 +387,7 @@ def impute_age(
 
     try:
         # Apply the infer_age function to the pandas dataframe
-        df_out = df.copy()
+        df_out = df if inplace else df.copy()
         df_out[source_column] = (
             df_out.apply(
                 infer_age,
@@ -348,7 +405,8 @@ def impute_age(
 def create_family_size(
     df: pd.core.frame.DataFrame,
     source_columns: list,
-    dest_column: str
+    dest_column: str,
+    inplace: bool = False
 ):
     """
     Description
@@ -366,6 +424,9 @@ def create_family_size(
     dest_column: str
         The destination column to contain the family size values.
 
+    inplace: bool
+        Modify the supplied dataframe rather than a copy of it.
+
     Returns
     -------
     df_out: pd.core.frame.DataFrame.
@@ -385,10 +446,10 @@ def create_family_size(
     )
     """
 
-    logger.info("Running create_family_size()")
+    logger.debug("Running create_family_size()")
 
     try:
-        df_out = df.copy()
+        df_out = df if inplace else df.copy()
         df_out[dest_column] = df_out.apply(
             lambda row: row[source_columns].sum() + 1,
             axis=1
@@ -439,7 +500,7 @@ def impute_missing_values(
         strategy="most_frequent"
     )
     """
-    logger.info("Running impute_missing_values()")
+    logger.debug("Running impute_missing_values()")
 
     try:
         df_out = df.copy()
@@ -507,7 +568,7 @@ def scaler(
         scale_columns=["col1", "col2"]
     )
     """
-    logger.info("Running scaler()")
+    logger.debug("Running scaler()")
     try:
         df_out = df.copy()
 
@@ -560,7 +621,7 @@ def one_hot_encoder(
     )
     """
 
-    logger.info("running one_hot_encoder()")
+    logger.debug("Running one_hot_encoder()")
 
     try:
         df_out = df.copy()
@@ -0,0 +1,240 @@
+from loguru import logger
+import numpy as np
+import pandas as pd
+from src.preprocessing_pipeline.transforms import (
+    extract_title,
+    title_categories
+)
+
+
+def create_title_cat_vectorized(
+    df: pd.core.frame.DataFrame,
+    source_column: str,
+    dest_column: str,
+    title_codes: dict,
+    unknown_title_code: str = "other",
+    inplace: bool = False
+):
+    """
+    Description
+    -----------
+    Vectorized equivalent of create_title_cat. Rather than extracting the
+    title of each row, the names are factorized and the title category of
+    each unique name is looked up once. The categorical codes of the unique
+    names are then taken for every row, so the regex only runs once per
+    unique name and the dest_column is created as a categorical without
+    converting any strings.
+
+    Titles which aren't present in title_codes, names without a title and
+    missing names are coded as the unknown_title_code, matching
+    create_title_cat.
+
+    Parameters
+    ----------
+    df: pandas.core.frame.DataFrame
+        The dataframe to be processed
+
+    source_column: str
+        The coulumn containing the data from which to extract the title.
+
+    dest_column: str
+        The new column to create containing the extracted title.
+
+    title_codes: dict
+        Dictionary containing the title values as keys (e.g. Mr, Mrs, mme etc.)
+        and the corresponding codes as values (e.g. gen_male, other_female etc.)
+
+    unknown_title_code: str
+        The code of titles which aren't present in title_codes.
+
+    inplace: bool
+        Modify the supplied dataframe rather than a copy of it.
+
+    Returns
+    -------
+    df_out: pandas.DataFrame
+        The processed pandas Dataframe
+
+    Raises
+    ------
+    Exception: Exception
+        Generic exception for logging
+
+    Examples
+    --------
+    df_out = create_title_cat_vectorized(
+        df=df
+        source_column="col1",
+        dest_column="col2"
+        title_codes: {
+            "Mr": "gen_male".
+            "Mrs: "gen_female"s
+        }
+    )
+    """
+
+    logger.debug("Running create_title_cat_vectorized()")
+
+    try:
+        df_out = df if inplace else df.copy()
+
+        categories = title_categories(title_codes, unknown_title_code)
+        name_codes, names = pd.factorize(df_out[source_column])
+
+        # The category of each unique name, followed by the category of
+        # missing names, which are factorized as -1
+        lookup = np.append(
+            pd.Categorical(
+                [
+                    title_codes.get(extract_title(name), unknown_title_code)
+                    for name in names.to_numpy(dtype=object)
+                ],
+                categories=categories
+            ).codes,
+            categories.index(unknown_title_code)
+        )
+        df_out[dest_column] = pd.Categorical.from_codes(
+            lookup[name_codes],
+            categories=categories
+        )
+
+        return df_out
+
+    except Exception:
+        logger.exception("Error running create_title_cat_vectorized()")
+
+
+def impute_age_vectorized(
+    df: pd.core.frame.DataFrame,
+    source_column: str,
+    title_cat_column: str,
+    age_codes: dict,
+    inplace: bool = False
+):
+    """
+    Description
+    -----------
+    Vectorized equivalent of impute_age. Missing ages are filled by mapping
+    the title category column through age_codes and the ages are then
+    truncated to integers, matching impute_age.
+
+    Parameters
+    ----------
+    df: pandas.DataFrame
+        The dataframe to be processed.
+
+    source_column: str
+        The column containing the age values.
+
+    title_cat_column: str
+        The column containing the title category values.
+
+    age_codes: dict
+        Dictionary containing the title category values as keys (e.g. "gen_male"
+        "gen_female", and the age to infer as values.
+
+    inplace: bool
+        Modify the supplied dataframe rather than a copy of it.
+
+    Returns
+    -------
+    df_out: pandas.DataFrame
+        The processed dataframe.
+
+    Raises
+    ------
+    Exception: Exception
+        Generic exception for logging
+
+    Examples
+    --------
+    df_out = impute_age_vectorized(
+        df=df,
+        source_column="Age",
+        title_cat_column="TitleCat",
+        age_codes=dict(
+            gen_male=30,
+            gen_female=35
+            . . .
+        )
+    )
+    """
+
+    logger.debug("Running impute_age_vectorized()")
+
+    try:
+        df_out = df if inplace else df.copy()
+
+        inferred_age = df_out[title_cat_column].map(age_codes).astype(float)
+        df_out[source_column] = (
+            pd.to_numeric(df_out[source_column])
+            .fillna(inferred_age)
+            .astype(int)
+        )
+
+        return df_out
+
+    except Exception:
+        logger.exception("Error running impute_age_vectorized()")
+
+
+def create_family_size_vectorized(
+    df: pd.core.frame.DataFrame,
+    source_columns: list,
+    dest_column: str,
+    inplace: bool = False
+):
+    """
+    Description
+    -----------
+    Vectorized equivalent of create_family_size. Sums the source_columns
+    column by column rather than row by row.
+
+    Parameters
+    ----------
+    df: pd.core.frame.DataFrame
+        The dataframe to be processed.
+
+    source_columns: list
+        The columns to be summed to calculate the family size.
+
+    dest_column: str
+        The destination column to contain the family size values.
+
+    inplace: bool
+        Modify the supplied dataframe rather than a copy of it.
+
+    Returns
+    -------
+    df_out: pd.core.frame.DataFrame.
+        The processed dataframe
+
+    Raises
+    ------
+    Exception: Exception
+        Generic exception for logging
+
+    Examples
+    --------
+    df = create_family_size_vectorized(
+        df=df,
+        source_columns=["col1", "col2"],
+        dest_column="col3
+    )
+    """
+
+    logger.debug("Running create_family_size_vectorized()")
+
+    try:
+        df_out = df if inplace else df.copy()
+        # Sum the columns as series to avoid consolidating the dataframe,
+        # treating missing values as zero as DataFrame.sum does
+        family_size = 1
+        for column in source_columns:
+            family_size = df_out[column].fillna(0) + family_size
+        df_out[dest_column] = family_size
+
+        return df_out
+
+    except Exception:
+        logger.exception("Error running create_family_size_vectorized()")
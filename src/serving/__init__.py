@@ -0,0 +1,44 @@
+from src.utils import lazy_imports
+
+
+# The module each name is imported from on first use
+__getattr__, __dir__ = lazy_imports(
+    package=__name__,
+    imports=dict(
+        compile_model_pipeline="src.serving.compiled_model",
+        CompiledModel="src.serving.compiled_model",
+        export_onnx_model="src.serving.onnx_model",
+        OnnxModel="src.serving.onnx_model",
+        load_scoring_model="src.serving.onnx_model",
+        pop_step_records="src.serving.onnx_model",
+        ONNX_MODEL_FILE="src.serving.onnx_model",
+        MicroBatcher="src.serving.micro_batching",
+        score_file="src.serving.batch_scoring",
+        score_model="src.serving.batch_scoring",
+        parse_request="src.serving.server",
+        create_model_server="src.serving.server",
+        serve_model="src.serving.server",
+        DEPLOYED_MODEL_FILE="src.serving.deployment",
+        set_deployed_model="src.serving.deployment",
+        get_deployed_model="src.serving.deployment"
+    )
+)
+
+__all__ = [
+    "compile_model_pipeline",
+    "CompiledModel",
+    "export_onnx_model",
+    "OnnxModel",
+    "load_scoring_model",
+    "pop_step_records",
+    "ONNX_MODEL_FILE",
+    "MicroBatcher",
+    "score_file",
+    "score_model",
+    "parse_request",
+    "create_model_server",
+    "serve_model",
+    "DEPLOYED_MODEL_FILE",
+    "set_deployed_model",
+    "get_deployed_model"
+]
@@ -0,0 +1,292 @@
+import time
+from pathlib import Path
+from loguru import logger
+import pandas as pd
+from src.ingest_split import iter_raw_csv
+from src.serving.onnx_model import (
+    load_scoring_model,
+    pop_step_records
+)
+
+
+class _CsvWriter:
+    """Appends each chunk of predictions to a csv file"""
+
+    def __init__(self, output_path: str):
+        self.output_path = output_path
+        self.header = True
+
+    def write(self, df: pd.core.frame.DataFrame):
+        df.to_csv(
+            self.output_path,
+            mode="w" if self.header else "a",
+            header=self.header,
+            index=False
+        )
+        self.header = False
+
+    def close(self):
+        pass
+
+
+class _ParquetWriter:
+    """Appends each chunk of predictions to a parquet file as a row group"""
+
+    def __init__(self, output_path: str):
+        # pyarrow is only required when writing parquet files
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        self._pa = pa
+        self._pq = pq
+        self.output_path = output_path
+        self.writer = None
+
+    def write(self, df: pd.core.frame.DataFrame):
+        table = self._pa.Table.from_pandas(df, preserve_index=False)
+        if self.writer is None:
+            self.writer = self._pq.ParquetWriter(
+                self.output_path,
+                table.schema
+            )
+        self.writer.write_table(table)
+
+    def close(self):
+        if self.writer is not None:
+            self.writer.close()
+
+
+WRITERS = {
+    ".csv": _CsvWriter,
+    ".parquet": _ParquetWriter
+}
+
+
+def score_file(
+    model_pipeline,
+    input_path: str,
+    output_path: str,
+    uid: str,
+    prediction_column: str,
+    chunk_size: int,
+    dtypes: dict = None
+):
+    """
+    Description
+    -----------
+    Score a csv file of raw records with a fitted model pipeline, reading and
+    scoring chunk_size records at a time and appending the predictions of
+    each chunk to output_path, so files larger than the available memory can
+    be scored in constant memory.
+
+    The output format is set by the suffix of output_path, either .csv or
+    .parquet. Writing parquet files requires pyarrow.
+
+    If the preprocessing steps of the model pipeline are instrumented, i.e.
+    it was deployed with the preprocessing_parameters instrument set, the
+    time each step took to score the file is logged and the records of each
+    call are returned.
+
+    Parameters
+    ----------
+    model_pipeline: sklearn.pipeline.Pipeline
+        The fitted end-to-end model pipeline.
+
+    input_path: str
+        The location of the csv file of records to score.
+
+    output_path: str
+        The location to write the predictions to.
+
+    uid: str
+        The unique identifier of each record, written alongside its
+        prediction.
+
+    prediction_column: str
+        The name of the column to write the predictions to.
+
+    chunk_size: int
+        The number of records to read and score at a time.
+
+    dtypes: dict
+        The dtype of each column, the dtypes of the ingest_split_parameters
+        the model was trained with, so each chunk is read with the same
+        schema. None infers the dtypes of each chunk.
+
+    Returns
+    -------
+    results: dict
+        The number of records scored, the time taken in seconds, the number
+        of records scored per second and the step_records of each call to
+        an instrumented step, which is empty if the steps aren't
+        instrumented, see pop_step_records.
+
+    Raises
+    ------
+    ValueError:
+        If the suffix of output_path isn't .csv or .parquet
+
+    Examples
+    --------
+    results = score_file(
+        model_pipeline=model_pipeline,
+        input_path="path/to/holdout_raw.csv",
+        output_path="path/to/predictions.parquet",
+        uid="PassengerId",
+        prediction_column="Survived",
+        chunk_size=100000,
+        dtypes=parameters["ingest_split_parameters"]["dtypes"]
+    )
+    """
+
+    logger.info("Running score_file()")
+
+    suffix = Path(output_path).suffix
+    if suffix not in WRITERS:
+        raise ValueError(
+            f"Unable to write predictions to {suffix} files, "
+            f"use one of {list(WRITERS)}"
+        )
+
+    Path(output_path).parent.mkdir(parents=True, exist_ok=True)
+    writer = WRITERS[suffix](output_path)
+    n_records = 0
+    start = time.perf_counter()
+
+    # Drop the records of earlier calls, so only this file's are returned
+    pop_step_records(model_pipeline)
+
+    try:
+        for chunk in iter_raw_csv(
+            path=input_path,
+            chunk_size=chunk_size,
+            dtypes=dtypes
+        ):
+            predictions = model_pipeline.predict(chunk)
+            writer.write(pd.DataFrame({
+                uid: chunk[uid].values,
+                prediction_column: predictions
+            }))
+            n_records += len(chunk)
+            logger.debug(
+                f"Scored {n_records} records, "
+                f"{n_records / (time.perf_counter() - start):.0f} records/s"
+            )
+
+    finally:
+        writer.close()
+
+    seconds = time.perf_counter() - start
+    results = dict(
+        records=n_records,
+        seconds=seconds,
+        records_per_second=n_records / seconds if seconds else 0.0,
+        step_records=pop_step_records(model_pipeline)
+    )
+    logger.info(
+        f"Scored {n_records} records from {input_path} in {seconds:.2f}s "
+        f"({results['records_per_second']:.0f} records/s) to {output_path}"
+    )
+
+    # Log the time spent in each instrumented step over all the chunks
+    step_seconds = {}
+    for record in results["step_records"]:
+        step_seconds[record["step"]] = (
+            step_seconds.get(record["step"], 0.0) + record["seconds"]
+        )
+    for step, step_total in step_seconds.items():
+        logger.info(f"Step {step} took {step_total:.3f}s")
+
+    return results
+
+
+def score_model(
+    models_path: str,
+    input_path: str,
+    output_path: str,
+    uid: str,
+    prediction_column: str,
+    chunk_size: int,
+    dtypes: dict = None,
+    backend: str = "sklearn"
+):
+    """
+    Description
+    -----------
+    Load the model pipeline saved by create_model_pipeline from models_path
+    and score a csv file with it via score_file. With the onnx backend the
+    exported model.onnx is scored via ONNX Runtime instead.
+
+    Parameters
+    ----------
+    models_path: str
+        The location of the saved MLFlow model pipeline.
+
+    input_path: str
+        The location of the csv file of records to score.
+
+    output_path: str
+        The location to write the predictions to, either a .csv or .parquet
+        file.
+
+    uid: str
+        The unique identifier of each record, written alongside its
+        prediction.
+
+    prediction_column: str
+        The name of the column to write the predictions to.
+
+    chunk_size: int
+        The number of records to read and score at a time.
+
+    dtypes: dict
+        The dtype of each column the records are read with, see score_file.
+
+    backend: str
+        The backend to score with, sklearn, onnx or polars, see
+        load_scoring_model.
+
+    Returns
+    -------
+    results: dict
+        The results of score_file
+
+    Raises
+    ------
+    Exception: Exception
+        Generic exception for logging
+
+    Examples
+    --------
+    results = score_model(
+        models_path="path/to/models/model_name",
+        input_path="path/to/holdout_raw.csv",
+        output_path="path/to/predictions.csv",
+        uid="PassengerId",
+        prediction_column="Survived",
+        chunk_size=100000,
+        dtypes=parameters["ingest_split_parameters"]["dtypes"],
+        backend="onnx"
+    )
+    """
+
+    logger.info("Running score_model()")
+
+    try:
+        model_pipeline = load_scoring_model(
+            models_path=models_path,
+            backend=backend
+        )
+
+        return score_file(
+            model_pipeline=model_pipeline,
+            input_path=input_path,
+            output_path=output_path,
+            uid=uid,
+            prediction_column=prediction_column,
+            chunk_size=chunk_size,
+            dtypes=dtypes
+        )
+
+    except Exception:
+        logger.exception("Error running score_model()")
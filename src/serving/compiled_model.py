@@ -0,0 +1,297 @@
+import json
+import math
+from loguru import logger
+import numpy as np
+import pandas as pd
+from sklearn.linear_model import LogisticRegression
+from sklearn.preprocessing import FunctionTransformer
+from src.preprocessing_pipeline.transforms import extract_title
+from src.preprocessing_pipeline.registry import (
+    get_transform,
+    find_transform
+)
+from src.preprocessing_pipeline.estimators import (
+    MissingValuesImputer,
+    ColumnScaler,
+    ColumnOneHotEncoder
+)
+from src.preprocessing_pipeline.instrumentation import InstrumentedStep
+
+
+def _is_missing(value):
+    """Matches the values treated as missing by the preprocessing pipeline"""
+
+    return (
+        value is None
+        or (isinstance(value, float) and math.isnan(value))
+        or (isinstance(value, str) and value == "")
+    )
+
+
+def _sigmoid(score: float):
+    """The logistic function, which doesn't overflow for large scores"""
+
+    if score >= 0:
+        return 1 / (1 + math.exp(-score))
+
+    exp_score = math.exp(score)
+
+    return exp_score / (1 + exp_score)
+
+
+def _to_python(value):
+    """Converts numpy scalars to python types so the plan is json friendly"""
+
+    return value.item() if isinstance(value, np.generic) else value
+
+
+def _compile_function_step(func, kw_args: dict):
+    """
+    Translates a FunctionTransformer step into a plan operation via the
+    compiler of its registered transform
+    """
+
+    name = find_transform(func)
+    compiler = None if name is None else get_transform(name)["compiler"]
+
+    if compiler is not None:
+        return compiler(kw_args)
+
+    raise ValueError(f"Unable to compile the function {func.__name__}()")
+
+
+def compile_model_pipeline(model_pipeline):
+    """
+    Description
+    -----------
+    Compiles a fitted model pipeline, created via create_model_pipeline, into
+    a CompiledModel which scores python dictionaries without pandas.
+
+    The preprocessing steps are translated into a list of operations applied
+    to the record and the scaling, one hot encoding and Logistic Regression
+    coefficients are folded together into a weight per numeric column, a
+    weight lookup per category and a single intercept.
+
+    Parameters
+    ----------
+    model_pipeline: sklearn.pipeline.Pipeline
+        The fitted end-to-end pipeline containing the preprocessing steps and
+        a Logistic Regression model as the final step.
+
+    Returns
+    -------
+    compiled_model: CompiledModel
+        The compiled model
+
+    Raises
+    ------
+    ValueError:
+        If the pipeline contains a step or model which can't be compiled.
+
+    Examples
+    --------
+    compiled_model = compile_model_pipeline(model_pipeline=model_pipeline)
+    compiled_model.predict_record(record)
+    """
+
+    logger.info("Running compile_model_pipeline()")
+
+    *steps, (_, model) = model_pipeline.steps
+
+    if not isinstance(model, LogisticRegression):
+        raise ValueError("Only Logistic Regression models can be compiled")
+
+    if len(model.classes_) != 2:
+        raise ValueError("Only binary classifiers can be compiled")
+
+    coef = dict(zip(model.feature_names_in_, model.coef_[0]))
+    intercept = float(model.intercept_[0])
+    operations = []
+    scale = {}
+    categorical_weights = {}
+    uid = None
+
+    for _, step in steps:
+
+        # Compile the step an instrumented step wraps
+        if isinstance(step, InstrumentedStep):
+            step = step.step
+
+        if isinstance(step, FunctionTransformer):
+            operation = _compile_function_step(step.func, step.kw_args)
+            if operation["op"] == "pop_uid":
+                uid = operation["uid"]
+            operations.append(operation)
+
+        elif isinstance(step, MissingValuesImputer):
+            operations.append(dict(
+                op="fill_missing",
+                fill_values={
+                    column: _to_python(value)
+                    for column, value in step.fill_values_.items()
+                }
+            ))
+
+        elif isinstance(step, ColumnScaler):
+            for column, col_scale, col_min in zip(
+                step.scale_columns,
+                step.scaler_.scale_,
+                step.scaler_.min_
+            ):
+                scale[column] = (float(col_scale), float(col_min))
+
+        elif isinstance(step, ColumnOneHotEncoder):
+            for column in step.one_hot_columns:
+                col_name = column["col_name"]
+                categorical_weights[col_name] = {
+                    str(category): float(coef.pop(f"{col_name}_{category}"))
+                    for category in column["categories"]
+                }
+
+        else:
+            raise ValueError(f"Unable to compile the step {step}")
+
+    # Fold the scaling into the weights & intercept of the numeric columns
+    numeric_weights = {}
+    for column, weight in coef.items():
+        col_scale, col_min = scale.get(column, (1.0, 0.0))
+        numeric_weights[column] = float(weight) * col_scale
+        intercept += float(weight) * col_min
+
+    return CompiledModel(
+        plan=dict(
+            uid=uid,
+            operations=operations,
+            numeric_weights=numeric_weights,
+            categorical_weights=categorical_weights,
+            intercept=intercept,
+            classes=[_to_python(value) for value in model.classes_]
+        )
+    )
+
+
+class CompiledModel:
+    """
+    Description
+    -----------
+    Scores single records, supplied as dictionaries of raw passenger data,
+    with a plan created by compile_model_pipeline. The plan only contains
+    python types so it can be saved and loaded as json.
+
+    Parameters
+    ----------
+    plan: dict
+        The compiled plan
+
+    Examples
+    --------
+    compiled_model = CompiledModel.load("path/to/compiled_model.json")
+    compiled_model.predict_record(
+        dict(
+            PassengerId=1,
+            Pclass=3,
+            Name="Braund, Mr. Owen Harris",
+            . . .
+        )
+    )
+    """
+
+    def __init__(self, plan: dict):
+        self.plan = plan
+        self._operations = [
+            (getattr(self, f"_{operation['op']}"), operation)
+            for operation in plan["operations"]
+        ]
+        self._numeric_weights = list(plan["numeric_weights"].items())
+        self._categorical_weights = list(plan["categorical_weights"].items())
+        self._intercept = plan["intercept"]
+        self._classes = plan["classes"]
+
+    # Plan operations, each of which updates the record in place
+    def _pop_uid(self, record, operation):
+        record.pop(operation["uid"], None)
+
+    def _convert_to_str(self, record, operation):
+        for column in operation["columns"]:
+            record[column] = str(record[column])
+
+    def _extract_title(self, record, operation):
+        record[operation["dest_column"]] = operation["title_codes"].get(
+            extract_title(record[operation["source_column"]]),
+            operation["unknown_title_code"]
+        )
+
+    def _impute_age(self, record, operation):
+        age = record.get(operation["source_column"])
+        if _is_missing(age):
+            age = operation["age_codes"][record[operation["title_cat_column"]]]
+        record[operation["source_column"]] = int(age)
+
+    def _sum_columns(self, record, operation):
+        record[operation["dest_column"]] = sum(
+            record[column] for column in operation["source_columns"]
+        ) + 1
+
+    def _drop_columns(self, record, operation):
+        for column in operation["columns"]:
+            record.pop(column, None)
+
+    def _fill_missing(self, record, operation):
+        for column, value in operation["fill_values"].items():
+            if _is_missing(record.get(column)):
+                record[column] = value
+
+    def decision_function_record(self, record: dict):
+        """Returns the decision function value for a single record"""
+
+        record = dict(record)
+        for function, operation in self._operations:
+            function(record, operation)
+
+        score = self._intercept
+        for column, weight in self._numeric_weights:
+            score += weight * float(record[column])
+
+        for column, weights in self._categorical_weights:
+            try:
+                score += weights[str(record[column])]
+            except KeyError:
+                raise ValueError(
+                    f"Found unknown category {record[column]} in {column}"
+                )
+
+        return score
+
+    def predict_proba_record(self, record: dict):
+        """Returns the probability of the positive class for a single record"""
+
+        return _sigmoid(self.decision_function_record(record))
+
+    def predict_record(self, record: dict):
+        """Returns the predicted class for a single record"""
+
+        return self._classes[int(self.decision_function_record(record) > 0)]
+
+    def predict(self, records):
+        """
+        Returns the predicted classes for a list of records or a pandas
+        DataFrame of records
+        """
+
+        if isinstance(records, pd.core.frame.DataFrame):
+            records = records.to_dict(orient="records")
+
+        return np.array([self.predict_record(record) for record in records])
+
+    def save(self, path: str):
+        """Saves the plan as json"""
+
+        with open(path, "w") as stream:
+            json.dump(self.plan, stream, indent=2)
+
+    @classmethod
+    def load(cls, path: str):
+        """Loads a plan saved as json"""
+
+        with open(path, "r") as stream:
+            return cls(plan=json.load(stream))
@@ -0,0 +1,91 @@
+import os
+from pathlib import Path
+from loguru import logger
+
+
+# The file in the models directory naming the deployed model
+DEPLOYED_MODEL_FILE = "deployed"
+
+
+def set_deployed_model(models_path: str, model_name: str):
+    """
+    Description
+    -----------
+    Records model_name as the deployed model by writing it to the deployed
+    file in models_path, so the scoring & serving entrypoints default to the
+    model which was deployed last, e.g. the winner of a tournament, rather
+    than a fixed model_name. The file is replaced in a single step, so it's
+    never read part written.
+
+    Parameters
+    ----------
+    models_path: str
+        The directory the models are saved in, each in a folder named after
+        the model.
+
+    model_name: str
+        The name of the deployed model.
+
+    Returns
+    -------
+    path: str
+        The location of the deployed file
+
+    Raises
+    ------
+    None
+
+    Examples
+    --------
+    set_deployed_model(models_path="path/to/models", model_name="svc_v000")
+    """
+
+    path = Path(models_path) / DEPLOYED_MODEL_FILE
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    tmp_path = path.with_suffix(".tmp")
+    tmp_path.write_text(f"{model_name}\n")
+    os.replace(tmp_path, path)
+
+    logger.info(f"Deployed {model_name}")
+
+    return str(path)
+
+
+def get_deployed_model(models_path: str):
+    """
+    Description
+    -----------
+    Returns the name of the model recorded as deployed in models_path by
+    set_deployed_model, which main.py calls when a model is deployed via
+    `make run-deployment`.
+
+    Parameters
+    ----------
+    models_path: str
+        The directory the models are saved in.
+
+    Returns
+    -------
+    model_name: str
+        The name of the deployed model
+
+    Raises
+    ------
+    FileNotFoundError:
+        If no model has been deployed to models_path
+
+    Examples
+    --------
+    model_name = get_deployed_model(models_path="path/to/models")
+    """
+
+    path = Path(models_path) / DEPLOYED_MODEL_FILE
+
+    if not path.exists():
+        raise FileNotFoundError(
+            f"No model has been deployed to {models_path}, run "
+            "`make run-deployment` or supply a model_name"
+        )
+
+    return path.read_text().strip()
@@ -0,0 +1,202 @@
+import time
+import queue
+import threading
+from concurrent.futures import Future
+from loguru import logger
+import numpy as np
+import pandas as pd
+
+
+class MicroBatcher:
+    """
+    Description
+    -----------
+    Merges concurrent requests into micro-batches so that a single vectorized
+    call of predict_function scores many requests at once.
+
+    Requests are submitted from any number of threads and queued. A worker
+    thread takes the first queued request and keeps collecting requests until
+    the next request would take the batch over max_batch_size records or
+    max_wait_ms has elapsed. The batch is then scored in one call and the
+    predictions for each request are returned to the thread that submitted it.
+    If scoring the batch fails its requests are scored one at a time, so a
+    bad request only fails itself.
+
+    Parameters
+    ----------
+    predict_function: callable
+        Function which accepts a pandas DataFrame of records and returns an
+        array of predictions, one per record (e.g. model_pipeline.predict).
+
+    max_batch_size: int
+        The maximum number of records to score in a single batch. A request
+        larger than this is scored as a batch on its own.
+
+    max_wait_ms: float
+        The maximum time to wait for further requests after the first request
+        of a batch has been received, in milliseconds.
+
+    Examples
+    --------
+    with MicroBatcher(
+        predict_function=model_pipeline.predict,
+        max_batch_size=256,
+        max_wait_ms=5
+    ) as batcher:
+        predictions = batcher.predict(df)
+    """
+
+    def __init__(
+        self,
+        predict_function,
+        max_batch_size: int = 256,
+        max_wait_ms: float = 5
+    ):
+        self.predict_function = predict_function
+        self.max_batch_size = max_batch_size
+        self.max_wait_ms = max_wait_ms
+        self._queue = queue.Queue()
+        self._thread = None
+        self._lock = threading.Lock()
+        self._next_request = None
+
+    def start(self):
+        """Start the worker thread"""
+
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run,
+                    name="MicroBatcher",
+                    daemon=True
+                )
+                self._thread.start()
+
+        return self
+
+    def stop(self):
+        """Score any queued requests and stop the worker thread"""
+
+        # Requests submitted before the stop signal are scored, later ones
+        # are rejected by submit
+        with self._lock:
+            thread, self._thread = self._thread, None
+            if thread is not None:
+                self._queue.put(None)
+
+        if thread is not None:
+            thread.join()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *args):
+        self.stop()
+
+    def submit(self, df: pd.core.frame.DataFrame):
+        """
+        Queue a DataFrame of records to be scored and return a
+        concurrent.futures.Future which resolves to its predictions. Raises
+        a RuntimeError if the batcher isn't running, as nothing would score
+        the records.
+        """
+
+        future = Future()
+
+        with self._lock:
+            if self._thread is None:
+                raise RuntimeError(
+                    "The MicroBatcher isn't running, call start() first"
+                )
+            self._queue.put((df, future))
+
+        return future
+
+    def predict(self, df: pd.core.frame.DataFrame):
+        """Score a DataFrame of records, blocking until it's been scored"""
+
+        return self.submit(df).result()
+
+    def _collect_batch(self, first_request: tuple):
+        """Collect queued requests into a batch with the first request"""
+
+        batch = [first_request]
+        n_records = len(first_request[0])
+        deadline = time.monotonic() + self.max_wait_ms / 1000
+        stopping = False
+
+        while n_records < self.max_batch_size:
+            timeout = deadline - time.monotonic()
+            if timeout <= 0:
+                break
+
+            try:
+                request = self._queue.get(timeout=timeout)
+            except queue.Empty:
+                break
+
+            if request is None:
+                stopping = True
+                break
+
+            # Hold the request over for the next batch if it doesn't fit
+            if n_records + len(request[0]) > self.max_batch_size:
+                self._next_request = request
+                break
+
+            batch.append(request)
+            n_records += len(request[0])
+
+        return batch, stopping
+
+    def _score_batch(self, batch: list):
+        """
+        Score a batch and return the predictions to each request. If the
+        batch fails each request is scored on its own, so only the requests
+        which fail, e.g. with an unknown category, receive the exception.
+        """
+
+        frames = [df for df, _ in batch]
+        futures = [future for _, future in batch]
+
+        try:
+            predictions = np.asarray(
+                self.predict_function(
+                    pd.concat(frames) if len(frames) > 1 else frames[0]
+                )
+            )
+
+        except Exception as e:
+            if len(batch) > 1:
+                logger.warning(
+                    f"Error scoring micro-batch of {len(batch)} requests, "
+                    f"scoring each request individually"
+                )
+                for request in batch:
+                    self._score_batch([request])
+
+            else:
+                logger.exception("Error scoring micro-batch")
+                futures[0].set_exception(e)
+
+            return
+
+        offsets = np.cumsum([len(df) for df in frames])[:-1]
+        for future, result in zip(futures, np.split(predictions, offsets)):
+            future.set_result(result)
+
+    def _run(self):
+        """Worker loop which collects and scores batches until stopped"""
+
+        stopping = False
+
+        while not stopping or self._next_request is not None:
+            if self._next_request is not None:
+                request, self._next_request = self._next_request, None
+            else:
+                request = self._queue.get()
+                if request is None:
+                    break
+
+            batch, stopping = self._collect_batch(request)
+            self._score_batch(batch)
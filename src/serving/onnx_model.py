@@ -0,0 +1,625 @@
+import pickle
+from loguru import logger
+import numpy as np
+import pandas as pd
+import yaml
+
+
+# The opsets of the exported graph. StringSplit & RegexFullMatch need 20 and
+# LabelEncoder with double values needs ai.onnx.ml 4.
+ONNX_OPSET = 20
+ONNX_ML_OPSET = 4
+
+# The name of the exported model within the saved model directory
+ONNX_MODEL_FILE = "model.onnx"
+
+# The regular expression matching a title token, e.g. "Mr." in "Mr. Owen"
+TITLE_TOKEN_PATTERN = r"[A-Za-z]+\..*"
+
+
+class _GraphBuilder:
+    """
+    Builds the nodes of an ONNX graph which applies the operations of a
+    compiled plan to a column per input. Each column is a [records, 1]
+    tensor of strings or doubles, created as a graph input the first time
+    it's used.
+    """
+
+    def __init__(self):
+        from onnx import (
+            helper,
+            numpy_helper,
+            TensorProto
+        )
+
+        self.helper = helper
+        self.numpy_helper = numpy_helper
+        self.tensor_types = dict(
+            string=TensorProto.STRING,
+            double=TensorProto.DOUBLE,
+            int64=TensorProto.INT64
+        )
+        self.nodes = []
+        self.initializers = []
+        self.inputs = []
+        self.columns = {}
+        self.kinds = {}
+        self._names = 0
+
+    def _name(self, prefix: str):
+        self._names += 1
+        return f"{prefix}_{self._names}"
+
+    def const(self, value, dtype=None):
+        """Adds a constant tensor & returns its name"""
+
+        array = np.array(value, dtype=dtype)
+        if array.dtype.kind == "U":
+            array = array.astype(object)
+
+        name = self._name("const")
+        self.initializers.append(
+            self.numpy_helper.from_array(array, name=name)
+        )
+
+        return name
+
+    def node(
+        self,
+        op_type: str,
+        inputs: list,
+        domain: str = "",
+        n_outputs: int = 1,
+        **attrs
+    ):
+        """Adds a node & returns the name of its first output"""
+
+        outputs = [self._name(op_type.lower()) for _ in range(n_outputs)]
+        self.nodes.append(self.helper.make_node(
+            op_type,
+            inputs=inputs,
+            outputs=outputs,
+            domain=domain,
+            **attrs
+        ))
+
+        return outputs[0]
+
+    def label_encoder(self, column: str, mapping: dict, default):
+        """Maps the strings of a column to strings or doubles"""
+
+        keys = list(mapping)
+        values = list(mapping.values())
+
+        if isinstance(default, str):
+            return self.node(
+                "LabelEncoder",
+                [column],
+                domain="ai.onnx.ml",
+                keys_strings=keys,
+                values_strings=values,
+                default_string=default
+            )
+
+        return self.node(
+            "LabelEncoder",
+            [column],
+            domain="ai.onnx.ml",
+            keys_strings=keys,
+            values_tensor=self.numpy_helper.from_array(
+                np.array(values, dtype=np.float64)
+            ),
+            default_tensor=self.numpy_helper.from_array(
+                np.array([default], dtype=np.float64)
+            )
+        )
+
+    def column(self, name: str, kind: str):
+        """Returns the tensor of a column, adding an input if it's new"""
+
+        if name not in self.columns:
+            self.inputs.append(self.helper.make_tensor_value_info(
+                name,
+                self.tensor_types[kind],
+                [None, 1]
+            ))
+            self.columns[name] = name
+            self.kinds[name] = kind
+
+        if self.kinds[name] != kind:
+            raise ValueError(
+                f"Unable to export the {self.kinds[name]} column {name} as "
+                f"a {kind} column"
+            )
+
+        return self.columns[name]
+
+    def set_column(self, name: str, tensor: str, kind: str):
+        self.columns[name] = tensor
+        self.kinds[name] = kind
+
+    # Plan operations, see CompiledModel
+    def pop_uid(self, operation):
+        pass
+
+    def convert_to_str(self, operation):
+        # The records are supplied as strings by OnnxModel
+        for column in operation["columns"]:
+            self.column(column, "string")
+
+    def extract_title(self, operation):
+        name = self.column(operation["source_column"], "string")
+
+        # Split the name into tokens, padded with "", and find the first
+        # token after the first which matches the title pattern
+        tokens = self.node(
+            "StringSplit",
+            [name],
+            n_outputs=2,
+            delimiter=" "
+        )
+        tokens = self.node(
+            "Slice",
+            [
+                tokens,
+                self.const([1], np.int64),
+                self.const([np.iinfo(np.int64).max], np.int64),
+                self.const([2], np.int64)
+            ]
+        )
+        tokens = self.node(
+            "Concat",
+            [tokens, self.node("Expand", [
+                self.const([[[""]]]),
+                self.node(
+                    "Concat",
+                    [self.node("Shape", [name]), self.const([1], np.int64)],
+                    axis=0
+                )
+            ])],
+            axis=2
+        )
+        matches = self.node(
+            "RegexFullMatch",
+            [tokens],
+            pattern=TITLE_TOKEN_PATTERN
+        )
+        first = self.node(
+            "ArgMax",
+            [self.node("Cast", [matches], to=self.tensor_types["double"])],
+            axis=2,
+            keepdims=1
+        )
+        token = self.node("Where", [
+            self.node("GatherElements", [matches, first], axis=2),
+            self.node("GatherElements", [tokens, first], axis=2),
+            self.const(".")
+        ])
+
+        # The title is the token up to the ".", or "" if there's no match
+        title = self.node(
+            "StringSplit",
+            [token],
+            n_outputs=2,
+            delimiter=".",
+            maxsplit=1
+        )
+        title = self.node("Gather", [title, self.const(0, np.int64)], axis=3)
+        title = self.node("Squeeze", [title, self.const([2], np.int64)])
+
+        self.set_column(
+            operation["dest_column"],
+            self.label_encoder(
+                title,
+                operation["title_codes"],
+                operation["unknown_title_code"]
+            ),
+            "string"
+        )
+
+    def impute_age(self, operation):
+        age = self.column(operation["source_column"], "double")
+        title_cat = self.column(operation["title_cat_column"], "string")
+
+        age = self.node("Where", [
+            self.node("IsNaN", [age]),
+            self.label_encoder(title_cat, operation["age_codes"], np.nan),
+            age
+        ])
+
+        # Truncate to integers, matching impute_age
+        age = self.node(
+            "Cast",
+            [self.node("Cast", [age], to=self.tensor_types["int64"])],
+            to=self.tensor_types["double"]
+        )
+        self.set_column(operation["source_column"], age, "double")
+
+    def sum_columns(self, operation):
+        # Missing values count as zero, matching create_family_size
+        values = [
+            self.column(column, "double")
+            for column in operation["source_columns"]
+        ]
+        self.set_column(
+            operation["dest_column"],
+            self.node("Add", [
+                self.node("Sum", [
+                    self.node("Where", [
+                        self.node("IsNaN", [value]),
+                        self.const(0.0),
+                        value
+                    ])
+                    for value in values
+                ]),
+                self.const(1.0)
+            ]),
+            "double"
+        )
+
+    def drop_columns(self, operation):
+        for column in operation["columns"]:
+            self.columns.pop(column, None)
+            self.kinds.pop(column, None)
+
+    def fill_missing(self, operation):
+        for column, value in operation["fill_values"].items():
+            kind = "string" if isinstance(value, str) else "double"
+            tensor = self.column(column, kind)
+            missing = (
+                self.node("Equal", [tensor, self.const("")])
+                if kind == "string"
+                else self.node("IsNaN", [tensor])
+            )
+            self.set_column(
+                column,
+                self.node("Where", [missing, self.const(value), tensor]),
+                kind
+            )
+
+
+def export_onnx_model(model_pipeline, path: str):
+    """
+    Description
+    -----------
+    Exports a fitted model pipeline, created via create_model_pipeline, to an
+    ONNX graph which applies the preprocessing and model to the raw columns,
+    so it can be scored via OnnxModel with ONNX Runtime rather than pandas
+    and scikit-learn.
+
+    The pipeline is compiled via compile_model_pipeline and each operation
+    of the plan is translated into ONNX operators: the title is extracted &
+    mapped to its category, missing ages are imputed from the category, the
+    family size is summed and missing values are filled. The scaling, one
+    hot encoding and Logistic Regression coefficients are folded into a
+    weight per numeric column and a weight lookup per categorical column.
+
+    The graph has an input per raw column used, a [records, 1] tensor of
+    strings or doubles where missing values are "" or NaN, and outputs the
+    predicted label and the probabilities of each class. Unknown categories
+    give NaN probabilities.
+
+    Requires the onnx package.
+
+    Parameters
+    ----------
+    model_pipeline: sklearn.pipeline.Pipeline
+        The fitted end-to-end pipeline containing the preprocessing steps and
+        a Logistic Regression model as the final step.
+
+    path: str
+        The location to save the .onnx file.
+
+    Returns
+    -------
+    onnx_model: onnx.ModelProto
+        The exported ONNX model
+
+    Raises
+    ------
+    ValueError:
+        If the pipeline contains a step or model which can't be compiled or
+        exported.
+
+    Examples
+    --------
+    export_onnx_model(
+        model_pipeline=model_pipeline,
+        path="path/to/models/model_name/model.onnx"
+    )
+    onnx_model = OnnxModel("path/to/models/model_name/model.onnx")
+    """
+
+    logger.info("Running export_onnx_model()")
+
+    import onnx
+    from src.serving.compiled_model import compile_model_pipeline
+
+    plan = compile_model_pipeline(model_pipeline).plan
+    graph = _GraphBuilder()
+
+    for operation in plan["operations"]:
+        getattr(graph, operation["op"])(operation)
+
+    # Sum the weight of each numeric & categorical column
+    terms = [graph.const([[plan["intercept"]]])]
+    for column, weight in plan["numeric_weights"].items():
+        terms.append(graph.node(
+            "Mul",
+            [graph.column(column, "double"), graph.const(weight)]
+        ))
+    for column, weights in plan["categorical_weights"].items():
+        terms.append(graph.label_encoder(
+            graph.column(column, "string"),
+            weights,
+            np.nan
+        ))
+    score = graph.node("Sum", terms)
+
+    # Convert the score into the probability & label of each class
+    probability = graph.node("Sigmoid", [score])
+    graph.nodes.append(graph.helper.make_node(
+        "Concat",
+        inputs=[
+            graph.node("Sub", [graph.const(1.0), probability]),
+            probability
+        ],
+        outputs=["probabilities"],
+        axis=1
+    ))
+    graph.nodes.append(graph.helper.make_node(
+        "Gather",
+        inputs=[
+            graph.const(plan["classes"]),
+            graph.node(
+                "Squeeze",
+                [
+                    graph.node(
+                        "Cast",
+                        [graph.node("Greater", [score, graph.const(0.0)])],
+                        to=graph.tensor_types["int64"]
+                    ),
+                    graph.const([1], np.int64)
+                ]
+            )
+        ],
+        outputs=["label"]
+    ))
+
+    classes = np.array(plan["classes"])
+    label_type = (
+        onnx.TensorProto.STRING
+        if classes.dtype.kind in "UO"
+        else onnx.helper.np_dtype_to_tensor_dtype(classes.dtype)
+    )
+    onnx_model = onnx.helper.make_model(
+        onnx.helper.make_graph(
+            nodes=graph.nodes,
+            name="model_pipeline",
+            inputs=graph.inputs,
+            outputs=[
+                onnx.helper.make_tensor_value_info(
+                    "label",
+                    label_type,
+                    [None]
+                ),
+                onnx.helper.make_tensor_value_info(
+                    "probabilities",
+                    onnx.TensorProto.DOUBLE,
+                    [None, 2]
+                )
+            ],
+            initializer=graph.initializers
+        ),
+        opset_imports=[
+            onnx.helper.make_opsetid("", ONNX_OPSET),
+            onnx.helper.make_opsetid("ai.onnx.ml", ONNX_ML_OPSET)
+        ],
+        producer_name="titanic-mlflow"
+    )
+    onnx.checker.check_model(onnx_model, full_check=True)
+    onnx.save(onnx_model, path)
+
+    return onnx_model
+
+
+class OnnxModel:
+    """
+    Description
+    -----------
+    Scores records, supplied as a pandas DataFrame or list of dictionaries
+    of raw passenger data, with a model exported via export_onnx_model using
+    ONNX Runtime on the CPU. A drop in replacement for the model pipeline
+    when serving or batch scoring.
+
+    Requires the onnxruntime package.
+
+    Parameters
+    ----------
+    path: str
+        The location of the .onnx file.
+
+    Attributes
+    ----------
+    input_kinds: dict
+        The name of each input column and whether it's a string or double
+
+    Examples
+    --------
+    onnx_model = OnnxModel("path/to/models/model_name/model.onnx")
+    onnx_model.predict(X_holdout)
+    """
+
+    def __init__(self, path: str):
+        import onnxruntime
+
+        self.path = path
+        self._session = onnxruntime.InferenceSession(
+            path,
+            providers=["CPUExecutionProvider"]
+        )
+        self.input_kinds = {
+            session_input.name: (
+                "string"
+                if session_input.type == "tensor(string)"
+                else "double"
+            )
+            for session_input in self._session.get_inputs()
+        }
+
+    def _feeds(self, records):
+        """Converts the records into a [records, 1] array per input"""
+
+        if not isinstance(records, pd.core.frame.DataFrame):
+            records = pd.DataFrame(list(records))
+
+        feeds = {}
+        for column, kind in self.input_kinds.items():
+            if kind == "string":
+                # Convert each unique value to a string once, with missing
+                # values, whose code is -1, converted to the "" appended
+                codes, uniques = pd.factorize(records[column])
+                array = np.array(
+                    [str(value) for value in uniques] + [""],
+                    dtype=object
+                )[codes]
+            else:
+                array = pd.to_numeric(records[column]).to_numpy(
+                    dtype=np.float64,
+                    na_value=np.nan
+                )
+            feeds[column] = array.reshape(-1, 1)
+
+        return feeds
+
+    def _run(self, records):
+        label, probabilities = self._session.run(
+            ["label", "probabilities"],
+            self._feeds(records)
+        )
+
+        if np.isnan(probabilities).any():
+            raise ValueError("Found unknown categories in the records")
+
+        return label, probabilities
+
+    def predict_proba(self, records):
+        """Returns the probability of each class for each record"""
+
+        return self._run(records)[1]
+
+    def predict(self, records):
+        """Returns the predicted class for each record"""
+
+        return self._run(records)[0]
+
+
+def _load_sklearn_model(models_path: str):
+    """
+    Loads the pickled model of an MLFlow sklearn model as
+    mlflow.sklearn.load_model does, without importing mlflow
+    """
+
+    with open(f"{models_path}/MLmodel") as stream:
+        flavor = yaml.safe_load(stream)["flavors"]["sklearn"]
+
+    with open(f"{models_path}/{flavor['pickled_model']}", "rb") as stream:
+        if flavor["serialization_format"] == "cloudpickle":
+            import cloudpickle
+            return cloudpickle.load(stream)
+
+        return pickle.load(stream)
+
+
+def load_scoring_model(models_path: str, backend: str = "sklearn"):
+    """
+    Description
+    -----------
+    Loads the model saved by create_model_pipeline from models_path with the
+    supplied backend, either the MLFlow sklearn model pipeline, the
+    model.onnx file scored via OnnxModel or the model pipeline with its
+    preprocessing run by Polars via PolarsPipeline. Each scores a DataFrame
+    of raw records via predict. None of them import mlflow, so scoring
+    processes start quickly.
+
+    Parameters
+    ----------
+    models_path: str
+        The location of the saved MLFlow model pipeline.
+
+    backend: str
+        The backend to score with, sklearn, onnx or polars.
+
+    Returns
+    -------
+    model: sklearn.pipeline.Pipeline, OnnxModel or PolarsPipeline
+        The model to score with
+
+    Raises
+    ------
+    ValueError:
+        If the backend isn't sklearn, onnx or polars
+
+    Examples
+    --------
+    model = load_scoring_model(
+        models_path="path/to/models/model_name",
+        backend="onnx"
+    )
+    model.predict(X_holdout)
+    """
+
+    if backend == "sklearn":
+        return _load_sklearn_model(models_path)
+
+    if backend == "onnx":
+        return OnnxModel(f"{models_path}/{ONNX_MODEL_FILE}")
+
+    if backend == "polars":
+        from src.preprocessing_pipeline.polars_pipeline import (
+            create_polars_pipeline
+        )
+        return create_polars_pipeline(_load_sklearn_model(models_path))
+
+    raise ValueError(
+        f"Unknown backend {backend}, use one of sklearn, onnx or polars"
+    )
+
+
+def pop_step_records(model):
+    """
+    Description
+    -----------
+    Returns & clears the records of each call to the instrumented steps of a
+    model loaded via load_scoring_model, so the records of a deployed model
+    can be read after scoring. Only the sklearn backend runs the
+    instrumented steps, so the onnx & polars models have no records.
+
+    Parameters
+    ----------
+    model: sklearn.pipeline.Pipeline, OnnxModel or PolarsPipeline
+        The model scored with.
+
+    Returns
+    -------
+    records: list
+        The records of each call, see get_step_records
+
+    Raises
+    ------
+    None
+
+    Examples
+    --------
+    model.predict(X_holdout)
+    records = pop_step_records(model)
+    """
+
+    if not hasattr(model, "named_steps"):
+        return []
+
+    # Only sklearn pipelines, which already require scikit-learn, have
+    # instrumented steps
+    from src.preprocessing_pipeline.instrumentation import get_step_records
+
+    return get_step_records(model, clear=True)
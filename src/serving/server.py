@@ -0,0 +1,312 @@
+import json
+import time
+from http.server import (
+    BaseHTTPRequestHandler,
+    ThreadingHTTPServer
+)
+from loguru import logger
+import pandas as pd
+from src.serving.onnx_model import (
+    load_scoring_model,
+    pop_step_records
+)
+from src.serving.micro_batching import MicroBatcher
+
+
+def parse_request(body: bytes, content_type: str):
+    """
+    Description
+    -----------
+    Parse the body of an /invocations request into a pandas DataFrame. The
+    request formats accepted by mlflow models serve are supported:
+        * application/json; format=pandas-split (default)
+        * application/json; format=pandas-records
+
+    Parameters
+    ----------
+    body: bytes
+        The json body of the request
+
+    content_type: str
+        The Content-Type header of the request
+
+    Returns
+    -------
+    df: pandas.core.frame.DataFrame
+        The records to score
+
+    Raises
+    ------
+    ValueError:
+        If the body can't be parsed into a DataFrame.
+
+    Examples
+    --------
+    df = parse_request(
+        body=df.to_json(orient="split").encode(),
+        content_type="application/json; format=pandas-split"
+    )
+    """
+
+    data = json.loads(body)
+
+    if "format=pandas-records" in (content_type or ""):
+        return pd.DataFrame(data)
+
+    if not isinstance(data, dict) or "data" not in data:
+        raise ValueError("Expected a pandas-split formatted json body")
+
+    return pd.DataFrame(
+        data=data["data"],
+        columns=data.get("columns"),
+        index=data.get("index")
+    )
+
+
+class ModelRequestHandler(BaseHTTPRequestHandler):
+    """
+    Handles requests to the model server. Requests to /invocations are scored
+    via the server's MicroBatcher and /ping can be used as a health check.
+    /steps returns & clears the records of each call to the instrumented
+    steps of the model pipeline, see pop_step_records.
+    """
+
+    def _send_json(self, status: int, content):
+        body = json.dumps(content).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        if self.path == "/ping":
+            self._send_json(200, dict(status="ok"))
+        elif self.path == "/steps":
+            self._send_json(200, pop_step_records(self.server.model_pipeline))
+        else:
+            self._send_json(404, dict(error=f"Unknown path {self.path}"))
+
+    def do_POST(self):
+        start = time.perf_counter()
+        records = 0
+
+        if self.path != "/invocations":
+            status, content = 404, dict(error=f"Unknown path {self.path}")
+
+        else:
+            try:
+                length = int(self.headers.get("Content-Length", 0))
+                df = parse_request(
+                    body=self.rfile.read(length),
+                    content_type=self.headers.get("Content-Type")
+                )
+                records = len(df)
+
+            except Exception as e:
+                status = 400
+                content = dict(error=f"Unable to parse request: {e}")
+
+            else:
+                try:
+                    predictions = self.server.batcher.predict(df)
+                    status, content = 200, predictions.tolist()
+
+                except Exception as e:
+                    status = 500
+                    content = dict(error=f"Unable to score request: {e}")
+
+        self._send_json(status, content)
+        self._log_request(status=status, records=records, start=start)
+
+    def _log_request(self, status: int, records: int, start: float):
+        """
+        Log a single line per request with the fields bound to it, rather
+        than a line per preprocessing step
+        """
+
+        latency_ms = (time.perf_counter() - start) * 1000
+        logger.bind(
+            method=self.command,
+            path=self.path,
+            status=status,
+            records=records,
+            latency_ms=round(latency_ms, 3)
+        ).info(
+            f"{self.command} {self.path} status={status} records={records} "
+            f"latency_ms={latency_ms:.2f}"
+        )
+
+    def log_request(self, code="-", size="-"):
+        # Requests are logged by _log_request
+        pass
+
+    def log_message(self, format, *args):
+        logger.debug(format % args)
+
+
+class ModelServer(ThreadingHTTPServer):
+    """
+    Threaded http server with a listen backlog large enough to accept bursts
+    of concurrent connections, which is what micro-batching relies on.
+    """
+
+    daemon_threads = True
+    request_queue_size = 1024
+
+
+def create_model_server(
+    model_pipeline,
+    host: str,
+    port: int,
+    max_batch_size: int,
+    max_wait_ms: float
+):
+    """
+    Description
+    -----------
+    Create a threaded http server which scores requests to /invocations with
+    the supplied model_pipeline. Concurrent requests are merged into
+    micro-batches by a MicroBatcher so that each batch is scored with a single
+    call of model_pipeline.predict.
+
+    Parameters
+    ----------
+    model_pipeline: sklearn.pipeline.Pipeline
+        The fitted end-to-end model pipeline.
+
+    host: str
+        The host to serve the model on.
+
+    port: int
+        The port to serve the model on.
+
+    max_batch_size: int
+        The maximum number of records to score in a single batch.
+
+    max_wait_ms: float
+        The maximum time to wait for further requests to add to a batch, in
+        milliseconds.
+
+    Returns
+    -------
+    server: ModelServer
+        The server, with the started MicroBatcher attached as server.batcher
+        and the model_pipeline as server.model_pipeline
+
+    Raises
+    ------
+    None
+
+    Examples
+    --------
+    server = create_model_server(
+        model_pipeline=model_pipeline,
+        host="127.0.0.1",
+        port=1235,
+        max_batch_size=256,
+        max_wait_ms=5
+    )
+    server.serve_forever()
+    """
+
+    server = ModelServer((host, port), ModelRequestHandler)
+    server.model_pipeline = model_pipeline
+    server.batcher = MicroBatcher(
+        predict_function=model_pipeline.predict,
+        max_batch_size=max_batch_size,
+        max_wait_ms=max_wait_ms
+    ).start()
+
+    return server
+
+
+def serve_model(
+    models_path: str,
+    host: str,
+    port: int,
+    max_batch_size: int,
+    max_wait_ms: float,
+    backend: str = "sklearn"
+):
+    """
+    Description
+    -----------
+    Load the model pipeline saved by create_model_pipeline from models_path
+    and serve it until interrupted. With the onnx backend the exported
+    model.onnx is served via ONNX Runtime instead.
+
+    Parameters
+    ----------
+    models_path: str
+        The location of the saved MLFlow model pipeline.
+
+    host: str
+        The host to serve the model on.
+
+    port: int
+        The port to serve the model on.
+
+    max_batch_size: int
+        The maximum number of records to score in a single batch.
+
+    max_wait_ms: float
+        The maximum time to wait for further requests to add to a batch, in
+        milliseconds.
+
+    backend: str
+        The backend to score with, sklearn, onnx or polars, see
+        load_scoring_model.
+
+    Returns
+    -------
+    None
+
+    Raises
+    ------
+    Exception: Exception
+        Generic exception for logging
+
+    Examples
+    --------
+    serve_model(
+        models_path="path/to/models/model_name",
+        host="127.0.0.1",
+        port=1235,
+        max_batch_size=256,
+        max_wait_ms=5,
+        backend="onnx"
+    )
+    """
+
+    logger.info("Running serve_model()")
+
+    try:
+        model_pipeline = load_scoring_model(
+            models_path=models_path,
+            backend=backend
+        )
+        server = create_model_server(
+            model_pipeline=model_pipeline,
+            host=host,
+            port=port,
+            max_batch_size=max_batch_size,
+            max_wait_ms=max_wait_ms
+        )
+
+        logger.info(
+            f"Serving {models_path} with {backend} at http://{host}:{port}"
+        )
+
+        try:
+            server.serve_forever()
+
+        except KeyboardInterrupt:
+            logger.info("Stopping the model server")
+
+        finally:
+            server.server_close()
+            server.batcher.stop()
+
+    except Exception:
+        logger.exception("Error running serve_model()")
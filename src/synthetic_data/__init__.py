@@ -0,0 +1,5 @@
+from src.synthetic_data.synthetic_data import SyntheticDataGenerator
+
+__all__ = [
+    "SyntheticDataGenerator"
+]
@@ -0,0 +1,320 @@
+import time
+from loguru import logger
+import numpy as np
+import pandas as pd
+
+
+# The name format of the raw data, e.g. "Braund, Mr. Owen Harris"
+NAME_PATTERN = r'^(?P<surname>[^,]*), (?P<title>[A-Za-z ]+)\. (?P<given>.*)$'
+
+
+def _distribution(values):
+    """
+    The unique values of a series, or rows of a dataframe for a joint
+    distribution, including missing values & their frequency
+    """
+
+    counts = values.value_counts(dropna=False, normalize=True)
+
+    if isinstance(values, pd.core.frame.DataFrame):
+        return counts.index.to_frame(index=False), counts.to_numpy()
+
+    return counts.index.to_numpy(dtype=object), counts.to_numpy()
+
+
+def _sample(rng, distribution: tuple, size: int):
+    """
+    Samples size values from a distribution created by _distribution, or
+    rows of a joint distribution as a dataframe
+    """
+
+    values, probabilities = distribution
+    positions = rng.choice(len(values), size=size, p=probabilities)
+
+    if isinstance(values, pd.core.frame.DataFrame):
+        return values.iloc[positions].reset_index(drop=True)
+
+    return values[positions]
+
+
+def _sample_by_group(rng, distributions: dict, groups: np.ndarray):
+    """Samples a value for each row from the distribution of its group"""
+
+    out = np.empty(len(groups), dtype=object)
+
+    for group, distribution in distributions.items():
+        rows = groups == group
+        out[rows] = _sample(rng, distribution, rows.sum())
+
+    return out
+
+
+class SyntheticDataGenerator:
+    """
+    Description
+    -----------
+    Generates synthetic passengers with the schema of the raw Titanic data
+    in any quantity, for benchmarking the pipeline at scale.
+
+    The generator is fitted to a raw train_test file and learns:
+        * The joint frequency of the Name title, Sex & Pclass of passengers
+        * The ages & missing ages of each title
+        * The joint frequency of SibSp & Parch
+        * The fares of each Pclass and the cabins & missing cabins of each
+          Pclass
+        * The frequency of each Embarked port, including missing ports, and
+          of the tickets, surnames and given names
+        * The survival rate of each Sex & Pclass, if the target is present
+
+    Passengers are sampled from these distributions so the generated data has
+    the same values, missing values & title patterns as the data it was
+    fitted to, with each record drawn independently.
+
+    Parameters
+    ----------
+    uid: str
+        The unique identifier column, which is numbered from 1.
+
+    target: str
+        The target column, which is generated when the fitted data has it.
+
+    random_state: int
+        Seed for the random number generator.
+
+    Attributes
+    ----------
+    columns_: list
+        The columns of the fitted data, in order
+
+    distributions_: dict
+        The distributions learned from the fitted data
+
+    Examples
+    --------
+    generator = SyntheticDataGenerator(uid="PassengerId", target="Survived")
+    generator.fit(pd.read_csv("path/to/train_test_raw.csv"))
+    df = generator.sample(n_records=1000000)
+    """
+
+    def __init__(
+        self,
+        uid: str = "PassengerId",
+        target: str = "Survived",
+        random_state: int = None
+    ):
+        self.uid = uid
+        self.target = target
+        self.random_state = random_state
+
+    def fit(self, df: pd.core.frame.DataFrame):
+        """Learn the distributions of the raw data"""
+
+        logger.info("Running SyntheticDataGenerator.fit()")
+
+        names = df["Name"].str.extract(NAME_PATTERN)
+        titles = names["title"].fillna("")
+        profiles = pd.DataFrame(dict(
+            title=titles,
+            Sex=df["Sex"],
+            Pclass=df["Pclass"]
+        ))
+
+        self.columns_ = df.columns.tolist()
+        self.distributions_ = dict(
+            profile=_distribution(profiles),
+            age={
+                title: _distribution(ages)
+                for title, ages in df["Age"].groupby(titles)
+            },
+            family=_distribution(df[["SibSp", "Parch"]]),
+            fare={
+                pclass: _distribution(fares)
+                for pclass, fares in df["Fare"].groupby(df["Pclass"])
+            },
+            cabin={
+                pclass: _distribution(cabins)
+                for pclass, cabins in df["Cabin"].groupby(df["Pclass"])
+            },
+            embarked=_distribution(df["Embarked"]),
+            ticket=_distribution(df["Ticket"]),
+            surname=_distribution(names["surname"].dropna()),
+            given=_distribution(names["given"].dropna())
+        )
+
+        # Store the survival rate of each Sex & Pclass with the profiles so
+        # it's sampled with them
+        if self.target in df.columns:
+            profile_values, _ = self.distributions_["profile"]
+            profile_values["survival_rate"] = (
+                profile_values[["Sex", "Pclass"]]
+                .merge(
+                    df.groupby(["Sex", "Pclass"], as_index=False)[self.target]
+                    .mean(),
+                    how="left"
+                )[self.target]
+                .to_numpy()
+            )
+
+        self.rng_ = np.random.default_rng(self.random_state)
+
+        return self
+
+    def sample(self, n_records: int, start_id: int = 1):
+        """
+        Description
+        -----------
+        Generates a dataframe of synthetic passengers with the columns of the
+        fitted data.
+
+        Parameters
+        ----------
+        n_records: int
+            The number of passengers to generate.
+
+        start_id: int
+            The uid of the first passenger, following passengers are numbered
+            consecutively.
+
+        Returns
+        -------
+        df_out: pd.core.frame.DataFrame
+            The synthetic passengers
+
+        Raises
+        ------
+        None
+
+        Examples
+        --------
+        df = generator.sample(n_records=1000, start_id=1001)
+        """
+
+        rng = self.rng_
+        distributions = self.distributions_
+
+        profile = _sample(rng, distributions["profile"], n_records)
+        title = profile["title"].to_numpy()
+        pclass = profile["Pclass"].to_numpy()
+        family = _sample(rng, distributions["family"], n_records)
+
+        # Build the names from the sampled titles, e.g. "Braund, Mr. Owen"
+        name = (
+            pd.Series(_sample(rng, distributions["surname"], n_records))
+            + ", " + title + ". "
+            + _sample(rng, distributions["given"], n_records)
+        )
+
+        columns = {
+            self.uid: np.arange(start_id, start_id + n_records),
+            "Pclass": pclass,
+            "Name": name.to_numpy(),
+            "Sex": profile["Sex"].to_numpy(),
+            "Age": _sample_by_group(
+                rng,
+                distributions["age"],
+                title
+            ).astype(float),
+            "SibSp": family["SibSp"].to_numpy(),
+            "Parch": family["Parch"].to_numpy(),
+            "Ticket": _sample(rng, distributions["ticket"], n_records),
+            "Fare": _sample_by_group(
+                rng,
+                distributions["fare"],
+                pclass
+            ).astype(float),
+            "Cabin": _sample_by_group(rng, distributions["cabin"], pclass),
+            "Embarked": _sample(rng, distributions["embarked"], n_records)
+        }
+
+        if "survival_rate" in profile.columns:
+            columns[self.target] = (
+                rng.random(n_records) < profile["survival_rate"].to_numpy()
+            ).astype(int)
+
+        return pd.DataFrame(columns)[self.columns_]
+
+    def write_csv(
+        self,
+        path: str,
+        n_records: int,
+        chunk_size: int = 100000,
+        include_target: bool = True
+    ):
+        """
+        Description
+        -----------
+        Writes n_records synthetic passengers to a csv file in chunks of
+        chunk_size, so files larger than memory can be created.
+
+        Parameters
+        ----------
+        path: str
+            Location of the csv file to write.
+
+        n_records: int
+            The number of passengers to generate.
+
+        chunk_size: int
+            The number of passengers to generate & write at a time.
+
+        include_target: bool
+            Include the target column, e.g. False for holdout data.
+
+        Returns
+        -------
+        results: dict
+            The number of records written, the seconds taken and the records
+            written per second
+
+        Raises
+        ------
+        Exception: Exception
+            Generic exception for logging
+
+        Examples
+        --------
+        results = generator.write_csv(
+            path="path/to/train_test_raw.csv",
+            n_records=1000000,
+            chunk_size=100000
+        )
+        """
+
+        logger.info("Running SyntheticDataGenerator.write_csv()")
+
+        try:
+            start = time.perf_counter()
+
+            for start_id in range(1, n_records + 1, chunk_size):
+                df_chunk = self.sample(
+                    n_records=min(chunk_size, n_records + 1 - start_id),
+                    start_id=start_id
+                )
+                if not include_target:
+                    df_chunk = df_chunk.drop(
+                        self.target,
+                        axis=1,
+                        errors="ignore"
+                    )
+
+                df_chunk.to_csv(
+                    path,
+                    mode="w" if start_id == 1 else "a",
+                    header=start_id == 1,
+                    index=False
+                )
+
+            seconds = time.perf_counter() - start
+            logger.info(
+                f"Wrote {n_records} synthetic records to {path} in "
+                f"{seconds:.2f}s"
+            )
+
+            return dict(
+                records=n_records,
+                seconds=seconds,
+                records_per_second=n_records / seconds
+            )
+
+        except Exception:
+            logger.exception("Error running SyntheticDataGenerator.write_csv()")
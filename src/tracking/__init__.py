@@ -0,0 +1,23 @@
+from src.tracking.tracking import (
+    BatchLogger,
+    log_param,
+    log_params,
+    log_metric,
+    log_metrics,
+    set_tag,
+    log_artifact,
+    flush,
+    start_run
+)
+
+__all__ = [
+    "BatchLogger",
+    "log_param",
+    "log_params",
+    "log_metric",
+    "log_metrics",
+    "set_tag",
+    "log_artifact",
+    "flush",
+    "start_run"
+]
@@ -0,0 +1,418 @@
+import time
+import queue
+import atexit
+import threading
+from contextlib import contextmanager
+from loguru import logger
+
+
+# The maximum number of each entity MLFlow accepts in a single log_batch call
+MAX_BATCH_METRICS = 1000
+MAX_BATCH_PARAMS = 100
+MAX_BATCH_TAGS = 100
+
+
+class _Batch:
+    """The params, metrics & tags waiting to be written to a single run"""
+
+    def __init__(self):
+        self.metrics = []
+        self.params = {}
+        self.tags = {}
+
+    def __len__(self):
+        return len(self.metrics) + len(self.params) + len(self.tags)
+
+    def chunks(self):
+        """Yields the batch in chunks small enough for a log_batch call"""
+
+        metrics = self.metrics
+        params = list(self.params.values())
+        tags = list(self.tags.values())
+
+        while metrics or params or tags:
+            yield (
+                metrics[:MAX_BATCH_METRICS],
+                params[:MAX_BATCH_PARAMS],
+                tags[:MAX_BATCH_TAGS]
+            )
+            metrics = metrics[MAX_BATCH_METRICS:]
+            params = params[MAX_BATCH_PARAMS:]
+            tags = tags[MAX_BATCH_TAGS:]
+
+
+class BatchLogger:
+    """
+    Description
+    -----------
+    Drop in replacement for the mlflow log_param, log_metric, set_tag and
+    log_artifact functions which returns immediately rather than waiting for
+    the tracking store. The calls are queued along with the active run and
+    written by a background thread, which merges the params, metrics and tags
+    of each run into as few MlflowClient.log_batch calls as possible.
+
+    Params which have already been logged to a run with the same value are
+    dropped, and logging a different value for a param raises an
+    MlflowException to the caller as mlflow.log_param does. If a log_batch
+    call is still rejected by the tracking store, e.g. for a param logged
+    outside the BatchLogger, its metrics & tags and each param are written
+    again separately so only the rejected entities are lost. The queue is
+    flushed when a run started via start_run ends and
+    when the interpreter exits, at which point the time spent writing to the
+    tracking store on the background thread is logged.
+
+    Parameters
+    ----------
+    flush_interval: float
+        The maximum number of seconds to wait for further calls before
+        writing the queued calls.
+
+    Examples
+    --------
+    batch_logger = BatchLogger()
+    with batch_logger.start_run():
+        batch_logger.log_param("C", 0.5)
+        batch_logger.log_metric("test_score", 80.0)
+    """
+
+    def __init__(self, flush_interval: float = 1.0):
+        self.flush_interval = flush_interval
+        self._queue = queue.Queue()
+        self._thread = None
+        self._lock = threading.Lock()
+        self._logged_params = {}
+        self._queued_params = {}
+        self._reset_stats()
+
+    def _reset_stats(self):
+        self.stats = dict(
+            calls=0,
+            batches=0,
+            artifacts=0,
+            duplicate_params=0,
+            rejected=0,
+            caller_seconds=0.0,
+            writer_seconds=0.0
+        )
+
+    def _start(self):
+        """Start the background thread if it isn't running"""
+
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(
+                    target=self._run,
+                    name="BatchLogger",
+                    daemon=True
+                )
+                self._thread.start()
+
+    def _check_param(self, run_id: str, key: str, value):
+        """
+        Raises an MlflowException if a different value has been logged for a
+        param of a run, as mlflow.log_param does, so the caller sees the error
+        rather than it being raised on the background thread
+        """
+
+        from mlflow.exceptions import MlflowException
+        from mlflow.protos.databricks_pb2 import INVALID_PARAMETER_VALUE
+
+        value = str(value)
+        with self._lock:
+            params = self._queued_params.setdefault(run_id, {})
+            if params.get(key, value) != value:
+                raise MlflowException(
+                    f"Changing param values is not allowed. Param with key="
+                    f"'{key}' was already logged with value='{params[key]}' "
+                    f"for run ID='{run_id}'. Attempted logging new value "
+                    f"'{value}'.",
+                    error_code=INVALID_PARAMETER_VALUE
+                )
+            params[key] = value
+
+    def _put(self, kind: str, run_id: str, *args):
+        """Queue a call against the supplied or active run"""
+
+        # mlflow is imported on first use so importing the preprocessing
+        # steps to score a model doesn't import it
+        import mlflow
+
+        start = time.perf_counter()
+        if run_id is None:
+            # Start a run if there isn't one, as the mlflow functions do
+            run_id = (mlflow.active_run() or mlflow.start_run()).info.run_id
+        if kind == "param":
+            self._check_param(run_id, *args)
+        self._start()
+        self._queue.put((kind, mlflow.get_tracking_uri(), run_id, args))
+        self.stats["calls"] += 1
+        self.stats["caller_seconds"] += time.perf_counter() - start
+
+    def log_param(self, key: str, value, run_id: str = None):
+        """Queue a param to be logged to the active run"""
+
+        self._put("param", run_id, key, value)
+
+    def log_params(self, params: dict, run_id: str = None):
+        """Queue a dictionary of params to be logged to the active run"""
+
+        for key, value in params.items():
+            self.log_param(key, value, run_id=run_id)
+
+    def log_metric(
+        self,
+        key: str,
+        value: float,
+        step: int = None,
+        run_id: str = None
+    ):
+        """Queue a metric to be logged to the active run"""
+
+        self._put(
+            "metric",
+            run_id,
+            key,
+            value,
+            int(time.time() * 1000),
+            step or 0
+        )
+
+    def log_metrics(self, metrics: dict, step: int = None, run_id: str = None):
+        """Queue a dictionary of metrics to be logged to the active run"""
+
+        for key, value in metrics.items():
+            self.log_metric(key, value, step=step, run_id=run_id)
+
+    def set_tag(self, key: str, value, run_id: str = None):
+        """Queue a tag to be set on the active run"""
+
+        self._put("tag", run_id, key, value)
+
+    def log_artifact(
+        self,
+        local_path: str,
+        artifact_path: str = None,
+        run_id: str = None
+    ):
+        """Queue a file or directory to be logged as an artifact"""
+
+        self._put("artifact", run_id, local_path, artifact_path)
+
+    def flush(self):
+        """Block until every queued call has been written"""
+
+        if self._thread is not None and self._thread.is_alive():
+            done = threading.Event()
+            self._queue.put(("flush", None, None, (done,)))
+            done.wait()
+
+    @contextmanager
+    def start_run(self, *args, **kwargs):
+        """
+        Start an MLFlow run via mlflow.start_run, which accepts the same
+        arguments, and flush the queued calls when the run ends. Nested runs
+        are flushed with their parent.
+        """
+
+        import mlflow
+
+        with mlflow.start_run(*args, **kwargs) as run:
+            try:
+                yield run
+
+            finally:
+                if not kwargs.get("nested", False):
+                    self.flush()
+                    self.report()
+
+    def report(self):
+        """
+        Log the number of calls made and the time spent writing them since
+        the last report
+        """
+
+        stats = self.stats
+        logger.info(
+            f"BatchLogger wrote {stats['calls']} calls in "
+            f"{stats['batches']} batches & {stats['artifacts']} artifact "
+            f"uploads, dropping {stats['duplicate_params']} duplicate params "
+            f"& {stats['rejected']} rejected entities. "
+            f"Queueing took {stats['caller_seconds']:.3f}s, writing took "
+            f"{stats['writer_seconds']:.3f}s on the background thread"
+        )
+        self._reset_stats()
+
+    def _add(self, batches: dict, kind: str, tracking_uri: str, run_id, args):
+        """Add a param, metric or tag call to the batch of its run"""
+
+        from mlflow.entities import (
+            Metric,
+            Param,
+            RunTag
+        )
+
+        batch = batches.setdefault((tracking_uri, run_id), _Batch())
+
+        if kind == "param":
+            key, value = args
+            value = str(value)
+            logged_value = self._logged_params.get(run_id, {}).get(key)
+            batched = batch.params.get(key)
+
+            if value == logged_value or (batched and batched.value == value):
+                self.stats["duplicate_params"] += 1
+                return
+
+            # Changed params are raised to the caller by _check_param, so
+            # only keep the first value if one gets here
+            if logged_value is not None or batched is not None:
+                logger.error(
+                    f"Dropping changed param {key}={value} of run {run_id}"
+                )
+                self.stats["rejected"] += 1
+                return
+
+            batch.params[key] = Param(key, value)
+
+        elif kind == "metric":
+            key, value, timestamp, step = args
+            batch.metrics.append(Metric(key, value, timestamp, step))
+
+        elif kind == "tag":
+            key, value = args
+            batch.tags[key] = RunTag(key, str(value))
+
+    def _log_batch(self, client, run_id: str, metrics, params, tags):
+        """Write a log_batch call, recording the params logged to the run"""
+
+        start = time.perf_counter()
+        try:
+            client.log_batch(
+                run_id=run_id,
+                metrics=metrics,
+                params=params,
+                tags=tags
+            )
+            self.stats["batches"] += 1
+            for param in params:
+                self._logged_params.setdefault(run_id, {})[
+                    param.key
+                ] = param.value
+
+        finally:
+            self.stats["writer_seconds"] += time.perf_counter() - start
+
+    def _write(self, batches: dict):
+        """
+        Write the batched params, metrics & tags with log_batch. A rejected
+        batch is written again as its metrics & tags and each of its params,
+        so only the entities the tracking store rejects are dropped.
+        """
+
+        from mlflow.tracking import MlflowClient
+
+        for (tracking_uri, run_id), batch in batches.items():
+            client = MlflowClient(tracking_uri=tracking_uri)
+
+            for metrics, params, tags in batch.chunks():
+                try:
+                    self._log_batch(client, run_id, metrics, params, tags)
+                    continue
+
+                except Exception:
+                    logger.warning(
+                        f"Batch rejected by run {run_id}, writing its "
+                        f"metrics, tags & params separately"
+                    )
+
+                retries = [(metrics, [], tags)] + [
+                    ([], [param], []) for param in params
+                ]
+                for retry in retries:
+                    if not any(retry):
+                        continue
+
+                    try:
+                        self._log_batch(client, run_id, *retry)
+
+                    except Exception:
+                        logger.exception(
+                            f"Error logging batch to run {run_id}"
+                        )
+                        self.stats["rejected"] += sum(map(len, retry))
+
+        batches.clear()
+
+    def _write_artifact(self, tracking_uri: str, run_id: str, args: tuple):
+        """Log an artifact, writing it in order with the other calls"""
+
+        from mlflow.tracking import MlflowClient
+
+        local_path, artifact_path = args
+        start = time.perf_counter()
+
+        try:
+            MlflowClient(tracking_uri=tracking_uri).log_artifact(
+                run_id=run_id,
+                local_path=local_path,
+                artifact_path=artifact_path
+            )
+            self.stats["artifacts"] += 1
+
+        except Exception:
+            logger.exception(f"Error logging artifact {local_path}")
+
+        finally:
+            self.stats["writer_seconds"] += time.perf_counter() - start
+
+    def _run(self):
+        """Background loop which batches queued calls & writes them"""
+
+        batches = {}
+        deadline = None
+
+        while True:
+            # Wait at most flush_interval after the first batched call
+            try:
+                kind, tracking_uri, run_id, args = self._queue.get(
+                    timeout=(
+                        None if deadline is None
+                        else max(deadline - time.monotonic(), 0)
+                    )
+                )
+
+            except queue.Empty:
+                kind = "write"
+
+            if kind in ("param", "metric", "tag"):
+                self._add(batches, kind, tracking_uri, run_id, args)
+                if deadline is None:
+                    deadline = time.monotonic() + self.flush_interval
+                if sum(len(batch) for batch in batches.values()) < (
+                    MAX_BATCH_METRICS
+                ):
+                    continue
+
+            # Write the batches before any artifact or flush so the calls are
+            # written in order
+            self._write(batches)
+            deadline = None
+
+            if kind == "artifact":
+                self._write_artifact(tracking_uri, run_id, args)
+
+            elif kind == "flush":
+                args[0].set()
+
+
+_batch_logger = BatchLogger()
+atexit.register(_batch_logger.flush)
+
+log_param = _batch_logger.log_param
+log_params = _batch_logger.log_params
+log_metric = _batch_logger.log_metric
+log_metrics = _batch_logger.log_metrics
+set_tag = _batch_logger.set_tag
+log_artifact = _batch_logger.log_artifact
+flush = _batch_logger.flush
+start_run = _batch_logger.start_run
@@ -1,11 +1,15 @@
 from src.utils.utils import (
     load_config,
     load_logger,
-    load_parameters
+    load_parameters,
+    time_stage,
+    lazy_imports
 )
 
 __all__ = [
     "load_config",
     "load_logger",
-    "load_parameters"
+    "load_parameters",
+    "time_stage",
+    "lazy_imports"
 ]
\ No newline at end of file
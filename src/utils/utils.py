@@ -1,5 +1,11 @@
 import os
 import sys
+import time
+import random
+import importlib
+from contextlib import contextmanager
+from datetime import datetime
+from functools import partialmethod
 from dotenv import load_dotenv
 from loguru import logger
 import yaml
@@ -55,7 +61,89 @@ def load_config(env_path):
         logger.exception(e)
 
 
-now = datetime.now().strftime("%Y-%m-%d %H%M%S")
+def _sample_filter(sample_rate: float):
+    """
+    A loguru filter which passes every message at INFO or above and
+    sample_rate of the DEBUG & TRACE messages, which hot paths such as the
+    transforms log on every call
+    """
+
+    if sample_rate >= 1:
+        return None
+
+    def sample(record):
+        return record["level"].no >= 20 or random.random() < sample_rate
+
+    return sample
+
+
+def load_logger(
+    app_name,
+    logs_path,
+    logs_level="INFO",
+    enqueue=False,
+    diagnose=True,
+    sample_rate=1.0,
+    serialize=False
+):
+    """
+    Description
+    -----------
+    Creates a loguru logger which outputs logs to both a log file in the
+    supplied logs_path and to the console.
+
+    The preprocessing steps log at DEBUG level on every call, so they cost
+    next to nothing at the default INFO level. When they're output the
+    sample_rate can be used to output only a fraction of them, and enqueue
+    moves writing the logs to a background thread so logging doesn't block,
+    e.g. while serving requests.
+
+    Parameters
+    ----------
+    app_name: str
+        The name of the application, used to name the log file.
+
+    logs_path: str
+        The directory in which to save the log file.
+
+    logs_level: str
+        The minimum level of the logs to output.
+
+    enqueue: bool
+        Write the logs from a background thread rather than in the calling
+        thread.
+
+    diagnose: bool
+        Include the values of variables in the tracebacks of exceptions.
+
+    sample_rate: float
+        The fraction of DEBUG & TRACE messages to output, messages at INFO
+        or above are always output.
+
+    serialize: bool
+        Write the log file as json lines, including the fields bound to each
+        message, e.g. of the per-request logs of the model server.
+
+    Returns
+    -------
+    logger: loguru._logger.Logger
+        The configured logger
+
+    Raises
+    ------
+    None
+
+    Examples
+    --------
+    logger = load_logger(
+        app_name="app_name",
+        logs_path="path/to/logs",
+        enqueue=True,
+        sample_rate=0.01
+    )
+    """
+
+    now = datetime.now().strftime("%Y-%m-%d %H%M%S")
     filename = f"{logs_path}/{app_name} {now}.log"
     
     # Remove default handler
@@ -65,20 +153,25 @@ now = datetime.now().strftime("%Y-%m-%d %H%M%S")
     logger.add(
         sink=filename,
         backtrace=False,
-        diagnose=True,
+        diagnose=diagnose,
         catch=False,
         colorize=False,
-        level=logs_level
+        level=logs_level,
+        enqueue=enqueue,
+        filter=_sample_filter(sample_rate),
+        serialize=serialize
     )
     
     # Add console output (with colour!)
     logger.add(
         sink=sys.stdout,
         backtrace=False,
-        diagnose=True,
+        diagnose=diagnose,
         catch=False,
         colorize=True,
-        level=logs_level
+        level=logs_level,
+        enqueue=enqueue,
+        filter=_sample_filter(sample_rate)
     )
 
     try: 
@@ -91,6 +184,8 @@ now = datetime.now().strftime("%Y-%m-%d %H%M%S")
     except TypeError:
         print("Additional logging levels already added")
 
+    return logger
+
 
 def load_parameters(parameters_path):
     """
@@ -130,3 +225,101 @@ def load_parameters(parameters_path):
 
             # Raise exception if the .yaml file can't be parsed
             logger.exception("Error in load_parameters()")
+
+
+@contextmanager
+def time_stage(stage: str, timings: dict):
+    """
+    Description
+    -----------
+    Context manager which times the code run within it, logs the time taken
+    and records it in the supplied timings dictionary under stage.
+
+    Parameters
+    ----------
+    stage: str
+        The name of the stage being timed.
+
+    timings: dict
+        Dictionary to record the time taken in seconds in.
+
+    Returns
+    -------
+    None
+
+    Raises
+    ------
+    None
+
+    Examples
+    --------
+    timings = dict()
+    with time_stage("fit_model", timings):
+        model.fit(X, y)
+    """
+
+    start = time.perf_counter()
+
+    try:
+        yield
+
+    finally:
+        timings[stage] = time.perf_counter() - start
+        logger.info(f"{stage} took {timings[stage]:.2f}s")
+
+
+def lazy_imports(package: str, imports: dict):
+    """
+    Description
+    -----------
+    Creates the module __getattr__ & __dir__ functions of a package, see PEP
+    562, which import each of the names it exports from its module when it's
+    first used rather than when the package is imported. This keeps the
+    training dependencies, e.g. mlflow & matplotlib, out of processes which
+    only score a model.
+
+    Parameters
+    ----------
+    package: str
+        The name of the package, i.e. __name__.
+
+    imports: dict
+        The module to import each exported name from.
+
+    Returns
+    -------
+    __getattr__: function
+        Imports & caches an exported name on first use
+
+    __dir__: function
+        Lists the attributes of the package including the exported names
+
+    Raises
+    ------
+    None
+
+    Examples
+    --------
+    __getattr__, __dir__ = lazy_imports(
+        package=__name__,
+        imports=dict(evaluate_model="src.model_pipeline.evaluate")
+    )
+    """
+
+    namespace = sys.modules[package].__dict__
+
+    def __getattr__(name: str):
+        if name not in imports:
+            raise AttributeError(
+                f"module {package!r} has no attribute {name!r}"
+            )
+
+        value = getattr(importlib.import_module(imports[name]), name)
+        namespace[name] = value
+
+        return value
+
+    def __dir__():
+        return sorted(set(namespace) | set(imports))
+
+    return __getattr__, __dir__
@@ -0,0 +1,97 @@
+import mlflow
+import pytest
+from mlflow.exceptions import MlflowException
+from src.utils import load_config
+from src.tracking import BatchLogger
+
+
+def test_batch_logger(tmp_path):
+    """Test the BatchLogger class"""
+
+    # Load in the test configuration
+    config = load_config(".env.test")
+
+    # Configure MLFlow
+    mlflow.set_tracking_uri(config["mlflow_tracking_uri"])
+    mlflow.set_experiment(config["mlflow_experiment"])
+
+    artifact = tmp_path / "artifact.txt"
+    artifact.write_text("artifact")
+    batch_logger = BatchLogger()
+
+    # Run the function
+    with batch_logger.start_run() as run:
+        batch_logger.log_param("C", 0.5)
+        batch_logger.log_param("C", 0.5)
+        batch_logger.log_params(dict(solver="lbfgs", max_iter=100))
+        for step in range(3):
+            batch_logger.log_metric("loss", 1 / (step + 1), step=step)
+        batch_logger.log_metrics(dict(train_score=80.0, test_score=75.0))
+        batch_logger.set_tag("feature_cache", "miss")
+        batch_logger.set_tag("feature_cache", "hit")
+        batch_logger.log_artifact(str(artifact))
+
+        with batch_logger.start_run(nested=True) as nested_run:
+            batch_logger.log_metric("nested_score", 1.0)
+
+        batch_logger.flush()
+        stats = dict(batch_logger.stats)
+
+    # Run the tests
+    data = mlflow.get_run(run.info.run_id).data
+    client = mlflow.tracking.MlflowClient()
+    loss_history = client.get_metric_history(run.info.run_id, "loss")
+    artifacts = client.list_artifacts(run.info.run_id)
+    nested_data = mlflow.get_run(nested_run.info.run_id).data
+
+    assert data.params == dict(C="0.5", solver="lbfgs", max_iter="100")
+    assert data.metrics["train_score"] == 80.0
+    assert data.metrics["test_score"] == 75.0
+    assert data.tags["feature_cache"] == "hit"
+    assert [metric.step for metric in loss_history] == [0, 1, 2]
+    assert [artifact.path for artifact in artifacts] == ["artifact.txt"]
+    assert nested_data.metrics == dict(nested_score=1.0)
+    assert stats["calls"] == 13
+    assert stats["duplicate_params"] == 1
+
+
+def test_batch_logger_changed_param():
+    """Test changed params are raised & don't drop the rest of the batch"""
+
+    # Load in the test configuration
+    config = load_config(".env.test")
+
+    # Configure MLFlow
+    mlflow.set_tracking_uri(config["mlflow_tracking_uri"])
+    mlflow.set_experiment(config["mlflow_experiment"])
+
+    batch_logger = BatchLogger()
+
+    # Run the function
+    with batch_logger.start_run() as run:
+        batch_logger.log_param("random_state", 0)
+        batch_logger.flush()
+
+        # A changed param is raised to the caller as by mlflow.log_param
+        with pytest.raises(MlflowException):
+            batch_logger.log_param("random_state", 43)
+        batch_logger.log_metric("train_score", 80.0)
+
+        # A param logged outside the BatchLogger is rejected by the tracking
+        # store, which only drops that param from the batch
+        mlflow.log_param("C", 1.0)
+        batch_logger.log_param("C", 0.5)
+        batch_logger.log_param("solver", "lbfgs")
+        batch_logger.log_metric("test_score", 75.0)
+        batch_logger.set_tag("feature_cache", "hit")
+
+        batch_logger.flush()
+        stats = dict(batch_logger.stats)
+
+    # Run the tests
+    data = mlflow.get_run(run.info.run_id).data
+
+    assert data.params == dict(random_state="0", C="1.0", solver="lbfgs")
+    assert data.metrics == dict(train_score=80.0, test_score=75.0)
+    assert data.tags["feature_cache"] == "hit"
+    assert stats["rejected"] == 1
@@ -0,0 +1,58 @@
+import pandas as pd
+from benchmarks.harness import (
+    BENCHMARKS,
+    time_callable,
+    run_benchmarks,
+    save_results,
+    load_results,
+    compare_results
+)
+import benchmarks.suite  # noqa: F401 registers the benchmarks
+
+
+def test_benchmark_harness(tmp_path):
+    """Test the benchmark harness & suite"""
+
+    # Run the functions
+    calls = []
+    stats = time_callable(lambda: calls.append(1), repeat=3)
+
+    results = run_benchmarks(
+        sizes=[100, 1000],
+        tmp_path=str(tmp_path),
+        select="vectorized",
+        repeat=2
+    )
+    path = str(tmp_path / "results.json")
+    document = save_results(results=results, path=path)
+    loaded = load_results(path)
+
+    # Run the tests
+    assert len(calls) == 1 + 3 * stats["number"]
+    assert stats["min"] <= stats["median"]
+
+    assert "transforms.create_family_size" in BENCHMARKS
+    assert "model_pipeline.evaluate_model" in BENCHMARKS
+    assert len(results) == 3 * 2
+    assert all(result["median"] > 0 for result in results)
+    assert document["commit"] is not None
+    assert loaded.loc[
+        ("vectorized_transforms.impute_age_vectorized", 1000), "median"
+    ] > 0
+
+    # Benchmarks over the threshold slower than the baseline are regressions
+    baseline = pd.DataFrame(
+        dict(median=[1.0, 1.0, 1.0]),
+        index=pd.MultiIndex.from_tuples(
+            [("a", 10), ("b", 10), ("c", 10)],
+            names=["name", "n_records"]
+        )
+    )
+    current = baseline.assign(median=[1.1, 1.5, 0.5])
+    comparison = compare_results(baseline, current, threshold=0.2)
+
+    assert comparison["change"].tolist() == [
+        "-",
+        "regression",
+        "improvement"
+    ]
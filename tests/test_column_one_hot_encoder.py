@@ -0,0 +1,61 @@
+import pytest
+import pandas as pd
+from src.preprocessing_pipeline import ColumnOneHotEncoder
+
+
+def test_column_one_hot_encoder():
+    """
+    Test the ColumnOneHotEncoder estimator.
+
+    Note that this test is executed using generic data as it would:
+        1. Require a lot of pre-processing to test with the contextual test
+        data.
+        2. The test can ship alongside the function when implemented in
+        other projects.
+    """
+
+    # Create the data
+    data = [
+        dict(id=1, col1="foo", col2="wibble"),
+        dict(id=2, col1="foo", col2="wibble"),
+        dict(id=3, col1="bar", col2="wubble"),
+        dict(id=4, col1="bar", col2="wibble"),
+        dict(id=5, col1="bar", col2="wubble"),
+    ]
+    df = pd.DataFrame(data).set_index("id", drop=True)
+
+    # Set the parameters
+    one_hot_columns = [
+        dict(
+            col_name="col1",
+            categories=["foo", "bar"]
+        ),
+        dict(
+            col_name="col2",
+            categories=["wibble", "wubble"]
+        )
+    ]
+
+    # Run the estimator
+    encoder = ColumnOneHotEncoder(uid="id", one_hot_columns=one_hot_columns)
+    df_out = encoder.fit_transform(df)
+    df_single_out = encoder.transform(df.loc[[3]])
+
+    # Run the tests
+    assert df_out.columns.tolist() == [
+        "col1_foo", "col1_bar", "col2_wibble", "col2_wubble"
+    ]
+    assert df_out.index.tolist() == [1, 2, 3, 4, 5]
+    assert df_out["col1_foo"].tolist() == [1, 1, 0, 0, 0]
+    assert df_out["col1_bar"].tolist() == [0, 0, 1, 1, 1]
+    assert df_out["col2_wibble"].tolist() == [1, 1, 0, 1, 0]
+    assert df_out["col2_wubble"].tolist() == [0, 0, 1, 0, 1]
+
+    # A single record is encoded with every category
+    assert df_single_out.columns.tolist() == df_out.columns.tolist()
+    assert df_single_out.loc[3].tolist() == [0, 1, 0, 1]
+
+    # Unknown categories raise the ValueError rather than returning None
+    df_unknown = df.loc[[3]].assign(col1="baz")
+    with pytest.raises(ValueError, match="unknown categories"):
+        encoder.transform(df_unknown)
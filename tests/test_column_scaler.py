@@ -0,0 +1,48 @@
+import pandas as pd
+from src.preprocessing_pipeline import ColumnScaler
+
+
+def test_column_scaler():
+    """
+    Test the ColumnScaler estimator.
+
+    Note that this test is executed using generic data as it would:
+        1. Require a lot of pre-processing to test with the contextual test
+        data.
+        2. The test can ship alongside the function when implemented in
+        other projects.
+    """
+
+    train_data = [
+        dict(id=1, value=2, other=1),
+        dict(id=2, value=3, other=1),
+        dict(id=3, value=4, other=1),
+        dict(id=4, value=5, other=1),
+        dict(id=5, value=6, other=1),
+    ]
+    test_data = [
+        dict(id=6, value=4, other=1),
+    ]
+
+    df_train = pd.DataFrame(train_data)
+    df_test = pd.DataFrame(test_data)
+
+    # Run the estimator
+    scaler = ColumnScaler(scale_columns=["value"])
+    df_train_out = scaler.fit_transform(df_train)
+    df_test_out = scaler.transform(df_test)
+
+    # Run the tests
+    assert df_train_out["value"].min() == 0
+    assert df_train_out["value"].max() == 1
+    assert df_train_out["other"].tolist() == [1, 1, 1, 1, 1]
+
+    # A single record is scaled with the minimum & maximum of the train data
+    assert df_test_out["value"].tolist() == [0.5]
+
+    # Fitting chunks of the train data learns the same minimum & maximum
+    chunked_scaler = ColumnScaler(scale_columns=["value"])
+    for start in range(0, len(df_train), 2):
+        chunked_scaler.partial_fit(df_train.iloc[start:start + 2])
+
+    assert chunked_scaler.transform(df_test)["value"].tolist() == [0.5]
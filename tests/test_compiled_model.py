@@ -0,0 +1,96 @@
+import os
+import mlflow
+import numpy as np
+import pandas as pd
+from pandas.testing import assert_frame_equal
+from sklearn.pipeline import Pipeline
+from src.utils import (
+    load_config,
+    load_parameters,
+)
+from src.ingest_split import ingest_split
+from src.preprocessing_pipeline import create_preprocessing_pipeline
+from src.models import create_logreg_model
+from src.serving import (
+    compile_model_pipeline,
+    CompiledModel
+)
+
+
+def test_compiled_model():
+    """Test the compile_model_pipeline function & CompiledModel class"""
+
+    # Load in the test configuration & parameters
+    config = load_config(".env.test")
+    parameters = load_parameters(parameters_path=config["parameters_path"])
+
+    # Configure MLFlow
+    mlflow.set_tracking_uri(config["mlflow_tracking_uri"])
+    mlflow.set_experiment(config["mlflow_experiment"])
+
+    # Start MLFlow Tracking
+    with mlflow.start_run():
+
+        # Ingest the data
+        X_train, X_test, y_train, y_test, X_holdout = ingest_split(
+            train_test_raw_path=config["train_test_raw_path"],
+            holdout_raw_path=config["holdout_raw_path"],
+            target=parameters["target"],
+            ingest_split_parameters=parameters["ingest_split_parameters"]
+        )
+
+        # Create & fit the model pipeline
+        preprocessing_pipeline = create_preprocessing_pipeline(
+            pipeline_parameters=parameters["pipeline_parameters"]
+        )
+        model, model_name, cv = create_logreg_model(
+            logreg_hyperparameters=parameters["logreg_hyperparameters"]
+        )
+        model_pipeline = Pipeline(
+            preprocessing_pipeline.steps + [("Model", model)]
+        )
+        model_pipeline.fit(X_train, y_train.values.ravel())
+
+        mlflow.end_run()
+
+    # Run the function
+    compiled_model = compile_model_pipeline(model_pipeline=model_pipeline)
+    records = X_holdout.to_dict(orient="records")
+
+    # Run the tests
+    assert np.allclose(
+        [compiled_model.predict_proba_record(record) for record in records],
+        model_pipeline.predict_proba(X_holdout)[:, 1]
+    )
+    assert (
+        compiled_model.predict(X_holdout).tolist()
+        == model_pipeline.predict(X_holdout).tolist()
+    )
+
+    # Out of range values give extreme scores, which don't overflow
+    X_extreme = X_holdout.head(2).copy()
+    X_extreme["Age"] = [1e6, -1e6]
+    assert np.allclose(
+        [
+            compiled_model.predict_proba_record(record)
+            for record in X_extreme.to_dict(orient="records")
+        ],
+        model_pipeline.predict_proba(X_extreme)[:, 1]
+    )
+
+    # Records aren't modified by scoring
+    assert_frame_equal(
+        pd.DataFrame(records).astype(X_holdout.dtypes.to_dict()),
+        X_holdout.reset_index(drop=True)
+    )
+
+    # Save & load the compiled model
+    path = f"{config['models_path']}/compiled_model.json"
+    compiled_model.save(path)
+    loaded_model = CompiledModel.load(path)
+    os.remove(path)
+
+    assert (
+        loaded_model.predict(records).tolist()
+        == compiled_model.predict(records).tolist()
+    )
@@ -0,0 +1,49 @@
+import mlflow
+import pytest
+import sklearn
+from src.utils import (
+    load_config,
+    load_parameters,
+)
+from src.models import (
+    MODEL_FAMILIES,
+    create_model
+)
+
+
+@pytest.mark.parametrize("model_family, model_class", [
+    ("logreg", sklearn.linear_model.LogisticRegression),
+    ("svc", sklearn.svm.SVC),
+    ("sgd", sklearn.linear_model.SGDClassifier),
+])
+def test_create_model(model_family, model_class):
+    """Test for the create_model function"""
+
+    config = load_config(".env.test")
+    parameters = load_parameters(parameters_path=config["parameters_path"])
+    hyperparameters = parameters[f"{model_family}_hyperparameters"]
+
+    # Configure MLFlow
+    mlflow.set_tracking_uri(config["mlflow_tracking_uri"])
+    mlflow.set_experiment(config["mlflow_experiment"])
+
+    with mlflow.start_run():
+
+        # Run the function
+        model, model_name, cv = create_model(
+            model_family=model_family,
+            hyperparameters=hyperparameters
+        )
+
+    # Run the tests
+    assert model_family in MODEL_FAMILIES
+    assert isinstance(model, model_class)
+    assert model_name == hyperparameters["model_name"]
+    assert cv == hyperparameters["cv"]
+
+
+def test_create_model_unknown_family():
+    """Test create_model raises for an unknown model family"""
+
+    with pytest.raises(ValueError, match="Unknown model_family"):
+        create_model(model_family="forest", hyperparameters=dict())
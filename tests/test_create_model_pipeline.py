@@ -8,7 +8,10 @@ from src.utils import (
     load_parameters,
 )
 from src.ingest_split import ingest_split
-from src.preprocessing_pipeline import create_preprocessing_pipeline
+from src.preprocessing_pipeline import (
+    create_preprocessing_pipeline,
+    InstrumentedStep
+)
 from src.models import create_logreg_model
 from src.model_pipeline import evaluate_model
 from src.model_pipeline import create_model_pipeline
@@ -58,7 +61,8 @@ def test_create_model_pipeline():
 
         # Create the preprocessing pipeline
         preprocessing_pipeline = create_preprocessing_pipeline(
-            pipeline_parameters=parameters["pipeline_parameters"]
+            pipeline_parameters=parameters["pipeline_parameters"],
+            instrument=True
         )
 
         # Create a model with hyperparameters
@@ -89,6 +93,16 @@ def test_create_model_pipeline():
         )
 
         assert isinstance(model_pipeline, sklearn.pipeline.Pipeline)
+
+        # The instrumented steps are kept & the preprocessing pipeline is
+        # left without the model
+        assert all(
+            isinstance(step, InstrumentedStep)
+            for _, step in model_pipeline.steps[:-1]
+        )
+        assert len(model_pipeline.steps) == (
+            len(preprocessing_pipeline.steps) + 1
+        )
         assert isinstance(
             model, sklearn.linear_model._logistic.LogisticRegression
         )
\ No newline at end of file
@@ -0,0 +1,54 @@
+import mlflow
+import sklearn
+from src.utils import load_config
+from src.models import create_sgd_model
+from src.tracking import (
+    flush,
+    log_param
+)
+
+sgd_hyperparameters = dict(
+    model_name="test_sgd",
+    model_type="SGD",
+    loss="log_loss",
+    penalty="l2",
+    alpha=0.0001,
+    learning_rate="optimal",
+    max_iter=5,
+    random_state=43,
+    cv=2
+)
+
+
+def test_create_sgd_model():
+    """Test for the create_sgd_model function"""
+
+    config = load_config(".env.test")
+
+    # Configure MLFlow
+    mlflow.set_tracking_uri(config["mlflow_tracking_uri"])
+    mlflow.set_experiment(config["mlflow_experiment"])
+
+    with mlflow.start_run() as run:
+
+        # The split seed is logged as random_state by ingest_split
+        log_param("random_state", 0)
+
+        # Run the function
+        model, model_name, cv = create_sgd_model(
+            sgd_hyperparameters=sgd_hyperparameters
+        )
+        flush()
+        params = mlflow.get_run(run.info.run_id).data.params
+
+        # Run the tests
+        assert isinstance(model, sklearn.linear_model.SGDClassifier)
+        assert model.loss == "log_loss"
+        assert model_name == "test_sgd"
+        assert cv == 2
+
+        # The model seed doesn't clash with the split seed
+        assert params["random_state"] == "0"
+        assert params["model_random_state"] == "43"
+
+        mlflow.end_run()
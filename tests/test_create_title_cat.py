@@ -36,7 +36,9 @@ def test_create_title_cat():
         dict(id=16, col1="Clegane, Capt. Sandor"),
         dict(id=17, col1="Greyjoy, Countess. Yara"),
         dict(id=18, col1="Giantsbane, Jonkheer. Tormund"),
-        dict(id=19, col1="Tarly, Dona. Samwell")
+        dict(id=19, col1="Tarly, Dona. Samwell"),
+        dict(id=20, col1="Targaeryn, Khaleesi. Danaerys"),
+        dict(id=21, col1="Hodor")
     ]
 
     df = pd.DataFrame(data).set_index("id", drop=True)
@@ -68,3 +70,5 @@ def test_create_title_cat():
     assert df_out["col2"].loc[17] == "other_female"
     assert df_out["col2"].loc[18] == "other_male"
     assert df_out["col2"].loc[19] == "other_female"
+    assert df_out["col2"].loc[20] == "other"
+    assert df_out["col2"].loc[21] == "other"
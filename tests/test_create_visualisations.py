@@ -0,0 +1,97 @@
+import os
+import mlflow
+import matplotlib
+from sklearn.linear_model import LogisticRegression
+from src.utils import (
+    load_config,
+    load_parameters,
+)
+from src.ingest_split import ingest_split
+from src.preprocessing_pipeline import create_preprocessing_pipeline
+from src.model_pipeline.visualise import create_visualisations
+
+
+def test_create_visualisations(tmp_path):
+    """Test the create_visualisations function"""
+
+    # Load in the test configuration & parameters
+    config = load_config(".env.test")
+    parameters = load_parameters(parameters_path=config["parameters_path"])
+
+    # Configure MLFlow
+    mlflow.set_tracking_uri(config["mlflow_tracking_uri"])
+    mlflow.set_experiment(config["mlflow_experiment"])
+
+    # Start MLFlow Tracking
+    with mlflow.start_run():
+
+        # Ingest the data & fit a model
+        X_train, X_test, y_train, y_test, X_holdout = ingest_split(
+            train_test_raw_path=config["train_test_raw_path"],
+            holdout_raw_path=config["holdout_raw_path"],
+            target=parameters["target"],
+            ingest_split_parameters=parameters["ingest_split_parameters"]
+        )
+        preprocessing_pipeline = create_preprocessing_pipeline(
+            pipeline_parameters=parameters["pipeline_parameters"]
+        )
+        X_train_features = preprocessing_pipeline.fit_transform(X_train)
+        X_test_features = preprocessing_pipeline.transform(X_test)
+        model = LogisticRegression().fit(
+            X_train_features,
+            y_train.values.ravel()
+        )
+
+        mlflow.end_run()
+
+    arguments = dict(
+        model=model,
+        X_train_features=X_train_features,
+        y_train=y_train,
+        X_test_features=X_test_features,
+        y_test=y_test,
+        cache_path=tmp_path / "cache"
+    )
+
+    # Run the function in a worker pool & then from the cache
+    (tmp_path / "rendered").mkdir()
+    (tmp_path / "cached").mkdir()
+    plots, rendered = create_visualisations(
+        artifact_path=tmp_path / "rendered",
+        n_jobs=2,
+        **arguments
+    )
+    cached_plots, cached_rendered = create_visualisations(
+        artifact_path=tmp_path / "cached",
+        **arguments
+    )
+
+    # Run the tests
+    assert list(plots) == [
+        "learning_curve",
+        "feature_importance",
+        "confusion_matrix",
+        "roc_auc"
+    ]
+    assert rendered == list(plots)
+    assert cached_rendered == []
+    for name, outpath in plots.items():
+        with open(outpath, "rb") as rendered_plot:
+            with open(cached_plots[name], "rb") as cached_plot:
+                assert rendered_plot.read() == cached_plot.read()
+    assert len(os.listdir(tmp_path / "cache")) == 4
+
+    # Plots rendered in the current process also use the Agg backend
+    (tmp_path / "serial").mkdir()
+    backend = matplotlib.get_backend()
+    matplotlib.use("svg")
+    try:
+        _, serial_rendered = create_visualisations(
+            artifact_path=tmp_path / "serial",
+            **dict(arguments, cache_path=None)
+        )
+        assert serial_rendered == list(plots)
+        assert matplotlib.get_backend().lower() == "agg"
+
+    finally:
+        matplotlib.use(backend)
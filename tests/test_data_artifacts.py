@@ -0,0 +1,79 @@
+import numpy as np
+import pandas as pd
+import pytest
+from pandas.testing import assert_frame_equal
+from src.model_pipeline import (
+    save_data_artifact,
+    load_data_artifact
+)
+
+
+@pytest.mark.parametrize("artifact_format, compression, extension", [
+    ("csv", None, ".csv"),
+    ("csv", "gzip", ".csv.gz"),
+    ("parquet", "zstd", ".parquet"),
+    ("feather", None, ".feather"),
+    ("feather", "lz4", ".feather"),
+])
+def test_data_artifacts(tmp_path, artifact_format, compression, extension):
+    """Test the save_data_artifact & load_data_artifact functions"""
+
+    if artifact_format != "csv":
+        pytest.importorskip("pyarrow")
+
+    df = pd.DataFrame(
+        data=dict(Age=[0.25, 0.5, 0.75], Sex_male=[1.0, 0.0, 1.0]),
+        index=pd.Index([3, 1, 2], name="PassengerId")
+    )
+
+    # Run the functions
+    outpath = save_data_artifact(
+        df=df,
+        artifact_path=tmp_path,
+        name="X_train",
+        artifact_format=artifact_format,
+        compression=compression
+    )
+    df_loaded = load_data_artifact(outpath)
+
+    # Run the tests
+    assert outpath == f"{tmp_path}/X_train{extension}"
+    assert_frame_equal(df_loaded, df.reset_index())
+
+
+def test_data_artifacts_zero_copy(tmp_path):
+    """Test uncompressed feather artifacts are loaded without a copy"""
+
+    pytest.importorskip("pyarrow")
+
+    df = pd.DataFrame(
+        data=dict(Age=np.linspace(0, 1, 1000), Sex_male=np.ones(1000)),
+        index=pd.Index(np.arange(1000), name="PassengerId")
+    )
+
+    # Run the functions
+    outpath = save_data_artifact(
+        df=df,
+        artifact_path=tmp_path,
+        name="X_train",
+        artifact_format="feather"
+    )
+    df_loaded = load_data_artifact(outpath)
+
+    # Run the tests
+    # The columns are read-only views of the memory mapped file
+    assert_frame_equal(df_loaded, df.reset_index())
+    for column in df_loaded.columns:
+        assert not df_loaded[column].values.flags.writeable
+
+
+def test_data_artifacts_unknown_format(tmp_path):
+    """Test save_data_artifact rejects unknown formats"""
+
+    with pytest.raises(ValueError):
+        save_data_artifact(
+            df=pd.DataFrame(dict(a=[1])),
+            artifact_path=tmp_path,
+            name="X_train",
+            artifact_format="json"
+        )
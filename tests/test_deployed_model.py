@@ -0,0 +1,26 @@
+import pytest
+from src.serving import (
+    DEPLOYED_MODEL_FILE,
+    set_deployed_model,
+    get_deployed_model
+)
+
+
+def test_deployed_model(tmp_path):
+    """Test the set_deployed_model & get_deployed_model functions"""
+
+    models_path = tmp_path / "models"
+
+    # No model has been deployed
+    with pytest.raises(FileNotFoundError):
+        get_deployed_model(models_path)
+
+    # Run the functions
+    path = set_deployed_model(models_path=models_path, model_name="logreg")
+    set_deployed_model(models_path=models_path, model_name="svc_v000")
+
+    # Run the tests
+    # The model deployed last is returned
+    assert path == str(models_path / DEPLOYED_MODEL_FILE)
+    assert get_deployed_model(models_path) == "svc_v000"
+    assert [p.name for p in models_path.iterdir()] == [DEPLOYED_MODEL_FILE]
@@ -56,7 +56,8 @@ def test_evaluate():
             X_test=X_test,
             y_test=y_test,
             artifact_path=config["artifact_path"],
-            cv=cv
+            cv=cv,
+            n_jobs=parameters["evaluate_model_parameters"]["n_jobs"]
         )
 
         assert isinstance(
@@ -0,0 +1,129 @@
+import mlflow
+import numpy as np
+import sklearn
+from sklearn.metrics import (
+    accuracy_score,
+    average_precision_score,
+    recall_score
+)
+from src.utils import (
+    load_config,
+    load_parameters,
+)
+from src.ingest_split import iter_raw_csv
+from src.preprocessing_pipeline import create_preprocessing_pipeline
+from src.models import create_sgd_model
+from src.model_pipeline import (
+    evaluate_model_incremental,
+    IncrementalMetrics
+)
+from src.model_pipeline.incremental import _split_chunk
+from src.tracking import start_run
+
+
+def test_incremental_metrics():
+    """Test the IncrementalMetrics class matches sklearn"""
+
+    rng = np.random.default_rng(0)
+    y_true = rng.integers(0, 2, 10000)
+    y_score = np.clip(y_true * 0.3 + rng.random(10000) * 0.7, 0, 1)
+    y_pred = (y_score > 0.5).astype(int)
+
+    # Run the function over chunks of the predictions
+    metrics = IncrementalMetrics(classes=[0, 1])
+    for start in range(0, 10000, 700):
+        metrics.update(
+            y_true=y_true[start:start + 700],
+            y_pred=y_pred[start:start + 700],
+            y_score=y_score[start:start + 700]
+        )
+    results = metrics.results()
+
+    # Run the tests
+    assert results["records"] == 10000
+    assert results["score"] == accuracy_score(y_true, y_pred)
+    assert results["recall"] == recall_score(y_true, y_pred, average="macro")
+    assert abs(
+        results["precision"] - average_precision_score(y_true, y_score)
+    ) < 0.005
+
+
+def test_evaluate_incremental():
+    """Test the evaluate_model_incremental function"""
+
+    config = load_config(".env.test")
+    parameters = load_parameters(parameters_path=config["parameters_path"])
+
+    # Configure MLFlow
+    mlflow.set_tracking_uri(config["mlflow_tracking_uri"])
+    mlflow.set_experiment(config["mlflow_experiment"])
+
+    # Start MLFlow Tracking
+    with start_run() as run:
+
+        # Create the preprocessing pipeline & model
+        preprocessing_pipeline = create_preprocessing_pipeline(
+            pipeline_parameters=parameters["pipeline_parameters"]
+        )
+        model, model_name, cv = create_sgd_model(
+            sgd_hyperparameters=parameters["sgd_hyperparameters"]
+        )
+
+        # Run the function over chunks of 20 records
+        model = evaluate_model_incremental(
+            preprocessing_pipeline=preprocessing_pipeline,
+            model=model,
+            train_test_raw_path=config["train_test_raw_path"],
+            target=parameters["target"],
+            uid=parameters["uid"],
+            ingest_split_parameters=parameters["ingest_split_parameters"],
+            chunk_size=20,
+            n_epochs=2
+        )
+
+    metrics = mlflow.get_run(run.info.run_id).data.metrics
+
+    # Fit a pipeline to all of the train records at once
+    ingest_split_parameters = parameters["ingest_split_parameters"]
+    df_train, _ = _split_chunk(
+        df=next(iter_raw_csv(
+            path=config["train_test_raw_path"],
+            chunk_size=1000,
+            dtypes=ingest_split_parameters["dtypes"]
+        )),
+        uid=parameters["uid"],
+        train_size=ingest_split_parameters["train_size"],
+        test_size=ingest_split_parameters["test_size"],
+        random_state=ingest_split_parameters["random_state"]
+    )
+    full_pipeline = create_preprocessing_pipeline(
+        pipeline_parameters=parameters["pipeline_parameters"]
+    ).fit(df_train.drop(parameters["target"], axis=1))
+    steps = dict(preprocessing_pipeline.steps)
+    full_steps = dict(full_pipeline.steps)
+
+    # Run the tests
+    assert isinstance(model, sklearn.linear_model.SGDClassifier)
+    assert model.coef_.shape == (1, 17)
+    assert metrics["train_records"] + metrics["test_records"] == 57
+    assert metrics["train_records"] > 0
+    assert metrics["test_records"] > 0
+    for name in ["train", "test"]:
+        for metric in ["score", "precision", "recall"]:
+            assert 0 <= metrics[f"{name}_{metric}"] <= 100
+
+    # The imputer & scaler learn the statistics of all of the train records
+    # rather than those of the first chunk
+    imputer_name = "Impute missing values"
+    scaler_name = "Scale numeric data"
+    assert steps[imputer_name].fill_values_ == (
+        full_steps[imputer_name].fill_values_
+    )
+    assert np.array_equal(
+        steps[scaler_name].scaler_.data_min_,
+        full_steps[scaler_name].scaler_.data_min_
+    )
+    assert np.array_equal(
+        steps[scaler_name].scaler_.data_max_,
+        full_steps[scaler_name].scaler_.data_max_
+    )
@@ -0,0 +1,122 @@
+import mlflow
+from pandas.testing import assert_frame_equal
+from src.utils import (
+    load_config,
+    load_logger,
+    load_parameters,
+)
+from src.ingest_split import ingest_split
+from src.preprocessing_pipeline import create_preprocessing_pipeline
+from src.feature_cache import (
+    create_cache_key,
+    FeatureCache
+)
+
+
+def test_feature_cache(tmp_path):
+    """Test the FeatureCache class & create_cache_key function"""
+
+    # Load in the test configuration & parameters
+    config = load_config(".env.test")
+    logger = load_logger(
+        app_name=config["app_name"],
+        logs_path=config["logs_path"]
+    )
+    parameters = load_parameters(parameters_path=config["parameters_path"])
+
+    # Configure MLFlow
+    mlflow.set_tracking_uri(config["mlflow_tracking_uri"])
+    mlflow.set_experiment(config["mlflow_experiment"])
+
+    # Start MLFlow Tracking
+    with mlflow.start_run():
+
+        # Ingest the data
+        X_train, X_test, y_train, y_test, X_holdout = ingest_split(
+            train_test_raw_path=config["train_test_raw_path"],
+            holdout_raw_path=config["holdout_raw_path"],
+            target=parameters["target"],
+            ingest_split_parameters=parameters["ingest_split_parameters"]
+        )
+        key_parameters = dict(
+            ingest_split_parameters=parameters["ingest_split_parameters"],
+            pipeline_parameters=parameters["pipeline_parameters"]
+        )
+        key = create_cache_key(
+            data_paths=[config["train_test_raw_path"]],
+            parameters=key_parameters
+        )
+        feature_cache = FeatureCache(cache_path=tmp_path, max_size_mb=1024)
+
+        # Run the function
+        created = feature_cache.get_features(
+            key=key,
+            preprocessing_pipeline=create_preprocessing_pipeline(
+                pipeline_parameters=parameters["pipeline_parameters"]
+            ),
+            X_train=X_train,
+            X_test=X_test,
+            X_holdout=X_holdout
+        )
+        cached = feature_cache.get_features(
+            key=key,
+            preprocessing_pipeline=None,
+            X_train=None,
+            X_test=None,
+            X_holdout=X_holdout
+        )
+
+        # Run the tests
+        # Cached features match the created features
+        assert_frame_equal(
+            cached["X_train_features"],
+            created["X_train_features"]
+        )
+        assert_frame_equal(
+            cached["X_test_features"],
+            created["X_test_features"]
+        )
+        assert_frame_equal(
+            cached["X_holdout_features"],
+            created["X_holdout_features"]
+        )
+        assert_frame_equal(
+            cached["preprocessing_pipeline"].transform(X_holdout),
+            created["X_holdout_features"]
+        )
+
+        # Entries without the holdout features are only loaded without it
+        feature_cache.save(
+            key="no_holdout",
+            preprocessing_pipeline=created["preprocessing_pipeline"],
+            X_train_features=created["X_train_features"],
+            X_test_features=created["X_test_features"]
+        )
+        assert feature_cache.load("no_holdout") is not None
+        assert feature_cache.load("no_holdout", holdout=True) is None
+
+        # The key depends on the parameters
+        key_parameters["ingest_split_parameters"] = dict(
+            key_parameters["ingest_split_parameters"],
+            random_state=0
+        )
+        assert key == create_cache_key(
+            data_paths=[config["train_test_raw_path"]],
+            parameters=dict(
+                ingest_split_parameters=parameters["ingest_split_parameters"],
+                pipeline_parameters=parameters["pipeline_parameters"]
+            )
+        )
+        assert key != create_cache_key(
+            data_paths=[config["train_test_raw_path"]],
+            parameters=key_parameters
+        )
+
+        # Least recently used entries are evicted
+        feature_cache.save(key="other", **created)
+        assert len(feature_cache.size_mb()) == 3
+        feature_cache.max_size_mb = 0
+        feature_cache.save(key="latest", **created)
+        assert [path.name for path in feature_cache.size_mb()] == ["latest"]
+
+        mlflow.end_run()
@@ -0,0 +1,135 @@
+import mlflow
+import numpy as np
+from joblib import (
+    Parallel,
+    delayed
+)
+from pandas.testing import assert_frame_equal
+from src.utils import (
+    load_config,
+    load_logger,
+    load_parameters,
+)
+from src.ingest_split import ingest_split
+from src.preprocessing_pipeline import create_preprocessing_pipeline
+from src.feature_cache import (
+    FeatureCache,
+    FeatureStore,
+    is_memory_mapped
+)
+
+
+def _is_memory_mapped(df):
+    """Checks the features received by a joblib worker process"""
+
+    return is_memory_mapped(df)
+
+
+def test_feature_store(tmp_path):
+    """Test the FeatureStore class & is_memory_mapped function"""
+
+    # Load in the test configuration & parameters
+    config = load_config(".env.test")
+    logger = load_logger(
+        app_name=config["app_name"],
+        logs_path=config["logs_path"]
+    )
+    parameters = load_parameters(parameters_path=config["parameters_path"])
+
+    # Configure MLFlow
+    mlflow.set_tracking_uri(config["mlflow_tracking_uri"])
+    mlflow.set_experiment(config["mlflow_experiment"])
+
+    # Start MLFlow Tracking
+    with mlflow.start_run():
+
+        # Ingest the data & create the features
+        X_train, X_test, y_train, y_test, X_holdout = ingest_split(
+            train_test_raw_path=config["train_test_raw_path"],
+            holdout_raw_path=config["holdout_raw_path"],
+            target=parameters["target"],
+            ingest_split_parameters=parameters["ingest_split_parameters"]
+        )
+        preprocessing_pipeline = create_preprocessing_pipeline(
+            pipeline_parameters=parameters["pipeline_parameters"]
+        )
+        X_train_features = preprocessing_pipeline.fit_transform(X_train)
+        X_holdout_features = preprocessing_pipeline.transform(X_holdout)
+
+        # Run the class, with a chunk size which doesn't divide the records
+        feature_store = FeatureStore(store_path=tmp_path, chunk_size=100)
+        feature_store.save("X_train_features", X_train_features)
+        feature_store.save("X_holdout_features", X_holdout_features)
+        stored = feature_store.load("X_train_features")
+
+        # Run the tests
+        # The features are stored as memory mapped float32 arrays
+        assert feature_store.names() == [
+            "X_holdout_features",
+            "X_train_features"
+        ]
+        assert is_memory_mapped(stored)
+        assert not is_memory_mapped(X_train_features)
+        assert (stored.dtypes == np.float32).all()
+
+        # The columns, index & values of the features are stored
+        assert_frame_equal(
+            stored,
+            X_train_features.astype(np.float32)
+        )
+        assert_frame_equal(
+            feature_store.load("X_holdout_features"),
+            X_holdout_features.astype(np.float32)
+        )
+        assert feature_store.load("X_test_features") is None
+
+        # joblib passes the memory mapped features to its workers by
+        # reference rather than copying them
+        assert all(
+            Parallel(n_jobs=2)(
+                delayed(_is_memory_mapped)(stored) for _ in range(2)
+            )
+        )
+
+        # The feature cache stores the features in the feature store & loads
+        # them memory mapped when the features are created & cached
+        feature_cache = FeatureCache(
+            cache_path=tmp_path / "cache",
+            feature_format="mmap"
+        )
+        for _ in range(2):
+            features = feature_cache.get_features(
+                key="mmap",
+                preprocessing_pipeline=create_preprocessing_pipeline(
+                    pipeline_parameters=parameters["pipeline_parameters"]
+                ),
+                X_train=X_train,
+                X_test=X_test,
+                X_holdout=X_holdout
+            )
+            assert is_memory_mapped(features["X_train_features"])
+            assert is_memory_mapped(features["X_test_features"])
+            assert is_memory_mapped(features["X_holdout_features"])
+            assert_frame_equal(
+                features["X_train_features"],
+                X_train_features.astype(np.float32)
+            )
+
+        # Switching the feature_format misses the cache rather than failing
+        # to load the entry saved in the other format
+        for feature_format in ["parquet", "mmap"]:
+            feature_cache = FeatureCache(
+                cache_path=tmp_path / "cache",
+                feature_format=feature_format
+            )
+            assert feature_cache.load("mmap") is None
+            features = feature_cache.get_features(
+                key="mmap",
+                preprocessing_pipeline=create_preprocessing_pipeline(
+                    pipeline_parameters=parameters["pipeline_parameters"]
+                ),
+                X_train=X_train,
+                X_test=X_test
+            )
+            assert features["preprocessing_pipeline"] is not None
+            assert feature_cache.load("mmap") is not None
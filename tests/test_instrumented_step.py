@@ -0,0 +1,165 @@
+import pickle
+import tracemalloc
+import mlflow
+import pandas as pd
+import pytest
+from pandas.testing import assert_frame_equal
+from sklearn.pipeline import Pipeline
+from src.utils import (
+    load_config,
+    load_parameters,
+)
+from src.ingest_split import ingest_split
+from src.preprocessing_pipeline import (
+    create_preprocessing_pipeline,
+    ColumnScaler,
+    InstrumentedStep,
+    get_step_records,
+    log_step_metrics,
+    remove_instrumentation
+)
+from src.models import create_logreg_model
+from src.serving import compile_model_pipeline
+from src.tracking import start_run
+
+
+def test_instrumented_step():
+    """Test the InstrumentedStep class & get_step_records function"""
+
+    # Load in the test configuration & parameters
+    config = load_config(".env.test")
+    parameters = load_parameters(parameters_path=config["parameters_path"])
+
+    # Configure MLFlow
+    mlflow.set_tracking_uri(config["mlflow_tracking_uri"])
+    mlflow.set_experiment(config["mlflow_experiment"])
+
+    # Start MLFlow Tracking
+    with start_run():
+
+        # Ingest the data
+        X_train, X_test, y_train, y_test, X_holdout = ingest_split(
+            train_test_raw_path=config["train_test_raw_path"],
+            holdout_raw_path=config["holdout_raw_path"],
+            target=parameters["target"],
+            ingest_split_parameters=parameters["ingest_split_parameters"]
+        )
+
+        # Run the function
+        preprocessing_pipeline = create_preprocessing_pipeline(
+            pipeline_parameters=parameters["pipeline_parameters"]
+        )
+        instrumented_pipeline = create_preprocessing_pipeline(
+            pipeline_parameters=parameters["pipeline_parameters"],
+            instrument=True
+        )
+        tracemalloc_pipeline = create_preprocessing_pipeline(
+            pipeline_parameters=parameters["pipeline_parameters"],
+            instrument=True,
+            instrument_memory="tracemalloc"
+        )
+        X_train_features = preprocessing_pipeline.fit_transform(X_train)
+        X_test_features = preprocessing_pipeline.transform(X_test)
+        instrumented_train_features = (
+            instrumented_pipeline.fit_transform(X_train)
+        )
+        instrumented_test_features = instrumented_pipeline.transform(X_test)
+        tracemalloc_pipeline.fit_transform(X_train)
+
+        records = get_step_records(instrumented_pipeline)
+        logged_records = log_step_metrics(tracemalloc_pipeline)
+        run_id = mlflow.active_run().info.run_id
+
+        model, _, _ = create_logreg_model(
+            logreg_hyperparameters=parameters["logreg_hyperparameters"]
+        )
+
+    metrics = mlflow.get_run(run_id).data.metrics
+
+    # Run the tests
+    # The output is unchanged
+    assert_frame_equal(X_train_features, instrumented_train_features)
+    assert_frame_equal(X_test_features, instrumented_test_features)
+    assert all(
+        isinstance(step, InstrumentedStep)
+        for _, step in instrumented_pipeline.steps
+    )
+
+    # A record of each step for fit_transform & transform, in order
+    steps = [name for name, _ in instrumented_pipeline.steps]
+    assert [record["step"] for record in records] == steps + steps
+    assert [record["method"] for record in records] == (
+        ["fit_transform"] * len(steps) + ["transform"] * len(steps)
+    )
+    assert records[0]["rows_in"] == len(X_train)
+    assert records[-1]["rows_out"] == len(X_test)
+    assert records[-1]["columns_out"] == X_test_features.shape[1]
+    assert all(record["seconds"] >= 0 for record in records)
+    assert all(record["peak_memory_mb"] >= 0 for record in records)
+
+    # Fitting a step records the rows it was fitted to
+    name, step = instrumented_pipeline.steps[0]
+    step.fit(X_train)
+    assert step.records_[-1]["method"] == "fit"
+    assert step.records_[-1]["rows_out"] == len(X_train)
+
+    # Logging the metrics clears the records
+    assert len(logged_records) == len(steps)
+    assert get_step_records(tracemalloc_pipeline) == []
+    assert metrics["drop_columns_fit_transform_rows_in"] == len(X_train)
+    assert "scale_numeric_data_fit_transform_peak_memory_mb" in metrics
+
+    # The records aren't pickled & the compiled model skips the wrapper
+    unpickled_pipeline = pickle.loads(pickle.dumps(instrumented_pipeline))
+    assert get_step_records(unpickled_pipeline) == []
+
+    model_pipeline = Pipeline(
+        instrumented_pipeline.steps + [("Model", model)]
+    )
+    model_pipeline.fit(X_train, y_train.values.ravel())
+    compiled_model = compile_model_pipeline(model_pipeline=model_pipeline)
+    assert (
+        compiled_model.predict(X_holdout).tolist()
+        == model_pipeline.predict(X_holdout).tolist()
+    )
+
+    # Removing the instrumentation keeps the fitted steps & the records
+    uninstrumented_pipeline = remove_instrumentation(model_pipeline)
+    assert not any(
+        isinstance(step, InstrumentedStep)
+        for _, step in uninstrumented_pipeline.steps
+    )
+    assert all(
+        isinstance(step, InstrumentedStep)
+        for _, step in model_pipeline.steps[:-1]
+    )
+    assert (
+        uninstrumented_pipeline.predict(X_holdout).tolist()
+        == model_pipeline.predict(X_holdout).tolist()
+    )
+
+
+class _FailingStep(ColumnScaler):
+    """A step which fails to transform"""
+
+    def transform(self, X):
+        raise ValueError("Unable to transform")
+
+
+@pytest.mark.parametrize("memory", ["rss", "tracemalloc"])
+def test_instrumented_step_failure(memory):
+    """Test InstrumentedStep stops measuring memory when the step fails"""
+
+    df = pd.DataFrame(dict(Age=[22.0, 38.0, 26.0]))
+    step = InstrumentedStep(
+        name="Fail",
+        step=_FailingStep(["Age"]),
+        memory=memory
+    ).fit(df)
+
+    # Run the tests
+    # The error is raised, tracemalloc is stopped & the call isn't recorded
+    with pytest.raises(ValueError):
+        step.transform(df)
+    assert not tracemalloc.is_tracing()
+    assert [record["method"] for record in step.records_] == ["fit"]
@@ -0,0 +1,54 @@
+import sys
+import json
+import subprocess
+import pytest
+import src.serving
+from src.utils import lazy_imports
+
+
+TRAINING_PACKAGES = ["mlflow", "matplotlib", "yellowbrick", "scikitplot"]
+
+
+def imported_modules(code: str):
+    """The modules imported by running code in a new interpreter"""
+
+    process = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            f"{code}\nimport sys, json\nprint(json.dumps(list(sys.modules)))"
+        ],
+        capture_output=True,
+        text=True,
+        check=True
+    )
+
+    return set(json.loads(process.stdout.splitlines()[-1]))
+
+
+def test_lazy_imports():
+    """Test the lazy_imports function & the scoring entrypoints"""
+
+    # Run the function
+    __getattr__, __dir__ = lazy_imports(
+        package="src.serving",
+        imports=dict(load_scoring_model="src.serving.onnx_model")
+    )
+
+    # Run the tests
+    load_scoring_model = __getattr__("load_scoring_model")
+    assert load_scoring_model is src.serving.load_scoring_model
+    assert "load_scoring_model" in __dir__()
+    assert set(src.serving.__all__) <= set(dir(src.serving))
+    with pytest.raises(AttributeError):
+        __getattr__("missing")
+
+    # Scoring doesn't import the training dependencies
+    for code in ["import score", "import serve", "import src.serving.server"]:
+        modules = imported_modules(code)
+        assert not modules & set(TRAINING_PACKAGES)
+        assert "sklearn" not in modules
+
+    # Training still imports them when a function is first used
+    modules = imported_modules("from src import evaluate_model")
+    assert "matplotlib" in modules
@@ -0,0 +1,39 @@
+import json
+from pathlib import Path
+from src.utils import load_logger
+
+
+def test_load_logger(tmp_path):
+    """Test the load_logger function"""
+
+    # Run the function
+    logger = load_logger(
+        app_name="test",
+        logs_path=str(tmp_path),
+        logs_level="DEBUG",
+        enqueue=True,
+        sample_rate=0,
+        serialize=True
+    )
+    for _ in range(100):
+        logger.debug("Running transform()")
+    logger.bind(status=200, records=3).info("POST /invocations")
+    logger.warning("Warning")
+    logger.complete()
+
+    records = [
+        json.loads(line)["record"]
+        for path in Path(tmp_path).glob("test *.log")
+        for line in path.read_text().splitlines()
+    ]
+    logger.remove()
+
+    # Run the tests
+    # Debug messages are sampled, others are always output
+    assert [record["message"] for record in records] == [
+        "POST /invocations",
+        "Warning"
+    ]
+
+    # The bound fields are serialized
+    assert records[0]["extra"] == dict(status=200, records=3)
@@ -0,0 +1,110 @@
+import threading
+import pytest
+import pandas as pd
+from src.serving import MicroBatcher
+
+
+def test_micro_batcher():
+    """Test the MicroBatcher class"""
+
+    batch_sizes = []
+
+    def predict_function(df):
+        """Records the size of each batch and returns the id of each record"""
+        batch_sizes.append(len(df))
+        return df["id"].values * 10
+
+    requests = [
+        pd.DataFrame(dict(id=[i, i + 1000])) for i in range(50)
+    ]
+    results = {}
+
+    def send_request(i, batcher):
+        results[i] = batcher.predict(requests[i])
+
+    # Run the class
+    with MicroBatcher(
+        predict_function=predict_function,
+        max_batch_size=16,
+        max_wait_ms=50
+    ) as batcher:
+        threads = [
+            threading.Thread(target=send_request, args=(i, batcher))
+            for i in range(len(requests))
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    # Run the tests
+    for i, df in enumerate(requests):
+        assert results[i].tolist() == [i * 10, (i + 1000) * 10]
+
+    assert sum(batch_sizes) == 100
+    assert len(batch_sizes) < len(requests)
+    assert max(batch_sizes) <= 16
+
+
+def test_micro_batcher_exception():
+    """Test the MicroBatcher returns exceptions to the caller"""
+
+    def predict_function(df):
+        raise ValueError("Unable to score")
+
+    # Run the class
+    with MicroBatcher(predict_function=predict_function) as batcher:
+        future = batcher.submit(pd.DataFrame(dict(id=[1])))
+
+        # Run the tests
+        assert isinstance(future.exception(), ValueError)
+
+
+def test_micro_batcher_bad_request():
+    """Test a bad request only fails itself, not the rest of its batch"""
+
+    batch_sizes = []
+
+    def predict_function(df):
+        """Fails for negative ids, as with an unknown category"""
+        batch_sizes.append(len(df))
+        if (df["id"] < 0).any():
+            raise ValueError("Found unknown category")
+        return df["id"].values * 10
+
+    # Run the class
+    with MicroBatcher(
+        predict_function=predict_function,
+        max_wait_ms=200
+    ) as batcher:
+        futures = [
+            batcher.submit(pd.DataFrame(dict(id=[i]))) for i in [1, -1, 2, 3]
+        ]
+
+        # Run the tests
+        assert isinstance(futures[1].exception(), ValueError)
+        assert [futures[i].result().tolist() for i in [0, 2, 3]] == [
+            [10],
+            [20],
+            [30]
+        ]
+
+    # The requests were batched before being scored individually
+    assert batch_sizes[0] == 4
+
+
+def test_micro_batcher_not_running():
+    """Test requests are rejected when the MicroBatcher isn't running"""
+
+    batcher = MicroBatcher(predict_function=lambda df: df["id"].values)
+    df = pd.DataFrame(dict(id=[1]))
+
+    # Run the tests
+    with pytest.raises(RuntimeError):
+        batcher.predict(df)
+
+    with batcher:
+        assert batcher.predict(df).tolist() == [1]
+
+    with pytest.raises(RuntimeError):
+        batcher.submit(df)
@@ -0,0 +1,77 @@
+import pandas as pd
+import numpy as np
+import pytest
+from src import (
+    load_config,
+    load_parameters
+)
+from src.preprocessing_pipeline import MissingValuesImputer
+
+
+def test_missing_values_imputer():
+    """Test the MissingValuesImputer estimator"""
+
+    # Load in the test configuration & parameters
+    config = load_config(".env.test")
+    parameters = load_parameters(parameters_path=config["parameters_path"])
+    strategy = (
+        parameters["pipeline_parameters"]["impute_missing_values_kw_args"]
+        ["strategy"]
+    )
+
+    # Create the data
+    train_data = [
+        dict(id=1, col1=10, col2="A", col3=1),
+        dict(id=2, col1=10, col2="A", col3=1),
+        dict(id=3, col1=10, col2="A", col3=1),
+        dict(id=4, col1=9, col2="B", col3=0),
+        dict(id=5, col1=None, col2=np.nan, col3=None),
+        dict(id=6, col1=np.nan, col2="", col3=None)
+    ]
+    test_data = [
+        dict(id=7, col1=9, col2="B", col3=0),
+        dict(id=8, col1=None, col2="", col3=None),
+    ]
+
+    df_train = pd.DataFrame(train_data).set_index("id", drop=True)
+    df_test = pd.DataFrame(test_data).set_index("id", drop=True)
+
+    # Run the estimator
+    imputer = MissingValuesImputer(strategy=strategy)
+    df_train_out = imputer.fit_transform(df_train)
+    df_test_out = imputer.transform(df_test)
+
+    # Run the tests
+    assert df_train_out["col1"].loc[5] == 10
+    assert df_train_out["col1"].loc[6] == 10
+    assert df_train_out["col2"].loc[5] == "A"
+    assert df_train_out["col2"].loc[6] == "A"
+    assert df_train_out["col3"].loc[5] == 1
+    assert df_train_out["col3"].loc[6] == 1
+
+    # Fill values are learned from the training data only
+    assert df_test_out["col1"].loc[8] == 10
+    assert df_test_out["col2"].loc[8] == "A"
+    assert df_test_out["col3"].loc[8] == 1
+
+    # Categoricals are filled with categories they don't contain
+    df_test["col2"] = df_test["col2"].replace("", None).astype("category")
+    df_test_out = imputer.transform(df_test)
+
+    assert df_test_out["col2"].loc[8] == "A"
+
+    # Fitting chunks of the train data learns the same fill values, for the
+    # most_frequent & mean strategies
+    for strategy in ["most_frequent", "mean"]:
+        columns = ["col1", "col3"] if strategy == "mean" else df_train.columns
+        chunked_imputer = MissingValuesImputer(strategy=strategy)
+        for start in range(0, len(df_train), 4):
+            chunked_imputer.partial_fit(
+                df_train.iloc[start:start + 4][columns]
+            )
+
+        assert chunked_imputer.fill_values_ == pytest.approx(
+            MissingValuesImputer(strategy=strategy)
+            .fit(df_train[columns])
+            .fill_values_
+        )
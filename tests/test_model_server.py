@@ -0,0 +1,121 @@
+import json
+import threading
+import urllib.request
+import pandas as pd
+from sklearn.pipeline import Pipeline
+from sklearn.preprocessing import FunctionTransformer
+from src.preprocessing_pipeline import InstrumentedStep
+from src.serving import create_model_server
+
+
+class DummyModel:
+    """Predicts the id of each record multiplied by 10"""
+
+    def predict(self, df):
+        return df["id"].values * 10
+
+    def fit(self, X, y=None):
+        return self
+
+
+def test_model_server():
+    """Test the create_model_server function"""
+
+    # Run the function on a free port
+    server = create_model_server(
+        model_pipeline=DummyModel(),
+        host="127.0.0.1",
+        port=0,
+        max_batch_size=16,
+        max_wait_ms=5
+    )
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    url = f"http://127.0.0.1:{server.server_address[1]}"
+
+    try:
+        df = pd.DataFrame(dict(id=[1, 2, 3], name=["a", "b", "c"]))
+
+        # pandas-split request
+        request = urllib.request.Request(
+            url=f"{url}/invocations",
+            data=df.to_json(orient="split").encode(),
+            headers={"Content-Type": "application/json; format=pandas-split"}
+        )
+        with urllib.request.urlopen(request) as response:
+            split_predictions = json.loads(response.read())
+
+        # pandas-records request
+        request = urllib.request.Request(
+            url=f"{url}/invocations",
+            data=df.to_json(orient="records").encode(),
+            headers={
+                "Content-Type": "application/json; format=pandas-records"
+            }
+        )
+        with urllib.request.urlopen(request) as response:
+            records_predictions = json.loads(response.read())
+
+        with urllib.request.urlopen(f"{url}/ping") as response:
+            ping_status = response.status
+
+    finally:
+        server.shutdown()
+        server.server_close()
+        server.batcher.stop()
+
+    # Run the tests
+    assert split_predictions == [10, 20, 30]
+    assert records_predictions == [10, 20, 30]
+    assert ping_status == 200
+
+
+def test_model_server_steps():
+    """Test the /steps endpoint of the model server"""
+
+    # Run the function with an instrumented pipeline on a free port
+    model_pipeline = Pipeline([
+        ("Identity", InstrumentedStep(
+            name="Identity",
+            step=FunctionTransformer()
+        )),
+        ("Model", DummyModel())
+    ])
+    server = create_model_server(
+        model_pipeline=model_pipeline,
+        host="127.0.0.1",
+        port=0,
+        max_batch_size=16,
+        max_wait_ms=5
+    )
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    url = f"http://127.0.0.1:{server.server_address[1]}"
+
+    try:
+        request = urllib.request.Request(
+            url=f"{url}/invocations",
+            data=pd.DataFrame(dict(id=[1, 2, 3])).to_json(
+                orient="split"
+            ).encode(),
+            headers={"Content-Type": "application/json; format=pandas-split"}
+        )
+        with urllib.request.urlopen(request) as response:
+            predictions = json.loads(response.read())
+
+        # The records are cleared once they're returned
+        steps = []
+        for _ in range(2):
+            with urllib.request.urlopen(f"{url}/steps") as response:
+                steps.append(json.loads(response.read()))
+
+    finally:
+        server.shutdown()
+        server.server_close()
+        server.batcher.stop()
+
+    # Run the tests
+    assert predictions == [10, 20, 30]
+    assert [record["step"] for record in steps[0]] == ["Identity"]
+    assert steps[0][0]["rows_in"] == 3
+    assert steps[1] == []
@@ -0,0 +1,118 @@
+import os
+import mlflow
+import numpy as np
+import pandas as pd
+import pytest
+from sklearn.pipeline import Pipeline
+from src.utils import (
+    load_config,
+    load_parameters,
+)
+from src.ingest_split import ingest_split
+from src.preprocessing_pipeline import create_preprocessing_pipeline
+from src.models import create_logreg_model
+from src.serving import (
+    export_onnx_model,
+    OnnxModel,
+    load_scoring_model,
+    ONNX_MODEL_FILE
+)
+
+
+def test_onnx_model():
+    """Test the export_onnx_model function & OnnxModel class"""
+
+    pytest.importorskip("onnx")
+    pytest.importorskip("onnxruntime")
+
+    # Load in the test configuration & parameters
+    config = load_config(".env.test")
+    parameters = load_parameters(parameters_path=config["parameters_path"])
+
+    # Configure MLFlow
+    mlflow.set_tracking_uri(config["mlflow_tracking_uri"])
+    mlflow.set_experiment(config["mlflow_experiment"])
+
+    # Start MLFlow Tracking
+    with mlflow.start_run():
+
+        # Ingest the data
+        X_train, X_test, y_train, y_test, X_holdout = ingest_split(
+            train_test_raw_path=config["train_test_raw_path"],
+            holdout_raw_path=config["holdout_raw_path"],
+            target=parameters["target"],
+            ingest_split_parameters=parameters["ingest_split_parameters"]
+        )
+
+        # Create & fit the model pipeline
+        preprocessing_pipeline = create_preprocessing_pipeline(
+            pipeline_parameters=parameters["pipeline_parameters"]
+        )
+        model, model_name, cv = create_logreg_model(
+            logreg_hyperparameters=parameters["logreg_hyperparameters"]
+        )
+        model_pipeline = Pipeline(
+            preprocessing_pipeline.steps + [("Model", model)]
+        )
+        model_pipeline.fit(X_train, y_train.values.ravel())
+
+        mlflow.end_run()
+
+    # Run the function
+    path = f"{config['models_path']}/{ONNX_MODEL_FILE}"
+    export_onnx_model(model_pipeline=model_pipeline, path=path)
+    onnx_model = OnnxModel(path)
+    loaded_model = load_scoring_model(
+        models_path=config["models_path"],
+        backend="onnx"
+    )
+    os.remove(path)
+
+    # Records with missing values & names without a known title
+    X_missing = pd.concat([X_holdout.head(4)] * 2, ignore_index=True)
+    X_missing["Name"] = pd.array(
+        ["Smith, Mr.John", "Nobody", "X, Dr Y. Rev. Z", "Jones, Mrs. Ann"] * 2,
+        dtype="string"
+    )
+    X_missing["Age"] = np.nan
+    X_missing.loc[0, "Embarked"] = np.nan
+    X_missing.loc[1, "SibSp"] = pd.NA
+
+    # Run the tests
+    # The ONNX model matches the model pipeline on typed & raw records
+    for X in [
+        X_holdout,
+        X_test,
+        X_missing,
+        pd.read_csv(config["holdout_raw_path"])
+    ]:
+        assert np.allclose(
+            onnx_model.predict_proba(X),
+            model_pipeline.predict_proba(X)
+        )
+        assert (
+            onnx_model.predict(X).tolist()
+            == model_pipeline.predict(X).tolist()
+        )
+
+    # Lists of records are scored like dataframes
+    assert (
+        onnx_model.predict(X_holdout.to_dict(orient="records")).tolist()
+        == model_pipeline.predict(X_holdout).tolist()
+    )
+    assert (
+        loaded_model.predict(X_holdout).tolist()
+        == model_pipeline.predict(X_holdout).tolist()
+    )
+    assert "PassengerId" not in onnx_model.input_kinds
+    assert onnx_model.input_kinds["Name"] == "string"
+    assert onnx_model.input_kinds["Age"] == "double"
+
+    # Unknown categories & backends raise an error
+    X_unknown = X_holdout.head(2).astype(dict(Embarked=str))
+    X_unknown.loc[X_unknown.index[0], "Embarked"] = "Z"
+    with pytest.raises(ValueError, match="unknown categories"):
+        onnx_model.predict(X_unknown)
+
+    with pytest.raises(ValueError, match="Unknown backend"):
+        load_scoring_model(models_path=config["models_path"], backend="jit")
@@ -0,0 +1,129 @@
+import mlflow
+import mlflow.sklearn
+import numpy as np
+import pandas as pd
+import pytest
+from pandas.testing import assert_frame_equal
+from sklearn.pipeline import Pipeline
+from src.utils import (
+    load_config,
+    load_parameters,
+)
+from src.ingest_split import ingest_split
+from src.preprocessing_pipeline import (
+    create_preprocessing_pipeline,
+    create_polars_pipeline,
+    PolarsPipeline
+)
+from src.models import create_logreg_model
+from src.serving import load_scoring_model
+
+
+def test_polars_pipeline(tmp_path):
+    """Test the create_polars_pipeline function & PolarsPipeline class"""
+
+    pytest.importorskip("polars")
+    pytest.importorskip("pyarrow")
+
+    # Load in the test configuration & parameters
+    config = load_config(".env.test")
+    parameters = load_parameters(parameters_path=config["parameters_path"])
+
+    # Configure MLFlow
+    mlflow.set_tracking_uri(config["mlflow_tracking_uri"])
+    mlflow.set_experiment(config["mlflow_experiment"])
+
+    # Start MLFlow Tracking
+    with mlflow.start_run():
+
+        # Ingest the data
+        X_train, X_test, y_train, y_test, X_holdout = ingest_split(
+            train_test_raw_path=config["train_test_raw_path"],
+            holdout_raw_path=config["holdout_raw_path"],
+            target=parameters["target"],
+            ingest_split_parameters=parameters["ingest_split_parameters"]
+        )
+
+        # Create & fit the model pipeline
+        preprocessing_pipeline = create_preprocessing_pipeline(
+            pipeline_parameters=parameters["pipeline_parameters"],
+            instrument=True
+        )
+        model, _, _ = create_logreg_model(
+            logreg_hyperparameters=parameters["logreg_hyperparameters"]
+        )
+        model_pipeline = Pipeline(
+            preprocessing_pipeline.steps + [("Model", model)]
+        )
+        model_pipeline.fit(X_train, y_train.values.ravel())
+
+    # Run the function
+    polars_pipeline = create_polars_pipeline(preprocessing_pipeline)
+    polars_model = create_polars_pipeline(model_pipeline)
+
+    # Records with missing values & names without a known title
+    X_missing = X_holdout.head(4).copy()
+    X_missing["Name"] = ["Smith, Mr.John", None, "X, Dr Y. Rev. Z", "Nobody"]
+    X_missing["Age"] = np.nan
+    X_missing.loc[X_missing.index[0], "Embarked"] = np.nan
+    X_missing.loc[X_missing.index[1], "SibSp"] = np.nan
+
+    # Run the tests
+    # The features match the pandas pipeline on typed & raw records
+    for X in [
+        X_holdout,
+        X_test,
+        X_missing,
+        pd.read_csv(config["holdout_raw_path"])
+    ]:
+        assert_frame_equal(
+            polars_pipeline.transform(X),
+            preprocessing_pipeline.transform(X)
+        )
+        assert (
+            polars_model.predict(X).tolist()
+            == model_pipeline.predict(X).tolist()
+        )
+        assert np.allclose(
+            polars_model.predict_proba(X),
+            model_pipeline.predict_proba(X)
+        )
+
+    # Csv files & single records
+    assert_frame_equal(
+        polars_pipeline.transform_csv(config["holdout_raw_path"]),
+        preprocessing_pipeline.transform(
+            pd.read_csv(config["holdout_raw_path"])
+        )
+    )
+    record = X_holdout.iloc[0]
+    assert np.allclose(
+        polars_pipeline.transform(record).to_numpy(dtype=float),
+        preprocessing_pipeline.transform(record).to_numpy(dtype=float)
+    )
+
+    # The saved model pipeline is loaded as a scoring backend
+    models_path = str(tmp_path / "model")
+    mlflow.sklearn.save_model(sk_model=model_pipeline, path=models_path)
+    loaded_model = load_scoring_model(
+        models_path=models_path,
+        backend="polars"
+    )
+    assert isinstance(loaded_model, PolarsPipeline)
+    assert (
+        loaded_model.predict(X_holdout).tolist()
+        == model_pipeline.predict(X_holdout).tolist()
+    )
+    assert polars_model.uid == "PassengerId"
+    assert polars_pipeline.model is None
+    with pytest.raises(ValueError):
+        polars_pipeline.predict(X_holdout)
+
+    # Unknown categories & steps raise an error
+    X_unknown = X_holdout.head(2).astype(dict(Embarked=str))
+    X_unknown.loc[X_unknown.index[0], "Embarked"] = "Z"
+    with pytest.raises(ValueError, match="unknown categories"):
+        polars_pipeline.transform(X_unknown)
+
+    with pytest.raises(ValueError, match="Unable to run"):
+        create_polars_pipeline(Pipeline([("Model", model), ("Last", model)]))
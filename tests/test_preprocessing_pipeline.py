@@ -1,5 +1,9 @@
 import os
 import mlflow
+from pandas.testing import (
+    assert_frame_equal,
+    assert_series_equal
+)
 from src.utils import (
     load_config,
     load_logger,
@@ -49,7 +53,7 @@ def test_preprocessing_pipeline():
         # Run the tests
         # Structure
         assert X_holdout.index.name == "PassengerId"
-        assert X_holdout.shape == (57, 16)
+        assert X_holdout.shape == (57, 17)
 
         # Scaling
         assert X_holdout["Age"].min() == 0
@@ -82,3 +86,100 @@ def test_preprocessing_pipeline():
         assert X_holdout["TitleCategory_young_male"].loc[15] == 0
 
         mlflow.end_run()
+
+
+def test_preprocessing_pipeline_single_record():
+    """
+    Test that a fitted preprocessing_pipeline produces the same features for
+    a single record as it does for the record within a batch
+    """
+
+    # Load in the test configuration & parameters
+    config = load_config(".env.test")
+    parameters = load_parameters(parameters_path=config["parameters_path"])
+    uid = parameters["uid"]
+
+    # Configure MLFlow
+    mlflow.set_tracking_uri(config["mlflow_tracking_uri"])
+    mlflow.set_experiment(config["mlflow_experiment"])
+
+    # Start MLFlow Tracking
+    with mlflow.start_run():
+
+        # Ingest the data
+        X_train, X_test, y_train, y_test, X_holdout = ingest_split(
+            train_test_raw_path=config["train_test_raw_path"],
+            holdout_raw_path=config["holdout_raw_path"],
+            target=parameters["target"],
+            ingest_split_parameters=parameters["ingest_split_parameters"]
+        )
+
+        # Fit the pipeline on the training data
+        preprocessing_pipeline = create_preprocessing_pipeline(
+            pipeline_parameters=parameters["pipeline_parameters"]
+        )
+        preprocessing_pipeline.fit(X_train)
+
+        # Run the function
+        X_batch = preprocessing_pipeline.transform(X_holdout)
+        record = X_holdout.iloc[0]
+        X_single = preprocessing_pipeline.transform(record)
+
+        # Run the tests
+        assert X_single.shape == (1, X_batch.shape[1])
+        assert_series_equal(
+            X_single.iloc[0],
+            X_batch.loc[record[uid]],
+            check_names=False
+        )
+
+        mlflow.end_run()
+
+
+def test_preprocessing_pipeline_inplace():
+    """
+    Test that the inplace preprocessing_pipeline produces the same features as
+    the default pipeline without modifying the data passed to it
+    """
+
+    # Load in the test configuration & parameters
+    config = load_config(".env.test")
+    parameters = load_parameters(parameters_path=config["parameters_path"])
+
+    # Configure MLFlow
+    mlflow.set_tracking_uri(config["mlflow_tracking_uri"])
+    mlflow.set_experiment(config["mlflow_experiment"])
+
+    # Start MLFlow Tracking
+    with mlflow.start_run():
+
+        # Ingest the data
+        X_train, X_test, y_train, y_test, X_holdout = ingest_split(
+            train_test_raw_path=config["train_test_raw_path"],
+            holdout_raw_path=config["holdout_raw_path"],
+            target=parameters["target"],
+            ingest_split_parameters=parameters["ingest_split_parameters"]
+        )
+        X_train_raw = X_train.copy()
+        X_test_raw = X_test.copy()
+
+        # Run the function
+        preprocessing_pipeline = create_preprocessing_pipeline(
+            pipeline_parameters=parameters["pipeline_parameters"]
+        )
+        inplace_pipeline = create_preprocessing_pipeline(
+            pipeline_parameters=parameters["pipeline_parameters"],
+            inplace=True
+        )
+        X_train_out = preprocessing_pipeline.fit_transform(X_train)
+        X_test_out = preprocessing_pipeline.transform(X_test)
+        X_train_inplace = inplace_pipeline.fit_transform(X_train)
+        X_test_inplace = inplace_pipeline.transform(X_test)
+
+        # Run the tests
+        assert_frame_equal(X_train_inplace, X_train_out)
+        assert_frame_equal(X_test_inplace, X_test_out)
+        assert_frame_equal(X_train, X_train_raw)
+        assert_frame_equal(X_test, X_test_raw)
+
+        mlflow.end_run()
@@ -0,0 +1,47 @@
+import pandas as pd
+from src.utils import (
+    load_config,
+    load_parameters
+)
+from src.ingest_split import (
+    read_raw_csv,
+    memory_usage_report
+)
+
+
+def test_read_raw_csv():
+    """Test the read_raw_csv & memory_usage_report functions"""
+
+    # Load in the test configuration & parameters
+    config = load_config(".env.test")
+    parameters = load_parameters(parameters_path=config["parameters_path"])
+    dtypes = parameters["ingest_split_parameters"]["dtypes"]
+
+    # Run the function with each engine, the holdout data has no target
+    for engine in ["c", "pyarrow"]:
+        df = read_raw_csv(
+            config["holdout_raw_path"],
+            dtypes=dtypes,
+            engine=engine
+        )
+
+        # Run the tests
+        assert parameters["target"] not in df.columns
+        assert df["Sex"].dtype == "category"
+        assert df["Pclass"].dtype == "Int8"
+        assert df["Age"].dtype == "float32"
+        assert df["Name"].dtype == "string"
+
+    # Values are unchanged by the schema
+    df_inferred = pd.read_csv(config["holdout_raw_path"])
+    pd.testing.assert_frame_equal(
+        df.astype(df_inferred.dtypes.to_dict()),
+        df_inferred
+    )
+
+    report = memory_usage_report(df_before=df_inferred, df_after=df)
+
+    assert report.index.tolist() == df.columns.tolist() + ["Total"]
+    assert (
+        report.loc["Total", "mb_after"] < report.loc["Total", "mb_before"]
+    )
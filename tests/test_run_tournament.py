@@ -0,0 +1,81 @@
+import mlflow
+import sklearn
+from src.utils import (
+    load_config,
+    load_parameters,
+)
+from src.ingest_split import ingest_split
+from src.preprocessing_pipeline import create_preprocessing_pipeline
+from src.model_pipeline import run_tournament
+from src.tracking import start_run
+
+
+def test_run_tournament():
+    """Test the run_tournament function"""
+
+    # Load in the test configuration & parameters
+    config = load_config(".env.test")
+    parameters = load_parameters(parameters_path=config["parameters_path"])
+
+    # Configure MLFlow
+    mlflow.set_tracking_uri(config["mlflow_tracking_uri"])
+    mlflow.set_experiment(config["mlflow_experiment"])
+
+    # Start MLFlow Tracking
+    with start_run() as run:
+
+        # Ingest & preprocess the data
+        X_train, X_test, y_train, y_test, X_holdout = ingest_split(
+            train_test_raw_path=config["train_test_raw_path"],
+            holdout_raw_path=config["holdout_raw_path"],
+            target=parameters["target"],
+            ingest_split_parameters=parameters["ingest_split_parameters"]
+        )
+        preprocessing_pipeline = create_preprocessing_pipeline(
+            pipeline_parameters=parameters["pipeline_parameters"]
+        )
+        X_train_features = preprocessing_pipeline.fit_transform(X_train)
+        X_test_features = preprocessing_pipeline.transform(X_test)
+
+        # Run the function
+        hyperparameters = {
+            model_family: dict(
+                parameters[f"{model_family}_hyperparameters"],
+                cv=2
+            )
+            for model_family in ["logreg", "svc", "sgd"]
+        }
+        model_family, model, model_name, cv = run_tournament(
+            hyperparameters=hyperparameters,
+            X_train_features=X_train_features,
+            y_train=y_train,
+            X_test_features=X_test_features,
+            y_test=y_test,
+            metric="test_score",
+            n_jobs=2
+        )
+
+    # Run the tests
+    entrants = mlflow.search_runs(
+        filter_string=f"tags.mlflow.parentRunId = '{run.info.run_id}'"
+    )
+    parent_run = mlflow.get_run(run.info.run_id)
+    scores = {
+        family: parent_run.data.metrics[f"{family}_test_score"]
+        for family in hyperparameters
+    }
+
+    # Each model is a nested run with its hyperparameters & metrics
+    assert sorted(entrants["tags.model_family"]) == ["logreg", "sgd", "svc"]
+    assert entrants["params.model_name"].notna().all()
+    assert entrants["metrics.train_cv_score"].notna().all()
+    assert sorted(entrants["metrics.test_score"]) == sorted(scores.values())
+
+    # The best model is returned unfitted & recorded in the parent run
+    assert scores[model_family] == max(scores.values())
+    assert parent_run.data.params["tournament_winner"] == model_family
+    assert parent_run.data.params["model_name"] == model_name
+    assert model_name == hyperparameters[model_family]["model_name"]
+    assert cv == 2
+    assert isinstance(model, sklearn.base.BaseEstimator)
+    assert not hasattr(model, "n_features_in_")
@@ -0,0 +1,127 @@
+import pandas as pd
+import pytest
+from pandas.testing import assert_frame_equal
+from sklearn.pipeline import Pipeline
+from sklearn.preprocessing import FunctionTransformer
+from src.preprocessing_pipeline import InstrumentedStep
+from src.serving import score_file
+
+
+class DummyModel:
+    """Predicts 1 for passengers in first class and 0 otherwise"""
+
+    def predict(self, df):
+        return (df["Pclass"] == 1).astype(int).values
+
+    def fit(self, X, y=None):
+        return self
+
+
+def test_score_file(tmp_path):
+    """Test the score_file function"""
+
+    input_path = "./titanic-files/dummy-data/holdout_raw.csv"
+    df = pd.read_csv(input_path)
+    expected = pd.DataFrame(dict(
+        PassengerId=df["PassengerId"],
+        Survived=DummyModel().predict(df)
+    ))
+
+    # Run the function with chunks which don't divide the file evenly
+    results = score_file(
+        model_pipeline=DummyModel(),
+        input_path=input_path,
+        output_path=str(tmp_path / "predictions.csv"),
+        uid="PassengerId",
+        prediction_column="Survived",
+        chunk_size=10
+    )
+
+    # Run the tests
+    assert results["records"] == len(df)
+    assert results["records_per_second"] > 0
+    assert results["step_records"] == []
+    assert_frame_equal(pd.read_csv(tmp_path / "predictions.csv"), expected)
+
+    # Parquet output
+    pytest.importorskip("pyarrow")
+    score_file(
+        model_pipeline=DummyModel(),
+        input_path=input_path,
+        output_path=str(tmp_path / "predictions.parquet"),
+        uid="PassengerId",
+        prediction_column="Survived",
+        chunk_size=10
+    )
+    assert_frame_equal(
+        pd.read_parquet(tmp_path / "predictions.parquet"),
+        expected
+    )
+
+    # Unsupported output format
+    with pytest.raises(ValueError):
+        score_file(
+            model_pipeline=DummyModel(),
+            input_path=input_path,
+            output_path=str(tmp_path / "predictions.json"),
+            uid="PassengerId",
+            prediction_column="Survived",
+            chunk_size=10
+        )
+
+    # The chunks are read with the dtype schema the model was trained with
+    dtypes = {}
+
+    class DtypesModel(DummyModel):
+        """Records the dtypes of each chunk"""
+
+        def predict(self, df):
+            dtypes.update({
+                column: {*dtypes.get(column, set()), str(dtype)}
+                for column, dtype in df.dtypes.items()
+            })
+            return super().predict(df)
+
+    score_file(
+        model_pipeline=DtypesModel(),
+        input_path=input_path,
+        output_path=str(tmp_path / "typed_predictions.csv"),
+        uid="PassengerId",
+        prediction_column="Survived",
+        chunk_size=10,
+        dtypes=dict(Age="float32", Fare="float32", Sex="category")
+    )
+    assert dtypes["Age"] == {"float32"}
+    assert dtypes["Fare"] == {"float32"}
+    assert dtypes["Sex"] == {"category"}
+    assert_frame_equal(
+        pd.read_csv(tmp_path / "typed_predictions.csv"),
+        expected
+    )
+
+    # The records of each call to the instrumented steps are returned
+    model_pipeline = Pipeline([
+        ("Identity", InstrumentedStep(
+            name="Identity",
+            step=FunctionTransformer()
+        )),
+        ("Model", DummyModel())
+    ])
+    results = score_file(
+        model_pipeline=model_pipeline,
+        input_path=input_path,
+        output_path=str(tmp_path / "instrumented_predictions.csv"),
+        uid="PassengerId",
+        prediction_column="Survived",
+        chunk_size=10
+    )
+    assert [record["step"] for record in results["step_records"]] == (
+        ["Identity"] * -(-len(df) // 10)
+    )
+    assert sum(
+        record["rows_in"] for record in results["step_records"]
+    ) == len(df)
+    assert_frame_equal(
+        pd.read_csv(tmp_path / "instrumented_predictions.csv"),
+        expected
+    )
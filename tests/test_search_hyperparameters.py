@@ -0,0 +1,76 @@
+import mlflow
+import pytest
+from sklearn.linear_model import LogisticRegression
+from src.utils import (
+    load_config,
+    load_logger,
+    load_parameters,
+)
+from src.ingest_split import ingest_split
+from src.preprocessing_pipeline import create_preprocessing_pipeline
+from src.model_pipeline import search_hyperparameters
+from src.tracking import start_run
+
+
+@pytest.mark.parametrize("search_type, search_space, n_trials", [
+    ("grid", dict(C=[0.1, 1.0, 10.0]), 3),
+    ("random", dict(C=dict(distribution="loguniform", low=0.1, high=10)), 4),
+    ("halving", dict(C=[0.01, 0.1, 1.0, 10.0]), 6),
+])
+def test_search_hyperparameters(search_type, search_space, n_trials):
+    """Test the search_hyperparameters function"""
+
+    # Load in the test configuration & parameters
+    config = load_config(".env.test")
+    logger = load_logger(
+        app_name=config["app_name"],
+        logs_path=config["logs_path"]
+    )
+    parameters = load_parameters(parameters_path=config["parameters_path"])
+
+    # Configure MLFlow
+    mlflow.set_tracking_uri(config["mlflow_tracking_uri"])
+    mlflow.set_experiment(config["mlflow_experiment"])
+
+    # Start MLFlow Tracking
+    with start_run() as run:
+
+        # Ingest the data
+        X_train, X_test, y_train, y_test, X_holdout = ingest_split(
+            train_test_raw_path=config["train_test_raw_path"],
+            holdout_raw_path=config["holdout_raw_path"],
+            target=parameters["target"],
+            ingest_split_parameters=parameters["ingest_split_parameters"]
+        )
+
+        # Run the function
+        model = search_hyperparameters(
+            preprocessing_pipeline=create_preprocessing_pipeline(
+                pipeline_parameters=parameters["pipeline_parameters"]
+            ),
+            model=LogisticRegression(C=0.5),
+            model_name="logreg_test",
+            X_train=X_train,
+            y_train=y_train,
+            search_space=search_space,
+            search_parameters=dict(
+                search_type=search_type,
+                scoring="accuracy",
+                n_iter=4,
+                factor=2,
+                random_state=43
+            ),
+            cv=2
+        )
+
+    # Run the tests
+    trials = mlflow.search_runs(
+        filter_string=f"tags.mlflow.parentRunId = '{run.info.run_id}'"
+    )
+    parent_run = mlflow.get_run(run.info.run_id)
+
+    assert isinstance(model, LogisticRegression)
+    assert not hasattr(model, "coef_")
+    assert len(trials) == n_trials
+    assert model.C == float(parent_run.data.params["best_C"])
+    assert "best_cv_score" in parent_run.data.metrics
@@ -0,0 +1,72 @@
+import pandas as pd
+from src.utils import (
+    load_config,
+    load_parameters
+)
+from src.preprocessing_pipeline import create_preprocessing_pipeline
+from src.synthetic_data import SyntheticDataGenerator
+
+
+def test_synthetic_data_generator(tmp_path):
+    """Test the SyntheticDataGenerator class"""
+
+    # Load in the test configuration & parameters
+    config = load_config(".env.test")
+    parameters = load_parameters(parameters_path=config["parameters_path"])
+    uid = parameters["uid"]
+    target = parameters["target"]
+    df = pd.read_csv("./titanic-files/dev-data/train_test_raw.csv")
+
+    # Run the class
+    generator = SyntheticDataGenerator(
+        uid=uid,
+        target=target,
+        random_state=43
+    ).fit(df)
+    df_out = generator.sample(n_records=20000, start_id=101)
+
+    # Run the tests
+    assert df_out.columns.tolist() == df.columns.tolist()
+    assert df_out[uid].tolist() == list(range(101, 20101))
+
+    # The generated data has the distributions of the raw data
+    for column in ["Age", "Cabin", "Embarked"]:
+        assert abs(
+            df_out[column].isnull().mean() - df[column].isnull().mean()
+        ) < 0.02
+    assert abs(df_out[target].mean() - df[target].mean()) < 0.02
+    assert set(df_out["Sex"]) == set(df["Sex"])
+    assert set(df_out["Fare"]) <= set(df["Fare"])
+    titles = df_out["Name"].str.extract(r' ([A-Za-z]+)\.', expand=False)
+    assert titles.notnull().all()
+    assert set(titles) <= set(
+        df["Name"].str.extract(r' ([A-Za-z]+)\.', expand=False)
+    )
+
+    # The generated data can be processed by the preprocessing pipeline
+    X_features = create_preprocessing_pipeline(
+        pipeline_parameters=parameters["pipeline_parameters"]
+    ).fit_transform(df_out.drop(target, axis=1))
+
+    assert len(X_features) == len(df_out)
+    assert X_features.notnull().all().all()
+
+    # Files are written in chunks with consecutive ids & without the target
+    path = str(tmp_path / "holdout_raw.csv")
+    results = generator.write_csv(
+        path=path,
+        n_records=2500,
+        chunk_size=1000,
+        include_target=False
+    )
+    df_written = pd.read_csv(path)
+
+    assert results["records"] == 2500
+    assert target not in df_written.columns
+    assert df_written[uid].tolist() == list(range(1, 2501))
+
+    # Generators with the same random_state generate the same data
+    pd.testing.assert_frame_equal(
+        SyntheticDataGenerator(random_state=1).fit(df).sample(100),
+        SyntheticDataGenerator(random_state=1).fit(df).sample(100)
+    )
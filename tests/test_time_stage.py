@@ -0,0 +1,21 @@
+import time
+import pytest
+from src.utils import time_stage
+
+
+def test_time_stage():
+    """Test the time_stage function"""
+
+    timings = dict()
+
+    # Run the function
+    with time_stage("sleep", timings):
+        time.sleep(0.01)
+
+    with pytest.raises(ValueError):
+        with time_stage("error", timings):
+            raise ValueError()
+
+    # Run the tests
+    assert timings["sleep"] >= 0.01
+    assert "error" in timings
@@ -0,0 +1,159 @@
+import pytest
+import pandas as pd
+from pandas.testing import assert_frame_equal
+from src.utils import (
+    load_config,
+    load_parameters,
+)
+from src.preprocessing_pipeline import (
+    TRANSFORMS,
+    create_preprocessing_pipeline,
+    register_transform,
+    register_implementation,
+    get_transform,
+    get_implementation,
+    find_transform,
+    create_family_size,
+    create_family_size_vectorized,
+    ColumnScaler
+)
+from src.serving.compiled_model import _compile_function_step
+
+
+def test_transform_registry():
+    """Test the registry of the transforms of the preprocessing pipeline"""
+
+    # Load in the test configuration & parameters
+    config = load_config(".env.test")
+    parameters = load_parameters(parameters_path=config["parameters_path"])
+    pipeline_parameters = parameters["pipeline_parameters"]
+
+    df = pd.read_csv(config["holdout_raw_path"])
+
+    # Run the function
+    default_pipeline = create_preprocessing_pipeline(
+        pipeline_parameters={
+            key: value for key, value in pipeline_parameters.items()
+            if key not in ["steps", "engine"]
+        }
+    )
+    pipeline = create_preprocessing_pipeline(
+        pipeline_parameters=pipeline_parameters
+    )
+    mixed_pipeline = create_preprocessing_pipeline(
+        pipeline_parameters=dict(
+            pipeline_parameters,
+            steps=[
+                dict(transform=step, engine="rowwise")
+                if step == "create_family_size" else step
+                for step in pipeline_parameters["steps"]
+            ]
+        )
+    )
+    short_pipeline = create_preprocessing_pipeline(
+        pipeline_parameters=dict(
+            pipeline_parameters,
+            steps=["set_df_index", "create_family_size"]
+        ),
+        engine="rowwise"
+    )
+
+    # Run the tests
+    # The configured steps match the default steps & order
+    assert [name for name, _ in pipeline.steps] == [
+        name for name, _ in default_pipeline.steps
+    ]
+    assert [name for name, _ in pipeline.steps] == [
+        TRANSFORMS[step]["description"]
+        for step in pipeline_parameters["steps"]
+    ]
+    assert isinstance(pipeline.steps[7][1], ColumnScaler)
+
+    # Each step can use its own engine & produces the same features
+    family_size = dict(mixed_pipeline.steps)["Create family_size column"]
+    assert family_size.func is create_family_size
+    assert_frame_equal(
+        pipeline.fit_transform(df),
+        mixed_pipeline.fit_transform(df)
+    )
+
+    # The steps & their order are configurable
+    assert short_pipeline.steps[1][1].func is create_family_size
+    assert "FamilySize" in short_pipeline.fit_transform(df)
+
+    # A transform can be used twice, with a name or the step number
+    twice_pipeline = create_preprocessing_pipeline(
+        pipeline_parameters=dict(
+            pipeline_parameters,
+            steps=pipeline_parameters["steps"] + [
+                dict(transform="drop_columns", kw_args="drop_c_kw_args"),
+                dict(
+                    transform="drop_columns",
+                    kw_args="drop_q_kw_args",
+                    name="Drop Embarked_Q"
+                )
+            ],
+            drop_c_kw_args=dict(drop_column_names=["Embarked_C"]),
+            drop_q_kw_args=dict(drop_column_names=["Embarked_Q"])
+        )
+    )
+    assert [name for name, _ in twice_pipeline.steps[-3:]] == [
+        "One hot encode categorical data",
+        "Drop columns 10",
+        "Drop Embarked_Q"
+    ]
+    assert_frame_equal(
+        twice_pipeline.fit_transform(df),
+        pipeline.fit_transform(df).drop(["Embarked_C", "Embarked_Q"], axis=1)
+    )
+
+    # Implementations fall back to the vectorized engine
+    assert get_implementation("scaler", engine="rowwise") is ColumnScaler
+    assert get_implementation(
+        "create_family_size",
+        engine="vectorized"
+    ) is create_family_size_vectorized
+    with pytest.raises(ValueError):
+        get_implementation("scaler", engine="missing")
+    with pytest.raises(ValueError):
+        get_transform("missing")
+    with pytest.raises(ValueError):
+        register_transform(
+            name="missing",
+            description="Missing",
+            kw_args="missing_kw_args",
+            implementations=dict(rowwise=create_family_size)
+        )
+
+    # Registered implementations are found & compiled
+    assert find_transform(create_family_size) == "create_family_size"
+    assert find_transform(len) is None
+
+    def create_family_size_sum(df, source_columns, dest_column, inplace):
+        df_out = df if inplace else df.copy()
+        df_out[dest_column] = df_out[source_columns].sum(axis=1) + 1
+        return df_out
+
+    register_implementation(
+        name="create_family_size",
+        engine="sum",
+        implementation=create_family_size_sum
+    )
+    try:
+        sum_pipeline = create_preprocessing_pipeline(
+            pipeline_parameters=pipeline_parameters,
+            engine="sum"
+        )
+        step = dict(sum_pipeline.steps)["Create family_size column"]
+        assert step.func is create_family_size_sum
+        assert _compile_function_step(step.func, step.kw_args) == dict(
+            op="sum_columns",
+            source_columns=["SibSp", "Parch"],
+            dest_column="FamilySize"
+        )
+
+    finally:
+        del TRANSFORMS["create_family_size"]["implementations"]["sum"]
+
+    with pytest.raises(ValueError):
+        _compile_function_step(func=len, kw_args=dict())
@@ -0,0 +1,159 @@
+import pandas as pd
+import numpy as np
+from pandas.testing import (
+    assert_frame_equal,
+    assert_series_equal
+)
+from src.utils import (
+    load_config,
+    load_parameters,
+)
+from src.preprocessing_pipeline import (
+    create_preprocessing_pipeline,
+    create_title_cat,
+    impute_age,
+    create_family_size,
+    create_title_cat_vectorized,
+    impute_age_vectorized,
+    create_family_size_vectorized
+)
+
+
+def test_create_title_cat_parity():
+    """Test create_title_cat_vectorized matches create_title_cat"""
+
+    # Load in the test configuration & parameters
+    config = load_config(".env.test")
+    parameters = load_parameters(parameters_path=config["parameters_path"])
+    kw_args = parameters["pipeline_parameters"]["create_title_cat_kw_args"]
+
+    # Include unknown titles and names without a title
+    data = [
+        dict(id=1, Name="Tyrell, Ms. Olenna"),
+        dict(id=2, Name="Baratheon, Master. Joffrey"),
+        dict(id=3, Name="Lannister, Major. Tyrion"),
+        dict(id=4, Name="Targaeryn, Khaleesi. Danaerys"),
+        dict(id=5, Name="Snow, Jon"),
+        dict(id=6, Name="Stark, Mrs. Catelyn (Tully, Miss. Catelyn)"),
+        dict(id=7, Name="Hodor"),
+        dict(id=8, Name=None),
+        dict(id=9, Name="Tyrell, Ms. Olenna"),
+    ]
+    df = pd.DataFrame(data).set_index("id", drop=True)
+
+    # Run the functions
+    df_rowwise = create_title_cat(df=df, **kw_args)
+    df_vectorized = create_title_cat_vectorized(df=df, **kw_args)
+
+    # Run the tests
+    assert_frame_equal(df_rowwise, df_vectorized)
+    assert df_vectorized["TitleCategory"].loc[4] == "other"
+    assert df_vectorized["TitleCategory"].loc[5] == "other"
+    assert df_vectorized["TitleCategory"].loc[8] == "other"
+    assert df_vectorized["TitleCategory"].loc[9] == "gen_female"
+    assert df_vectorized["TitleCategory"].dtype == "category"
+
+
+def test_impute_age_parity():
+    """Test impute_age_vectorized matches impute_age"""
+
+    # Load in the test configuration & parameters
+    config = load_config(".env.test")
+    parameters = load_parameters(parameters_path=config["parameters_path"])
+    age_codes = (
+        parameters["pipeline_parameters"]["impute_age_kw_args"]
+        ["age_codes"]
+    )
+
+    # Include missing values & non-integer ages
+    data = [
+        dict(id=1, col1="gen_male", col2=np.nan),
+        dict(id=2, col1="gen_female", col2=None),
+        dict(id=3, col1="young_female", col2=0.42),
+        dict(id=4, col1="young_male", col2=None),
+        dict(id=5, col1="other_male", col2=70.5),
+        dict(id=6, col1="other_female", col2=None),
+        dict(id=7, col1="gen_male", col2=12),
+    ]
+    df = pd.DataFrame(data).set_index("id", drop=True)
+
+    # Run the functions
+    df_rowwise = impute_age(
+        df=df,
+        source_column="col2",
+        title_cat_column="col1",
+        age_codes=age_codes
+    )
+    df_vectorized = impute_age_vectorized(
+        df=df,
+        source_column="col2",
+        title_cat_column="col1",
+        age_codes=age_codes
+    )
+
+    # Run the tests
+    assert_frame_equal(df_rowwise, df_vectorized)
+
+
+def test_create_family_size_parity():
+    """Test create_family_size_vectorized matches create_family_size"""
+
+    # Create dummy data
+    data = [
+        dict(id=1, col1=1, col2=0),
+        dict(id=2, col1=3, col2=1),
+        dict(id=3, col1=0, col2=2),
+        dict(id=4, col1=8, col2=6),
+        dict(id=5, col1=0, col2=0),
+    ]
+    df = pd.DataFrame(data).set_index("id", drop=True)
+
+    # Run the functions
+    df_rowwise = create_family_size(
+        df=df,
+        source_columns=["col1", "col2"],
+        dest_column="col3"
+    )
+    df_vectorized = create_family_size_vectorized(
+        df=df,
+        source_columns=["col1", "col2"],
+        dest_column="col3"
+    )
+
+    # Run the tests
+    assert_frame_equal(df_rowwise, df_vectorized)
+
+
+def test_preprocessing_pipeline_parity():
+    """
+    Test the vectorized engine produces the same features as the rowwise
+    engine for both a batch and a single record.
+    """
+
+    # Load in the test configuration & parameters
+    config = load_config(".env.test")
+    parameters = load_parameters(parameters_path=config["parameters_path"])
+
+    df = pd.read_csv(config["holdout_raw_path"])
+
+    rowwise_pipeline = create_preprocessing_pipeline(
+        pipeline_parameters=parameters["pipeline_parameters"],
+        engine="rowwise"
+    )
+    vectorized_pipeline = create_preprocessing_pipeline(
+        pipeline_parameters=parameters["pipeline_parameters"],
+        engine="vectorized"
+    )
+
+    # Batch
+    assert_frame_equal(
+        rowwise_pipeline.fit_transform(df),
+        vectorized_pipeline.fit_transform(df)
+    )
+
+    # Single record, passed as a series
+    record = df.iloc[0]
+    assert_series_equal(
+        rowwise_pipeline.fit_transform(record).iloc[0],
+        vectorized_pipeline.fit_transform(record).iloc[0]
+    )